@@ -26,6 +26,7 @@
 
 import sys
 import platform
+import multiprocessing
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui     import QIcon
@@ -55,6 +56,9 @@ def loadQSS(app, myConfig):
 ############################################################################################### __main__ ######
 if __name__ == "__main__":
 
+    #  Needed by the ephemeris background processes, when running as a frozen binary.
+    multiprocessing.freeze_support()
+
     #  Print out any deprecation warnings for functions used in your code
     import warnings
     warnings.simplefilter("default", DeprecationWarning)
@@ -65,6 +69,9 @@ if __name__ == "__main__":
 
     myConfig  = Config.Config(CONFIG_PATH, myLogger)  # Create the config.
 
+    if myConfig.LOG_JSON:                             # Add the JSON lines log, if wanted.
+        Logger.add_json_handler(myLogger, str(LOGGER_PATH))
+
     myLogger.info(f" Running {myConfig.NAME} Version {myConfig.VERSION} ")
     myLogger.debug(f" {platform.uname()}")
     myLogger.debug(f" Python Version {platform.python_version()}  QT Version {PYQT_VERSION_STR}")
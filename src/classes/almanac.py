@@ -0,0 +1,200 @@
+###############################################################################################################
+#    almanac.py   Copyright (C) <2026>  <Kevin Scott>                                                         #
+#                                                                                                             #
+#    Sunrise, sunset, twilight, day length and moon phase for the configured location.                        #
+#                                                                                                             #
+#    import src.classes.almanac as alm                                                                        #
+#                                                                                                             #
+#    almanac = alm.getAlmanac(myConfig)                                                                       #
+#                                                                                                             #
+#    almanac.day(date)               A Day for the date, worked out once and cached.                          #
+#    almanac.year(year)              A list of Day for every day of the year, worked out in one go.           #
+#    almanac.nextSunEvent(seconds)   The next sunrise or sunset after time.time() seconds - [name, seconds].  #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import math
+import datetime
+
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+from pymeeus.Epoch import Epoch
+from pymeeus.Moon import Moon
+
+MAX_DAYS  = 8               #  The number of days held in the day cache.
+J2000     = 2451545.0       #  Julian day of 1st January 2000 at noon.
+UNIX      = 2440587.5       #  Julian day of 1st January 1970 at midnight.
+SYNODIC   = 29.530588853    #  Mean length of a lunar month, days.
+NEW_MOON  = 2451550.1       #  Julian day of a known new moon, 6th January 2000.
+OBLIQUITY = math.radians(23.4397)
+
+#  Altitude of the sun's centre at each event, degrees - sunrise allows for refraction and the sun's radius.
+ALTITUDES = {"sun"         : -0.833,
+             "civil"       : -6.0,
+             "nautical"    : -12.0,
+             "astronomical": -18.0}
+
+PHASES = ["New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+          "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"]
+
+#  Times are time.time() seconds, a rise or set is None if it does not happen that day [polar day or night].
+#  dawn and dusk are dictionaries - [civil | nautical | astronomical, seconds].
+Day = namedtuple("Day", ["date", "sunrise", "sunset", "noon", "dawn", "dusk", "dayLength", "moonPhase", "moonLit"])
+
+
+class Almanac():
+    """  Sunrise, sunset, twilight, day length and moon phase for the configured location.
+
+         The sun is worked out with the sunrise equation, the same as pymeeus Epoch.rise_set(),
+         but for each twilight altitude and without the polar circle limit.  It is quick enough that a
+         whole year is worked out in one go, for the year table.  The moon's lit fraction is from pymeeus,
+         its phase from the mean lunar month.
+
+         Days are worked out once and held in a small cache, so the klock can count down to the next
+         sunrise or sunset each minute without working out the sun again.  The caches are cleared if the
+         location is changed.
+    """
+    def __init__(self, myConfig):
+        self.myConfig = myConfig
+        self.location = None                #  [latitude, longitude] the caches were made for.
+        self.days     = OrderedDict()       #  [date, Day].
+        self.years    = {}                  #  [year, list of Day].
+# ------------------------------------------------------------------------------------- checkLocation -----------------
+    def checkLocation(self):
+        """  Clear the caches if the configured location has changed.
+        """
+        location = [self.myConfig.LOCATION_LATITUDE, self.myConfig.LOCATION_LONGITUDE]
+
+        if location != self.location:
+            self.location = location
+            self.days.clear()
+            self.years.clear()
+# ------------------------------------------------------------------------------------- day ---------------------------
+    def day(self, date):
+        """  Returns a Day for the date, worked out once and cached.
+        """
+        self.checkLocation()
+
+        day = self.days.get(date)
+
+        if day is None:
+            day = workOutDay(date, *self.location)
+            self.days[date] = day
+            while len(self.days) > MAX_DAYS:
+                self.days.popitem(last=False)
+
+        return day
+# ------------------------------------------------------------------------------------- year --------------------------
+    def year(self, year):
+        """  Returns a list of Day for every day of the year, worked out in one go and cached.
+        """
+        self.checkLocation()
+
+        days = self.years.get(year)
+
+        if days is None:
+            date = datetime.date(year, 1, 1)
+            days = []
+            while date.year == year:
+                days.append(workOutDay(date, *self.location))
+                date += datetime.timedelta(days=1)
+            self.years = {year: days}           #  Only the last year is held.
+
+        return days
+# ------------------------------------------------------------------------------------- nextSunEvent ------------------
+    def nextSunEvent(self, seconds):
+        """  Returns the next sunrise or sunset after time.time() seconds, as [name, seconds].
+             Returns None if there is neither in the next few days [polar day or night].
+        """
+        date = datetime.date.fromtimestamp(seconds)
+
+        for ahead in range(3):
+            day = self.day(date + datetime.timedelta(days=ahead))
+            for name, when in (("Sunrise", day.sunrise), ("Sunset", day.sunset)):
+                if when is not None and when > seconds:
+                    return [name, when]
+
+        return None
+
+# ------------------------------------------------------------------------------------- workOutDay --------------------
+def workOutDay(date, latitude, longitude):
+    """  Returns a Day for the date at latitude and longitude, degrees north and east.
+
+         Uses the sunrise equation - https://en.wikipedia.org/wiki/Sunrise_equation
+    """
+    n        = date.toordinal() - datetime.date(2000, 1, 1).toordinal()
+    jStar    = n - longitude / 360.0
+    anomaly  = math.radians((357.5291 + 0.98560028 * jStar) % 360.0)
+    centre   = 1.9148 * math.sin(anomaly) + 0.0200 * math.sin(2 * anomaly) + 0.0003 * math.sin(3 * anomaly)
+    ecliptic = math.radians((math.degrees(anomaly) + centre + 180.0 + 102.9372) % 360.0)
+    transit  = J2000 + jStar + 0.0053 * math.sin(anomaly) - 0.0069 * math.sin(2 * ecliptic)
+    sinDecl  = math.sin(ecliptic) * math.sin(OBLIQUITY)
+    cosDecl  = math.cos(math.asin(sinDecl))
+    phi      = math.radians(latitude)
+
+    times = {}
+    for name, altitude in ALTITUDES.items():
+        cosHour = (math.sin(math.radians(altitude)) - math.sin(phi) * sinDecl) / (math.cos(phi) * cosDecl)
+        if -1.0 <= cosHour <= 1.0:
+            hour        = math.degrees(math.acos(cosHour)) / 360.0
+            times[name] = [toSeconds(transit - hour), toSeconds(transit + hour)]
+        else:
+            times[name] = [None, None]
+
+    sunrise, sunset = times.pop("sun")
+
+    if sunrise is not None:
+        dayLength = sunset - sunrise
+    else:                                   #  Sun up all day if it is above the horizon at noon.
+        noonAltitude = 90.0 - abs(latitude - math.degrees(math.asin(sinDecl)))
+        dayLength    = 86400.0 if noonAltitude > 0 else 0.0
+
+    moonPhase, moonLit = workOutMoon(transit)
+
+    return Day(date, sunrise, sunset, toSeconds(transit),
+               {name: rise for name, (rise, _set) in times.items()},
+               {name: set_ for name, (_rise, set_) in times.items()},
+               dayLength, moonPhase, moonLit)
+# ------------------------------------------------------------------------------------- workOutMoon -------------------
+def workOutMoon(julianDay):
+    """  Returns the name of the moon's phase and its lit fraction, at the Julian day.
+    """
+    age   = ((julianDay - NEW_MOON) / SYNODIC) % 1.0
+    phase = PHASES[int(age * len(PHASES) + 0.5) % len(PHASES)]
+    lit   = Moon.illuminated_fraction_disk(Epoch(julianDay))
+
+    return phase, lit
+# ------------------------------------------------------------------------------------- toSeconds ---------------------
+def toSeconds(julianDay):
+    """  Returns a Julian day as time.time() seconds.
+    """
+    return (julianDay - UNIX) * 86400.0
+# ------------------------------------------------------------------------------------- formatLength ------------------
+def formatLength(seconds):
+    """  Returns a length of time in seconds as hours and minutes, i.e. 7h 52m.
+    """
+    hours, minutes = divmod(int(seconds + 30) // 60, 60)
+
+    return f"{hours}h {minutes:02d}m"
+# ------------------------------------------------------------------------------------- getAlmanac --------------------
+@lru_cache(maxsize=None)
+def getAlmanac(myConfig):
+    """  Returns the almanac, there is only one - so the caches are shared.
+    """
+    return Almanac(myConfig)
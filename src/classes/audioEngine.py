@@ -0,0 +1,417 @@
+###############################################################################################################
+#    audioEngine.py   Copyright (C) <2026>  <Kevin Scott>                                                     #
+#                                                                                                             #
+#    A sound engine that plays decoded sounds from memory, on its own thread.                                 #
+#                                                                                                             #
+#    import src.classes.audioEngine as ae                                                                     #
+#                                                                                                             #
+#    engine = ae.getAudioEngine(myLogger)                                                                     #
+#                                                                                                             #
+#    engine.preload(paths)           Decode the sound files into memory, ready to be played.                  #
+#    id = engine.play(path, volume, policy)                                                                   #
+#                                    Play a sound file, decoding it first if not already in memory.           #
+#                                    policy is ae.REPLACE, ae.QUEUE or ae.MIX - see AudioWorker.              #
+#    id = engine.schedule(path, volume, deadline)                                                             #
+#                                    Play a sound file at a time.monotonic_ns() deadline.                     #
+#    engine.cancel(id)               Stop, or un-queue, the sound.                                            #
+#    engine.stop()                   Stop all sounds.                                                         #
+#    engine.close()                  Stop the sound thread, called when pyKlock closes.                       #
+#                                                                                                             #
+#    engine.started(id)              Signal - a sound has started playing.                                    #
+#    engine.finished(id, completed)  Signal - a sound has ended, completed is False if cancelled or failed.   #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import time
+import itertools
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from PyQt6.QtCore         import Qt, QObject, QThread, QTimer, QBuffer, QByteArray, QIODevice, QEventLoop, QUrl, pyqtSignal, pyqtSlot
+from PyQt6.QtMultimedia   import QAudio, QAudioDecoder, QAudioFormat, QAudioSink
+
+MAX_CACHE_BYTES = 64 * 1024 * 1024      #  Decoded sounds are big, a Westminster hour chime is about 12MB.
+SPIN_NS         = 20_000_000            #  The scheduled timer fires this early, the rest is spun out to the deadline.
+
+REPLACE = "replace"                     #  Stop any sounds playing, then play.
+QUEUE   = "queue"                       #  Play when the sounds playing have finished.
+MIX     = "mix"                         #  Play along side any sounds playing.
+
+
+class AudioCache():
+    """  A least recently used store of decoded sounds.
+         The store is implemented as an ordered dictionary - [path, item].
+         The item is a list - QAudioFormat, QByteArray of PCM data.
+
+         When the total size goes over maxBytes, the sounds least recently played are dropped.
+    """
+# ------------------------------------------------------------------------------------- __init__ ----------------------
+    def __init__(self, maxBytes=MAX_CACHE_BYTES):
+        self.maxBytes = maxBytes
+        self.store    = OrderedDict()
+        self.size     = 0
+# ------------------------------------------------------------------------------------- get ---------------------------
+    def get(self, path):
+        """  Returns the decoded sound, or None if not in the store.
+        """
+        item = self.store.get(path)
+        if item is not None:
+            self.store.move_to_end(path)
+
+        return item
+# ------------------------------------------------------------------------------------- put ---------------------------
+    def put(self, path, item):
+        """  Adds a decoded sound to the store, dropping the least recently used if over size.
+             The latest sound is always kept, even if on its own it is over size.
+        """
+        if path in self.store:
+            self.size -= self.store.pop(path)[1].size()
+
+        self.store[path] = item
+        self.size       += item[1].size()
+
+        while self.size > self.maxBytes and len(self.store) > 1:
+            _path, oldItem = self.store.popitem(last=False)
+            self.size     -= oldItem[1].size()
+# ------------------------------------------------------------------------------------- __contains__ ------------------
+    def __contains__(self, path):
+        return path in self.store
+
+
+class AudioWorker(QObject):
+    """  Does the actual decoding and playing, lives on the sound thread.
+
+         All sounds are decoded to the same format, so they can be played without any conversion.
+
+         Each sound playing is a voice, held in a dictionary - [id, [sink, buffer]].
+         More then one voice can play at once, they are mixed by the audio device.
+         How a new sound treats the voices already playing depends upon its policy -
+             REPLACE - the voices playing are cancelled.
+             QUEUE   - the sound waits until no voices are playing, queued sounds are played in order.
+             MIX     - the sound plays along side.
+
+         A scheduled sound is held as a list - [id, path, volume, deadline, policy].
+         The precise timer is woken a little early, then spins to the deadline - timers on Windows can be 15ms out.
+    """
+    started  = pyqtSignal(int)
+    finished = pyqtSignal(int, bool)
+
+    def __init__(self, myLogger, maxBytes):
+        super().__init__()
+
+        self.myLogger  = myLogger
+        self.cache     = AudioCache(maxBytes)
+        self.voices    = {}
+        self.queue     = []                     #  Sounds waiting to be played - [id, path, volume].
+        self.timer     = None                   #  Created on the sound thread, on first use.
+        self.scheduled = None
+
+        self.format = QAudioFormat()
+        self.format.setSampleRate(44100)
+        self.format.setChannelCount(2)
+        self.format.setSampleFormat(QAudioFormat.SampleFormat.Int16)
+# ------------------------------------------------------------------------------------- preload -----------------------
+    @pyqtSlot(list)
+    def preload(self, paths):
+        """  Decode the sound files into the cache, if not already there.
+        """
+        for path in paths:
+            if path not in self.cache:
+                self.load(path)
+# ------------------------------------------------------------------------------------- load --------------------------
+    def load(self, path):
+        """  Decode a sound file into PCM and add to the cache.
+             Returns the decoded sound, or None if the file could not be decoded.
+
+             QAudioDecoder works with signals, so a local event loop is run until it has finished.
+        """
+        data    = QByteArray()
+        decoder = QAudioDecoder()
+        loop    = QEventLoop()
+        errors  = []
+
+        def bufferReady():
+            buffer = decoder.read()
+            data.append(buffer.constData().asstring(buffer.byteCount()))
+
+        def decodeError(error):
+            errors.append(decoder.errorString())
+            loop.quit()
+
+        decoder.setAudioFormat(self.format)
+        decoder.setSource(QUrl.fromLocalFile(path))
+        decoder.bufferReady.connect(bufferReady)
+        decoder.finished.connect(loop.quit)
+        decoder.error.connect(decodeError)
+        decoder.start()
+        loop.exec()
+
+        if errors or data.isEmpty():
+            self.myLogger.error(f" Error decoding sound file {path} {errors}")
+            return None
+
+        item = [self.format, data]
+        self.cache.put(path, item)
+        self.myLogger.debug(f" Decoded sound file {path} :: {data.size()} bytes :: cache {self.cache.size} bytes")
+
+        return item
+# ------------------------------------------------------------------------------------- play --------------------------
+    @pyqtSlot(int, str, int, str)
+    def play(self, id, path, volume, policy):
+        """  Play a sound, following the policy if other sounds are playing.
+
+             volume is 0 to 100, as used by the settings slider.
+        """
+        if policy == QUEUE and (self.voices or self.queue):
+            self.queue.append([id, path, volume])
+            return
+
+        if policy == REPLACE:
+            self.stopVoices()
+
+        self.startVoice(id, path, volume)
+# ------------------------------------------------------------------------------------- startVoice --------------------
+    def startVoice(self, id, path, volume):
+        """  Start a sound playing from the cache, decoding first if needed.
+
+             The sink and buffer are owned by the worker, so they are deleted safely once finished with.
+        """
+        item = self.cache.get(path)
+        if item is None:
+            item = self.load(path)
+            if item is None:
+                self.finished.emit(id, False)
+                return
+
+        buffer = QBuffer(self)
+        buffer.setData(item[1])                         #  QByteArray is implicitly shared, so this is not a copy.
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+
+        sink = QAudioSink(item[0], self)
+        sink.setVolume(max(0, min(volume, 100)) / 100)
+        sink.stateChanged.connect(lambda state, id=id: self.stateChanged(id, state))
+
+        self.voices[id] = [sink, buffer]
+        sink.start(buffer)
+        self.started.emit(id)
+# ------------------------------------------------------------------------------------- stateChanged ------------------
+    def stateChanged(self, id, state):
+        """  Called when the state of a voice changes.
+             Idle means all the sound has been played, stopped with an error means the device failed.
+        """
+        voice = self.voices.get(id)
+        if voice is None:
+            return
+
+        if state == QAudio.State.IdleState:
+            self.endVoice(id, True)
+        elif state == QAudio.State.StoppedState and voice[0].error() != QAudio.Error.NoError:
+            self.myLogger.error(f" Error playing sound {id} :: {voice[0].error()}")
+            self.endVoice(id, False)
+# ------------------------------------------------------------------------------------- endVoice ----------------------
+    def endVoice(self, id, completed):
+        """  Stop a voice and tell the world, then start the next queued sound if nothing else is playing.
+        """
+        voice = self.voices.pop(id, None)
+        if voice is None:
+            return
+
+        sink, buffer = voice
+        sink.stop()
+        buffer.close()
+        sink.deleteLater()
+        buffer.deleteLater()
+
+        self.finished.emit(id, completed)
+
+        if self.queue and not self.voices:
+            self.startVoice(*self.queue.pop(0))
+# ------------------------------------------------------------------------------------- stopVoices --------------------
+    def stopVoices(self):
+        """  Cancel all voices playing, the queued sounds are left.
+        """
+        for id in list(self.voices):
+            self.endVoice(id, False)
+# ------------------------------------------------------------------------------------- schedule ----------------------
+    @pyqtSlot(int, str, int, object, str)
+    def schedule(self, id, path, volume, deadline, policy):
+        """  Play a sound at the deadline, given in time.monotonic_ns().
+             Replaces any sound already scheduled, which is cancelled.
+
+             The sound is decoded now, so the deadline is not spent decoding.
+        """
+        if self.cache.get(path) is None and self.load(path) is None:
+            self.finished.emit(id, False)
+            return
+
+        if self.timer is None:
+            self.timer = QTimer(self)
+            self.timer.setSingleShot(True)
+            self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+            self.timer.timeout.connect(self.scheduledPlay)
+
+        if self.scheduled:
+            self.finished.emit(self.scheduled[0], False)
+
+        self.scheduled = [id, path, volume, deadline, policy]
+        wait = (deadline - time.monotonic_ns() - SPIN_NS) // 1_000_000
+        self.timer.start(max(0, wait))
+# ------------------------------------------------------------------------------------- scheduledPlay -----------------
+    def scheduledPlay(self):
+        """  Called by the timer just before the deadline, spins to the deadline and plays the sound.
+             A deadline already passed is played straight away, and the lateness is logged.
+        """
+        if self.scheduled is None:
+            return
+
+        id, path, volume, deadline, policy = self.scheduled
+        self.scheduled = None
+
+        while time.monotonic_ns() < deadline:
+            pass
+
+        self.play(id, path, volume, policy)
+        error = (time.monotonic_ns() - deadline) / 1_000_000
+        self.myLogger.debug(f" Sound {path} started {error:+.2f} ms from its deadline.")
+# ------------------------------------------------------------------------------------- cancel ------------------------
+    @pyqtSlot(int)
+    def cancel(self, id):
+        """  Cancel a sound, whether playing, queued or scheduled.
+        """
+        if id in self.voices:
+            self.endVoice(id, False)
+            return
+
+        for queued in self.queue:
+            if queued[0] == id:
+                self.queue.remove(queued)
+                self.finished.emit(id, False)
+                return
+
+        if self.scheduled and self.scheduled[0] == id:
+            self.timer.stop()
+            self.scheduled = None
+            self.finished.emit(id, False)
+# ------------------------------------------------------------------------------------- stop --------------------------
+    @pyqtSlot()
+    def stop(self):
+        """  Cancel all sounds, playing, queued and scheduled.
+        """
+        if self.scheduled:
+            self.cancel(self.scheduled[0])
+
+        queued, self.queue = self.queue, []
+        for id, _path, _volume in queued:
+            self.finished.emit(id, False)
+
+        self.stopVoices()
+
+
+class AudioEngine(QObject):
+    """  A sound engine that plays decoded sounds from memory, on its own thread.
+
+         The sounds are decoded into PCM once, and held in a least recently used cache.
+         So a chime starts on the boundary, without waiting for the MP3 to be opened and decoded.
+
+         The calls return straight away, the work is passed to the sound thread using signals.
+         Each sound is given an id when requested, the started and finished signals carry this id.
+         So a caller can tell when its own sound has ended, the engine is shared.
+         Chimes are scheduled ahead against a monotonic deadline, so the one second klock timer does not add jitter.
+    """
+    requestPreload  = pyqtSignal(list)
+    requestPlay     = pyqtSignal(int, str, int, str)
+    requestSchedule = pyqtSignal(int, str, int, object, str)
+    requestCancel   = pyqtSignal(int)
+    requestStop     = pyqtSignal()
+
+    started  = pyqtSignal(int)
+    finished = pyqtSignal(int, bool)
+
+    def __init__(self, myLogger, maxBytes=MAX_CACHE_BYTES):
+        super().__init__()
+
+        self.myLogger = myLogger
+        self.ids      = itertools.count(1)
+
+        self.thread = QThread()
+        self.worker = AudioWorker(myLogger, maxBytes)
+        self.worker.moveToThread(self.thread)
+
+        self.requestPreload.connect(self.worker.preload)
+        self.requestPlay.connect(self.worker.play)
+        self.requestSchedule.connect(self.worker.schedule)
+        self.requestCancel.connect(self.worker.cancel)
+        self.requestStop.connect(self.worker.stop)
+
+        self.worker.started.connect(self.started)
+        self.worker.finished.connect(self.finished)
+
+        self.thread.start()
+        self.myLogger.info(" Sound engine started.")
+# ------------------------------------------------------------------------------------- preload -----------------------
+    def preload(self, paths):
+        """  Decode the sound files into memory, ready to be played.
+        """
+        self.requestPreload.emit([str(path) for path in paths])
+# ------------------------------------------------------------------------------------- play --------------------------
+    def play(self, path, volume, policy=REPLACE):
+        """  Play a sound file, decoding it first if not already in memory.
+             Returns the id of the sound.
+        """
+        id = next(self.ids)
+        self.requestPlay.emit(id, str(path), int(volume), policy)
+
+        return id
+# ------------------------------------------------------------------------------------- schedule ----------------------
+    def schedule(self, path, volume, deadline, policy=MIX):
+        """  Play a sound file at deadline, given in time.monotonic_ns().
+             Replaces any sound already scheduled.
+             Returns the id of the sound.
+        """
+        id = next(self.ids)
+        self.requestSchedule.emit(id, str(path), int(volume), int(deadline), policy)
+
+        return id
+# ------------------------------------------------------------------------------------- cancel ------------------------
+    def cancel(self, id):
+        """  Cancel a sound, whether playing, queued or scheduled.
+        """
+        self.requestCancel.emit(int(id))
+# ------------------------------------------------------------------------------------- stop --------------------------
+    def stop(self):
+        """  Cancel all sounds, playing, queued and scheduled.
+        """
+        self.requestStop.emit()
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop the sound thread, called when pyKlock closes.
+        """
+        if self.thread.isRunning():
+            self.requestStop.emit()
+            self.thread.quit()
+            self.thread.wait()
+            self.myLogger.info(" Sound engine stopped.")
+
+# ------------------------------------------------------------------------------------- getAudioEngine ----------------
+@lru_cache(maxsize=None)
+def getAudioEngine(myLogger):
+    """  Returns the sound engine, there is only one - so the decoded sounds are shared.
+         Created on the first call, and re-used on further calls.
+    """
+    return AudioEngine(myLogger)
@@ -0,0 +1,180 @@
+###############################################################################################################
+#    clockDiscipline.py   Copyright (C) <2026>  <Kevin Scott>                                                 #
+#                                                                                                             #
+#    Turns the NTP samples into a smoothed estimate of the PC clock's offset and drift.                       #
+#                                                                                                             #
+#    import src.classes.clockDiscipline as cd                                                                 #
+#                                                                                                             #
+#    clock = cd.getClockDiscipline(myConfig, myLogger)                                                        #
+#                                                                                                             #
+#    clock.now()                     The time now, as time.time() seconds - corrected if TIME_DISCIPLINED.    #
+#    clock.nowDateTime(tz)           The time now, as a datetime - local if tz is None.                       #
+#    clock.nowQDateTime()            The time now, as a QDateTime.                                            #
+#    clock.offset()                  The estimated offset of the PC clock, in seconds.                        #
+#    clock.errorBound()              The estimated error of the offset, in seconds.                           #
+#    clock.drift                     The estimated drift of the PC clock, in seconds per second.              #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import time
+import datetime
+import statistics
+
+from collections import deque
+from functools import lru_cache
+
+from PyQt6.QtCore import QObject, QDateTime, pyqtSlot
+
+import src.classes.ntpPoller as ntpp
+
+WINDOW    = 8               #  The number of samples held, as the NTP clock filter.
+MIN_SPAN  = 60.0            #  Seconds the samples must span, before a drift is worked out.
+PHI       = 15e-6           #  The assumed drift of a PC clock when not known, seconds per second - as RFC 5905.
+MAX_DRIFT = 500e-6          #  A drift bigger then this is not believed, seconds per second.
+OUTLIER   = 3.0             #  Samples further then this many median deviations from the median are ignored.
+
+
+class ClockDiscipline(QObject):
+    """  Turns the NTP samples into a smoothed estimate of the PC clock's offset and drift.
+
+         The last WINDOW samples are held.  Samples with an offset far from the median are ignored as outliers,
+         a straight line is then fitted to the rest - offset against time.monotonic().
+         The line gives the offset at any moment and its slope is the drift, so the offset is carried
+         forward between polls.  Until the samples span MIN_SPAN seconds the median offset is used, with no drift.
+
+         The error bound is half the shortest round trip delay, plus the jitter of the samples about the line,
+         plus the drift uncertainty [PHI if not known] times the age of the latest sample.
+
+         The samples arrive from the NTP poller thread, the slot runs on the GUI thread.
+         If TIME_DISCIPLINED is not set, or there are no samples, now() is just the PC time.
+    """
+    def __init__(self, myConfig, myLogger):
+        super().__init__()
+
+        self.myConfig = myConfig
+        self.myLogger = myLogger
+        self.samples  = deque(maxlen=WINDOW)
+        self.base     = 0.0                     #  Offset at monoRef.
+        self.drift    = 0.0                     #  Seconds per second, positive if the PC clock is slow.
+        self.monoRef  = 0.0
+        self.jitter   = 0.0
+        self.minDelay = 0.0
+        self.driftErr = PHI
+        self.latest   = 0.0                     #  time.monotonic() of the latest sample.
+# ------------------------------------------------------------------------------------- addSample ---------------------
+    @pyqtSlot(object)
+    def addSample(self, sample):
+        """  Add a NTP sample and work out the estimate again.
+        """
+        self.samples.append(sample)
+        self.estimate()
+        self.myLogger.debug(f" Clock discipline :: offset {self.base:+.4f}s :: drift {self.drift * 1e6:+.1f}ppm :: error {self.errorBound():.4f}s")
+# ------------------------------------------------------------------------------------- estimate ----------------------
+    def estimate(self):
+        """  Fit the offset and drift to the samples held, ignoring the outliers.
+        """
+        offsets = [sample.offset for sample in self.samples]
+        median  = statistics.median(offsets)
+        spread  = statistics.median([abs(offset - median) for offset in offsets])
+        good    = [sample for sample in self.samples if abs(sample.offset - median) <= OUTLIER * spread + 0.001]
+
+        self.minDelay = min(sample.delay for sample in good)
+        self.latest   = max(sample.mono for sample in good)
+        self.monoRef  = self.latest
+
+        span = self.latest - min(sample.mono for sample in good)
+
+        if len(good) < 3 or span < MIN_SPAN:
+            self.base     = median
+            self.drift    = 0.0
+            self.driftErr = PHI
+            self.jitter   = statistics.pstdev([sample.offset for sample in good]) if len(good) > 1 else 0.0
+            return
+
+        #  Least squares fit, with time measured back from the latest sample.
+        times  = [sample.mono - self.monoRef for sample in good]
+        values = [sample.offset for sample in good]
+        meanT  = statistics.fmean(times)
+        meanV  = statistics.fmean(values)
+        sumTT  = sum((t - meanT) ** 2 for t in times)
+        slope  = sum((t - meanT) * (v - meanV) for t, v in zip(times, values, strict=True)) / sumTT
+
+        if abs(slope) > MAX_DRIFT:
+            self.myLogger.warning(f" Clock discipline :: drift {slope * 1e6:+.1f}ppm not believed, ignored.")
+            slope = 0.0
+
+        self.drift    = slope
+        self.base     = meanV - slope * meanT
+        residuals     = [v - (self.base + slope * t) for t, v in zip(times, values, strict=True)]
+        self.jitter   = (sum(r ** 2 for r in residuals) / (len(residuals) - 2)) ** 0.5 if len(residuals) > 2 else 0.0
+        self.driftErr = max(self.jitter / sumTT ** 0.5, 1e-7)
+# ------------------------------------------------------------------------------------- offset ------------------------
+    def offset(self, mono=None):
+        """  Returns the estimated offset of the PC clock at time.monotonic() mono [default now], in seconds.
+             Add the offset to the PC time to get the true time.  Returns 0.0 if there are no samples.
+        """
+        if not self.samples:
+            return 0.0
+
+        mono = time.monotonic() if mono is None else mono
+
+        return self.base + self.drift * (mono - self.monoRef)
+# ------------------------------------------------------------------------------------- errorBound --------------------
+    def errorBound(self, mono=None):
+        """  Returns the estimated error of the offset at time.monotonic() mono [default now], in seconds.
+             Returns None if there are no samples.
+        """
+        if not self.samples:
+            return None
+
+        mono = time.monotonic() if mono is None else mono
+
+        return self.minDelay / 2 + self.jitter + self.driftErr * max(0.0, mono - self.latest)
+# ------------------------------------------------------------------------------------- now ---------------------------
+    def now(self):
+        """  Returns the time now as time.time() seconds, corrected by the estimated offset if TIME_DISCIPLINED.
+        """
+        if self.myConfig.TIME_DISCIPLINED:
+            return time.time() + self.offset()
+
+        return time.time()
+# ------------------------------------------------------------------------------------- nowDateTime -------------------
+    def nowDateTime(self, tz=None):
+        """  Returns the time now as a datetime, local if tz is None - as datetime.datetime.now(tz).
+        """
+        return datetime.datetime.fromtimestamp(self.now(), tz)
+# ------------------------------------------------------------------------------------- nowQDateTime ------------------
+    def nowQDateTime(self):
+        """  Returns the time now as a local QDateTime - as QDateTime.currentDateTime().
+        """
+        return QDateTime.fromMSecsSinceEpoch(int(self.now() * 1000))
+
+# ------------------------------------------------------------------------------------- getClockDiscipline ------------
+@lru_cache(maxsize=None)
+def getClockDiscipline(myConfig, myLogger):
+    """  Returns the clock discipline, there is only one - so all the klocks show the same time.
+         Created on the first call, fed by the NTP poller, and re-used on further calls.
+    """
+    clock  = ClockDiscipline(myConfig, myLogger)
+    poller = ntpp.getNTPPoller(myConfig, myLogger)
+
+    if poller.sample:
+        clock.addSample(poller.sample)
+    poller.sampled.connect(clock.addSample)
+
+    return clock
@@ -0,0 +1,122 @@
+###############################################################################################################
+#    configWatcher.py   Copyright (C) <2026>  <Kevin Scott>                                                   #
+#                                                                                                             #
+#    Watches config.toml and reloads it when changed on disc, i.e. a new file dropped in.                     #
+#                                                                                                             #
+#    import src.classes.configWatcher as cw                                                                   #
+#                                                                                                             #
+#    watcher = cw.ConfigWatcher(myConfig, myLogger)                                                           #
+#                                                                                                             #
+#    watcher.reloaded                Signal, emitted with a list of the properties changed by a reload.       #
+#    watcher.close()                 Stop watching.                                                           #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import tomllib
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+SETTLE = 300                #  Milliseconds to wait for the file to stop changing, before reading it.
+
+
+class ConfigWatcher(QObject):
+    """  Watches config.toml and reloads it when changed on disc, i.e. a new file dropped in.
+
+         The file is read and parsed on a background thread, then handed to myConfig.reload() on the GUI
+         thread - which calls the watchers of only the properties that have changed.  So pyKlock's own
+         writes change nothing and are ignored.
+
+         The folder is watched as well as the file, a file replaced by a rename [as pyKlock writes it] or
+         deleted and written again is no longer watched - it is added back.  A file that can not be
+         parsed, i.e. half written by an editor, is ignored until it changes again.
+    """
+    reloaded = pyqtSignal(list)
+    parsed   = pyqtSignal(object)               #  Internal, carries the parsed file back to the GUI thread.
+
+    def __init__(self, myConfig, myLogger):
+        super().__init__()
+
+        self.myConfig = myConfig
+        self.myLogger = myLogger
+        self.fileName = os.path.abspath(str(myConfig.FILE_NAME))
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ConfigWatcher")
+
+        self.settleTimer = QTimer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.timeout.connect(self.readFile)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.addPath(os.path.dirname(self.fileName))
+        self.watchFile()
+        self.watcher.fileChanged.connect(self.fileChanged)
+        self.watcher.directoryChanged.connect(self.fileChanged)
+
+        self.parsed.connect(self.useFile)
+# ------------------------------------------------------------------------------------- watchFile ---------------------
+    def watchFile(self):
+        """  Watch the file, if it exists and is not already watched.
+        """
+        if self.fileName not in self.watcher.files() and os.path.exists(self.fileName):
+            self.watcher.addPath(self.fileName)
+# ------------------------------------------------------------------------------------- fileChanged -------------------
+    def fileChanged(self, path):
+        """  The file or its folder has changed, wait for it to settle before reading.
+        """
+        self.watchFile()
+        self.settleTimer.start(SETTLE)
+# ------------------------------------------------------------------------------------- readFile ----------------------
+    def readFile(self):
+        """  Read and parse the file on the background thread.
+        """
+        self.executor.submit(self.parseFile)
+# ------------------------------------------------------------------------------------- parseFile ---------------------
+    def parseFile(self):
+        """  Parse the file, run on the background thread.
+        """
+        try:
+            with open(self.fileName, "rb") as configFile:      # In context manager.
+                newConfig = tomllib.load(configFile)
+        except FileNotFoundError:
+            return                                              # Being replaced, wait for the new one.
+        except (OSError, tomllib.TOMLDecodeError) as error:
+            self.myLogger.warning(f" Configure file changed, but can not be read :: {error}")
+            return
+
+        self.parsed.emit(newConfig)
+# ------------------------------------------------------------------------------------- useFile -----------------------
+    def useFile(self, newConfig):
+        """  Hand the new file to myConfig, on the GUI thread.
+        """
+        if newConfig == self.myConfig.config:
+            return                                              # Most likely pyKlock's own write.
+
+        changed = self.myConfig.reload(newConfig)
+
+        if changed:
+            self.myLogger.info(f" Configure file changed on disc :: {', '.join(changed)}")
+            self.reloaded.emit(changed)
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop watching, called when pyKlock closes.
+        """
+        self.settleTimer.stop()
+        self.watcher.removePaths(self.watcher.files() + self.watcher.directories())
+        self.executor.shutdown(wait=False, cancel_futures=True)
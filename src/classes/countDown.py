@@ -1,11 +1,28 @@
 ###############################################################################################################
-#     countdown.py   Copyright (C) <2026>  <Kevin Scott>                                                      #                                                                                                             #                                                                                                             #
-#     A simple class that implements a countdown timer.                                                       #
+#    countDown.py   Copyright (C) <2026>  <Kevin Scott>                                                       #
 #                                                                                                             #
-#     For changes see history.txt                                                                             #
+#    A service that runs any number of named count downs and alarms, against monotonic deadlines.             #
+#                                                                                                             #
+#    import src.classes.countDown as cd                                                                       #
+#                                                                                                             #
+#    countDowns = cd.getCountDownService(myLogger)                                                            #
+#                                                                                                             #
+#    countDowns.start(name, seconds, action, text, missed)   Start a count down, the name restarts one.       #
+#    countDowns.alarm(name, when, action, text, missed)      Set an alarm for a datetime.                     #
+#    countDowns.restore()                Set the count downs and alarms saved when pyKlock last closed.       #
+#    countDowns.stop(name)               Stop a count down early.                                             #
+#    countDowns.countDowns               The running count downs, soonest first - a list of CountDown.        #
+#    countDowns.remaining(name)          The time left, in nanoseconds.                                       #
+#    countDowns.elapsedTime(name)        The time left, as 00:00:00.                                          #
+#    countDowns.display = True           Emit countDownTick each time a displayed second changes.             #
+#    countDowns.countDownTick            Signal, a count down has changed - redraw the display.               #
+#    countDowns.countDownEnd             Signal, emitted with the CountDown that has ended.                   #
+#    countDowns.countDownMissed          Signal, emitted by restore() with one that ended while closed.       #
+#    countDowns.close()                  Stop all the count downs, they are kept in the journal.              #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
 #                                                                                                             #
 ###############################################################################################################
-#    Copyright (C) <2026>  <Kevin Scott>                                                                      #
 #                                                                                                             #
 #    This program is free software: you can redistribute it and/or modify it under the terms of the           #
 #    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
@@ -20,87 +37,305 @@
 #                                                                                                             #
 ###############################################################################################################
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+import time
+import heapq
+import itertools
 
-class countdown(QObject):
-    """  A Simple class that implements a countdown timer.
-         The class is self contained - with an internal timer.
+from collections import namedtuple
+from functools import lru_cache
 
-        The class uses PyQt signals and slots to communicate with the outside world.
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
 
-        A countDownTick is emitted every second the cound down timer is running.
-            Call self.countDown.elapsedTime to read the elapsed time.
-        
-        A countDownEnd is emitted when the count down timer has counted down the desired interval.
+import src.classes.timerJournal as tj
 
-         Usage:
-            self.countDown = cd.countdown(self)
-            self.countDown.countDownTick.connect(self.updateTime)                 #  Signal is fired when the count down is running, update display.
-            self.countDown.countDownEnd.connect(self.endEvent)                    #  Signal is fired when the count down has ended.
+from src.projectPaths import TIMERS_PATH
 
-            self.countDown.start(target)                                          #  Starts the count down timer with a supplied time interval in minutes.
-            self.countDown.reset()                                                #  Called to reset the object, so a second count down can be called.
-    """
+SECOND = 1_000_000_000                  #  Nanoseconds in a second.
+
+ALARM_CHECK = 60 * SECOND               #  The longest wait while an alarm is set, before checking the wall clock.
+RESYNC      = SECOND // 20              #  An alarm's deadline is moved if the wall clock has moved more than this.
+
+COUNT_DOWN = "Count Down"               #  The kinds of CountDown.
+ALARM      = "Alarm"
 
-    countDownEnd  = pyqtSignal()  # <-- This is the sub window's signal
-    countDownTick = pyqtSignal()  # <-- This is the sub window's signal
+FIRE   = "Fire"                         #  What to do with one that ended while pyKlock was closed.
+NOTIFY = "Notify"
+SKIP   = "Skip"
+MISSED = [FIRE, NOTIFY, SKIP]
 
-    def __init__(self, parent):
+#  A running count down or alarm, deadline is in time.monotonic_ns() and wall the same in time.time_ns(),
+#  duration is in nanoseconds.  action and text are what to do when it ends, missed what to do if it
+#  ended while pyKlock was closed - they are not used by the service.
+CountDown = namedtuple("CountDown", ["name", "deadline", "duration", "action", "text", "wall", "kind", "missed"])
+
+
+class CountDownService(QObject):
+    """  A service that runs any number of named count down timers, i.e. tea, a meeting and parking.
+
+         Each count down is held as an absolute deadline in time.monotonic_ns(), nothing is counted - so it
+         does not drift, and ends on time however long the GUI was busy.  The deadlines are kept in a
+         min heap, a single timer wakes the service only at the soonest deadline.  While a count down is
+         on display, the timer also wakes when the next displayed second changes.
+
+         A count down stopped early is left in the heap, and passed over when it reaches the top.
+
+         An alarm is a count down to a wall clock time.  Each is written to a journal on disc with its
+         wall clock deadline, restore() reads them back when pyKlock starts - so a count down carries
+         on as if pyKlock had never closed.  One that ended while closed is dealt with by its missed
+         policy, FIRE ends it now, NOTIFY emits countDownMissed and SKIP just logs it.
+
+         An alarm is set for a wall clock time, but the monotonic clock stops while the PC sleeps [on some
+         systems] and knows nothing of the wall clock being stepped.  So while an alarm is set the service
+         wakes at least every ALARM_CHECK, and each alarm's deadline is worked out again from the wall clock.
+         The wall clock is the clock discipline, if given - so alarms agree with the klock.
+    """
+    countDownEnd    = pyqtSignal(object)
+    countDownMissed = pyqtSignal(object)
+    countDownTick   = pyqtSignal()
+
+    def __init__(self, myLogger):
         super().__init__()
 
-        self.parent = parent
-        self.reset()                            #  Sets up object’s attributes.
+        self.myLogger = myLogger
+        self.running  = {}                      #  [name, CountDown].
+        self.heap     = []                      #  [deadline, order, name], soonest first.
+        self.order    = itertools.count()       #  Keeps the heap in start order for equal deadlines.
+        self._display = False
+        self.journal  = tj.TimerJournal(TIMERS_PATH, myLogger)
+        self.clock    = None                    #  The clock discipline, set by pyKlock - the PC clock if None.
+
+        self.Timer = QTimer(self)
+        self.Timer.setSingleShot(True)
+        self.Timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.Timer.timeout.connect(self.wake)
+# ------------------------------------------------------------------------------------- start -------------------------
+    def start(self, name, seconds, action="Notification + Sound", text="Count Down Timer Finished.", missed=FIRE):
+        """  Start a count down of seconds, a count down already running with the same name is restarted.
+             Returns the CountDown.
+        """
+        duration  = int(seconds * SECOND)
+        countDown = CountDown(name, time.monotonic_ns() + duration, duration, action, text,
+                              self.wallNs() + duration, COUNT_DOWN, missed)
 
-        #  Set up short timer to update the clock every second
-        #  Will be destroyed when the calling window is closed.
-        self.Timer = QTimer(self)               
-        self.Timer.timeout.connect(self.tick)
-        
-    def reset(self):
-        """  Creates the object’s attributes.
+        self.add(countDown)
+        self.myLogger.info(f" Count down {name} started for {self.formatNs(duration)}")
 
-             Called to reset the object, so a second count down can be called.
+        return countDown
+# ------------------------------------------------------------------------------------- alarm -------------------------
+    def alarm(self, name, when, action="Notification + Sound", text="Alarm.", missed=NOTIFY):
+        """  Set an alarm for when, a datetime - an alarm or count down already set with the same name is replaced.
+             Returns the CountDown.
         """
-        self.is_running = False
-        self.target     = 0
+        wall      = int(when.timestamp() * SECOND)
+        duration  = max(0, wall - self.wallNs())
+        countDown = CountDown(name, time.monotonic_ns() + duration, duration, action, text, wall, ALARM, missed)
+
+        self.add(countDown)
+        self.myLogger.info(f" Alarm {name} set for {when:%d/%m/%Y %H:%M:%S}")
 
-    def start(self, target_time):
-        """  Start the countdown timer, which will count down until target_time is zero.
-             The target time is passed in minutes and converted to seconds.
+        return countDown
+# ------------------------------------------------------------------------------------- add ---------------------------
+    def add(self, countDown):
+        """  Add a CountDown to the heap, with its deadline already worked out - and to the journal.
         """
-        self.is_running = True
-        self.target     = target_time * 60
-        self.Timer.start(self.target)
+        self.running[countDown.name] = countDown
+        heapq.heappush(self.heap, (countDown.deadline, next(self.order), countDown.name))
+        self.journal.started(self.record(countDown))
+        if self.journal.full:
+            self.journal.compact([self.record(running) for running in self.running.values()])
+
+        self.schedule()
+        self.countDownTick.emit()
+# ------------------------------------------------------------------------------------- record ------------------------
+    @staticmethod
+    def record(countDown):
+        """  Returns a CountDown as a dictionary for the journal, without its monotonic deadline - that
+             does not mean anything once pyKlock has closed.
+        """
+        record = countDown._asdict()
+        del record["deadline"]
+
+        return record
+# ------------------------------------------------------------------------------------- restore -----------------------
+    def restore(self):
+        """  Set the count downs and alarms from the journal, called once when pyKlock starts.
+
+             The wall clock deadlines are turned back into monotonic ones and the heap built in one go.
+             Those that ended while pyKlock was closed are dealt with by their missed policy, oldest first.
+        """
+        monoNow = time.monotonic_ns()
+        wallNow = self.wallNs()
+        missed  = []
+
+        for record in self.journal.load():
+            try:
+                countDown = CountDown(deadline=monoNow + record["wall"] - wallNow, **record)
+            except TypeError:
+                self.myLogger.warning(f" Timer journal record can not be used, passed over :: {record}")
+                continue
+            if countDown.wall <= wallNow:
+                missed.append(countDown)
+            else:
+                self.running[countDown.name] = countDown
+
+        self.heap = [(countDown.deadline, next(self.order), countDown.name) for countDown in self.running.values()]
+        heapq.heapify(self.heap)
+        self.journal.compact([self.record(countDown) for countDown in self.running.values()])
+
+        if self.running:
+            self.myLogger.info(f" Restored {len(self.running)} count downs and alarms")
+
+        for countDown in sorted(missed, key=lambda countDown: countDown.wall):
+            late = self.formatNs(wallNow - countDown.wall)
+            self.myLogger.info(f" {countDown.kind} {countDown.name} ended while closed, {late} ago :: {countDown.missed}")
+            if countDown.missed == FIRE:
+                self.countDownEnd.emit(countDown)
+            elif countDown.missed == NOTIFY:
+                self.countDownMissed.emit(countDown)
 
+        self.schedule()
+        self.countDownTick.emit()
+# ------------------------------------------------------------------------------------- stop --------------------------
+    def stop(self, name):
+        """  Stop a count down early, its heap entry is dropped when it reaches the top.
+        """
+        if self.running.pop(name, None) is None:
+            return
+
+        self.journal.stopped(name)
+        self.myLogger.info(f" Count down {name} stopped")
+        if len(self.heap) > 2 * len(self.running) + 8:
+            self.heap = [entry for entry in self.heap if self.isLive(entry)]    #  Too many stopped, tidy up.
+            heapq.heapify(self.heap)
+
+        self.schedule()
+        self.countDownTick.emit()
+# ------------------------------------------------------------------------------------- wallNs ------------------------
+    def wallNs(self):
+        """  Returns the wall clock time in nanoseconds, NTP corrected if there is a clock discipline.
+        """
+        if self.clock is None:
+            return time.time_ns()
+
+        return int(self.clock.now() * SECOND)
+# ------------------------------------------------------------------------------------- resyncAlarms ------------------
+    def resyncAlarms(self, monoNow):
+        """  Work out each alarm's monotonic deadline again from its wall clock time, in case the PC has slept
+             or its clock has been stepped.  A moved alarm gets a new heap entry, the old one is passed over.
+        """
+        wallNow = self.wallNs()
+
+        for name, countDown in list(self.running.items()):
+            if countDown.kind != ALARM:
+                continue
+            deadline = monoNow + countDown.wall - wallNow
+            if abs(deadline - countDown.deadline) > RESYNC:
+                self.running[name] = countDown._replace(deadline=deadline)
+                heapq.heappush(self.heap, (deadline, next(self.order), name))
+# ------------------------------------------------------------------------------------- isLive ------------------------
+    def isLive(self, entry):
+        """  Returns True if the heap entry is for a running count down, not one stopped or restarted.
+        """
+        countDown = self.running.get(entry[2])
+        return countDown is not None and countDown.deadline == entry[0]
+# ------------------------------------------------------------------------------------- countDowns --------------------
     @property
-    def countdownRunning(self):
-        return self.is_running
+    def countDowns(self):
+        """  Returns the running count downs, soonest first.
+        """
+        return sorted(self.running.values(), key=lambda countDown: countDown.deadline)
+# ------------------------------------------------------------------------------------- remaining ---------------------
+    def remaining(self, name):
+        """  Returns the time left in nanoseconds, 0 if the count down is not running.
+        """
+        countDown = self.running.get(name)
+        if countDown is None:
+            return 0
 
-    def tick(self):
-        if self.target == 0:
-            self.countDownEnd.emit()      #  emit signal when count down ends.
-            self.is_running = False
-            self.Timer.stop()
-        else:
-            self.countDownTick.emit()     #  emit signal if count down is running.
-            self.target -= 1
+        return max(0, countDown.deadline - time.monotonic_ns())
+# ------------------------------------------------------------------------------------- elapsedTime -------------------
+    def elapsedTime(self, name):
+        """  Returns the time left in hours, minutes seconds {00:00:00}, rounded up - so 00:00:00 is the end.
+        """
+        return self.formatNs(self.remaining(name))
+# ------------------------------------------------------------------------------------- formatNs ----------------------
+    @staticmethod
+    def formatNs(ns):
+        """  Returns nanoseconds as hours, minutes seconds {00:00:00}, part of a second counts as a second.
+        """
+        minutes, seconds = divmod(-(-ns // SECOND), 60)
+        hours, minutes   = divmod(minutes, 60)
 
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+# ------------------------------------------------------------------------------------- display -----------------------
     @property
-    def elapsedTime(self):
-        """  Returns the current value in hours, minutes seconds {00:00:00}
+    def display(self):
+        return self._display
 
-             If the countdown is not running "00:00:00" is returned.
+    @display.setter
+    def display(self, value):
+        """  While True, the service also wakes each time a displayed second changes.
+        """
+        self._display = value
+        self.schedule()
+# ------------------------------------------------------------------------------------- schedule ----------------------
+    def schedule(self):
+        """  Set the timer for the soonest deadline, or the next displayed second change if sooner.
+             No count downs, no timer.
         """
-        if not self.is_running:
-            return "00:00:00"
+        while self.heap and not self.isLive(self.heap[0]):
+            heapq.heappop(self.heap)
 
-        minutes, seconds = divmod(self.target, 60)
-        hours, minutes   = divmod(minutes, 60)
+        if not self.heap:
+            self.Timer.stop()
+            return
 
-        trg = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        return trg
+        now  = time.monotonic_ns()
+        wake = self.heap[0][0] - now
 
-    def clear(self):
-        self.is_running = False
+        if any(countDown.kind == ALARM for countDown in self.running.values()):
+            wake = min(wake, ALARM_CHECK)       #  Check the wall clock, see resyncAlarms().
+
+        if self._display:                       #  The seconds shown change at whole seconds before each deadline.
+            for countDown in self.running.values():
+                left = countDown.deadline - now
+                if left > 0:
+                    wake = min(wake, (left - 1) % SECOND + 1)
+
+        self.Timer.start(max(0, -(-wake // 1_000_000)))        #  Milliseconds, rounded up - never early.
+# ------------------------------------------------------------------------------------- wake --------------------------
+    def wake(self):
+        """  End every count down whose deadline has passed, then wait for the next.
+        """
+        now = time.monotonic_ns()
+        self.resyncAlarms(now)
+
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)
+            if self.isLive(entry):
+                countDown = self.running.pop(entry[2])
+                late      = (now - countDown.deadline) / 1_000_000
+                self.journal.stopped(countDown.name)
+                self.myLogger.info(f" {countDown.kind} {countDown.name} ended, {late:.1f} ms late")
+                self.countDownEnd.emit(countDown)
+
+        self.schedule()
+        self.countDownTick.emit()
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop all the count downs, called when pyKlock closes.
+             They are left in the journal, and set again by restore() when pyKlock next starts.
+        """
         self.Timer.stop()
-        self.reset()                #  Sets up object’s attributes.
+        self.journal.compact([self.record(countDown) for countDown in self.running.values()])
+        self.running = {}
+        self.heap    = []
+
+
+# ------------------------------------------------------------------------------------- getCountDownService -----------
+@lru_cache(maxsize=None)
+def getCountDownService(myLogger):
+    """  Returns the count down service, there is only one - shared by pyKlock and the count down viewer.
+         So the count downs carry on when the viewer is closed.
+    """
+    return CountDownService(myLogger)
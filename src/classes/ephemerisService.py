@@ -0,0 +1,228 @@
+###############################################################################################################
+#    ephemerisService.py   Copyright (C) <2026>  <Kevin Scott>                                                #
+#                                                                                                             #
+#    The equinoxes, solstices and Chinese New Year new moon by year, cached in memory and on disc.            #
+#                                                                                                             #
+#    import src.classes.ephemerisService as eph                                                               #
+#                                                                                                             #
+#    service = eph.getEphemerisService(myConfig, myLogger)                                                    #
+#                                                                                                             #
+#    service.seasons(year)           A list of [y, m, d, h, mi] of the spring, summer, autumn & winter times. #
+#    service.newYear(year)           The [y, m, d, h, mi] of the new moon that starts the Chinese New Year.   #
+#    service.precompute()            Work out the configured years in the background.                         #
+#    service.close()                 Save the disc cache and stop the background processes.                   #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import json
+import datetime
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import metadata
+
+from pymeeus.Moon import Moon
+from pymeeus.Sun import Sun
+
+import src.projectPaths as pp
+
+SEASONS   = ["spring", "summer", "autumn", "winter"]
+CHUNK     = 100             #  The number of years worked out by each background process in one go.
+MAX_PROCS = 4               #  The most background processes used.
+
+
+class EphemerisService():
+    """  The equinoxes, solstices and Chinese New Year new moon by year, cached in memory and on disc.
+
+         pymeeus is pure Python, so working out a year is slow - the new moon is found by stepping
+         a lunar month at a time from the winter solstice.  Each year is worked out once, and held as
+         [spring, summer, autumn, winter, new year] each as [y, m, d, h, mi].
+
+         The disc cache is json - [year, [[y, m, d, h, mi], ...]] - keyed by the pymeeus version,
+         so it is thrown away if pymeeus is updated.
+
+         At start up the configured range of years not already on disc is worked out in a pool of
+         background processes, a chunk of years at a time.  A year asked for before then, or outside the
+         range, is worked out there and then and remembered.
+    """
+    def __init__(self, myConfig, myLogger, storeName=pp.EPH_CACHE_PATH):
+        self.myConfig  = myConfig
+        self.myLogger  = myLogger
+        self.storeName = storeName
+        self.years     = {}                     #  [year, [spring, summer, autumn, winter, new year]].
+        self.dirty     = False
+        self.lock      = threading.Lock()
+        self.executor  = None                   #  Only started if there is anything to work out.
+        self.pending   = 0
+
+        try:
+            self.version = metadata.version("pymeeus")
+        except metadata.PackageNotFoundError:
+            self.version = "unknown"
+
+        self.loadCache()
+# ------------------------------------------------------------------------------------- seasons -----------------------
+    def seasons(self, year):
+        """  Returns a list of [y, m, d, h, mi] of the spring & autumn equinoxes and summer & winter solstices.
+        """
+        return self.year(year)[:4]
+# ------------------------------------------------------------------------------------- newYear -----------------------
+    def newYear(self, year):
+        """  Returns the [y, m, d, h, mi] of the new moon that starts the Chinese New Year.
+        """
+        return self.year(year)[4]
+# ------------------------------------------------------------------------------------- year --------------------------
+    def year(self, year):
+        """  Returns the entry for the year, working it out if not already held.
+        """
+        with self.lock:
+            entry = self.years.get(year)
+
+        if entry is None:
+            entry = computeYear(year)
+            self.remember({year: entry})
+
+        return entry
+# ------------------------------------------------------------------------------------- remember ----------------------
+    def remember(self, entries):
+        """  Add worked out years to the memory and disc caches.
+        """
+        with self.lock:
+            self.years.update(entries)
+            self.dirty = True
+# ------------------------------------------------------------------------------------- precompute --------------------
+    def precompute(self):
+        """  Work out the years from EPHEMERIS_FIRST_YEAR to EPHEMERIS_LAST_YEAR not already cached,
+             in a pool of background processes, nearest to this year first.
+             The disc cache is saved once they are all done.
+        """
+        first = max(1, self.myConfig.EPHEMERIS_FIRST_YEAR)
+        last  = self.myConfig.EPHEMERIS_LAST_YEAR
+
+        with self.lock:
+            missing = [year for year in range(first, last + 1) if year not in self.years]
+
+        if not missing:
+            return
+
+        thisYear = datetime.date.today().year
+        missing.sort(key=lambda year: abs(year - thisYear))       #  The years most likely to be asked for first.
+
+        chunks = [missing[start:start + CHUNK] for start in range(0, len(missing), CHUNK)]
+
+        self.myLogger.info(f" Ephemeris :: working out {len(missing)} years between {first} and {last} in the background.")
+
+        self.pending  = len(chunks)
+        self.executor = ProcessPoolExecutor(max_workers=min(MAX_PROCS, os.cpu_count() or 1))
+
+        for chunk in chunks:
+            future = self.executor.submit(computeYears, chunk)
+            future.add_done_callback(self.chunkDone)
+# ------------------------------------------------------------------------------------- chunkDone ---------------------
+    def chunkDone(self, future):
+        """  Called when a chunk of years has been worked out.
+             After the last one the disc cache is saved and the background processes let go.
+        """
+        if not future.cancelled():
+            try:
+                self.remember(future.result())
+            except Exception as error:          #  A broken process pool raises all sorts.
+                self.myLogger.error(f" Ephemeris :: cannot work out years :: {error}")
+
+        with self.lock:
+            self.pending -= 1
+            finished      = self.pending == 0
+
+        if finished:
+            self.saveCache()
+            self.executor.shutdown(wait=False)
+# ------------------------------------------------------------------------------------- loadCache ---------------------
+    def loadCache(self):
+        """  Load the disc cache, it is ignored if not found or from a different pymeeus.
+        """
+        try:
+            with open(self.storeName, "r", encoding="utf-8") as jsonFile:
+                store = json.load(jsonFile)
+        except (OSError, ValueError):
+            return
+
+        if store.get("version") == self.version:
+            self.years = {int(year): entry for year, entry in store.get("years", {}).items()}
+# ------------------------------------------------------------------------------------- saveCache ---------------------
+    def saveCache(self):
+        """  Save the disc cache, if anything new has been worked out.
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+            store      = {"version": self.version, "years": {year: self.years[year] for year in sorted(self.years)}}
+            self.dirty = False
+
+        try:
+            os.makedirs(os.path.dirname(self.storeName) or ".", exist_ok=True)
+            with open(self.storeName, "w", encoding="utf-8") as jsonFile:
+                json.dump(store, jsonFile, separators=(",", ":"))
+        except OSError as error:
+            self.myLogger.error(f" Cannot save ephemeris cache {self.storeName} :: {error}")
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop the background processes and save the disc cache, called when pyKlock closes.
+             The years already worked out are kept, the rest are worked out on the next run.
+        """
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+        self.saveCache()
+
+# ------------------------------------------------------------------------------------- computeYears ------------------
+def computeYears(years):
+    """  Returns a dictionary - [year, entry] for a list of years, run in a background process.
+    """
+    return {year: computeYear(year) for year in years}
+# ------------------------------------------------------------------------------------- computeYear -------------------
+def computeYear(year):
+    """  Returns [spring, summer, autumn, winter, new year] for the year, each as [y, m, d, h, mi].
+
+         The Chinese New Year is the second new moon after the winter solstice, on or after the 21st January.
+         Adapted from https://www.krootl.com/blog/working-with-lunar-calendar-in-python
+         The dates are compared as lists, datetime can not hold the year 0 solstice needed for year 1.
+    """
+    entry = [fullDate(Sun.get_equinox_solstice(year, target=season)) for season in SEASONS]
+
+    lowerLimit = [year, 1, 21]
+    phase      = Moon.moon_phase(Sun.get_equinox_solstice(year - 1, target="winter"), target="new")
+    newMoon    = fullDate(phase)
+    while newMoon[:3] <= lowerLimit:
+        phase   = Moon.moon_phase(phase + 29, target="new")
+        newMoon = fullDate(phase)
+
+    entry.append(newMoon)
+
+    return entry
+# ------------------------------------------------------------------------------------- fullDate ----------------------
+def fullDate(epoch):
+    """  Returns a pymeeus Epoch as [y, m, d, h, mi].
+    """
+    return [int(part) for part in epoch.get_full_date()[:5]]
+# ------------------------------------------------------------------------------------- getEphemerisService -----------
+@lru_cache(maxsize=None)
+def getEphemerisService(myConfig, myLogger):
+    """  Returns the ephemeris service, there is only one - so the caches are shared.
+    """
+    return EphemerisService(myConfig, myLogger)
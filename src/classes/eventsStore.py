@@ -14,13 +14,18 @@
 #                                                                                                             #
 #    eventsStore.getHeaders           Retrieves the headers for display, as strings.                          #
 #    eventsStore.getCategories        Retrieves the categories for display, as strings.                       #
+#    eventsStore.getRecurring         Retrieves the named recurring rules for display, as strings.            #
 #    eventsStore.addEvent(key, item)  Adds an event to the store.  Key = name, item = all data.               #
 #    eventsStore.getEvent(rowKey)     Retrieves an event matching name.                                       #
-#    eventsStore.getEvents()          Returns all events as a sorted list.                                    #
+#    eventsStore.getEvents()          Returns all events as a sorted list, the public holidays last.          #
+#    eventsStore.isReadOnly(key)      Returns True if the event is a public holiday, which can't be edited.   #
 #    eventsStore.saveFriends()        Saves the event store to disc in CSV format.                            #
 #                                                                                                             #
 #    The class should load the CSF file on start up, if not an empty sore is created.                         #
 #                                                                                                             #
+#    The next occurrence of each event is worked out by src.classes.recurrence.                               #
+#    The public holidays are added as read only events by src.classes.holidayProvider.                        #
+#                                                                                                             #
 ###############################################################################################################
 #                                                                                                             #
 #    This program is free software: you can redistribute it and/or modify it under the terms of the           #
@@ -40,14 +45,23 @@ import datetime
 import csv
 
 import src.projectPaths as pp
-from pyqttoast import Toast, ToastPreset
+import src.classes.recurrence as rc
+import src.classes.notifications as nt
+import src.classes.holidayProvider as hp
 
 
 class eventsStore():
     """  A class that implements a store for friends.
          The store is implemented as a dictionary - [key, item].
          The key is a string - Event Name.
-         The item is a list  - Name, Date Due, Time, Due, Category, Notes, Time Left, Stage 1, stage 2, stage 3, NOW.
+         The item is a list  - Name, Date Due, Time, Due, Category, Recurring, Notes, Time Left, Stage 1, stage 2, stage 3, NOW, Next Due.
+
+         Next Due holds the occurrence the stage flags belong to, so the flags can be reset when the event
+         rolls on to its next occurrence - even if that happened while pyKlock was closed.
+
+         The public holidays are held in a second dictionary, virtual, in the same format.
+         They are read only and not saved with the events, only their stage flags are saved - so they are not
+         reminded again each time pyKlock starts.
     """
 # ------------------------------------------------------------------------------------- __init__ ----------------------
     def __init__(self, parent, myLogger, myConfig):
@@ -57,9 +71,16 @@ class eventsStore():
         self.store      = {}         #  Create the store, an empty dictionary.
         self.Headers    = ["Event Name", "Date Due", "Time Due", "Category", "Recurring", "Notes", "Left"]
         self.Categories = ["", "Birthday", "Wedding Anniversary", "Anniversary", "Moto", "Holiday", "Appointment", "One Off Event", "Other"]
+        self.Recurring  = rc.RULES
         self.storeName  = pp.EV_DATA_PATH
+        self.virtual    = {}         #  The public holidays, read only.
+        self.virtName   = pp.EV_HOL_PATH
+        self.recurrence = rc.Recurrence(myLogger)
+        self.reminders  = nt.Notifications(parent, myLogger)
+        self.holidays   = hp.HolidayProvider(myConfig, myLogger)
 
         self.loadEvents()
+        self.loadHolidays()
 
         self.stage1 = self.myConfig.EVENTS_STAGE_1_DAYS  * 86400    #   5 days in seconds, is really soon
         self.stage2 = self.myConfig.EVENTS_STAGE_2_DAYS * 86400     #  10 days in seconds, Will very soon be here
@@ -81,11 +102,20 @@ class eventsStore():
         """  Returns a list of accepted event Categories i.e. Birthday, Anniversary, Moto etc.
         """
         return self.Categories
+# ------------------------------------------------------------------------------------- getRecurring ------------------
+    @property
+    def getRecurring(self):
+        """  Returns a list of named recurring rules i.e. Yearly, Monthly, Weekly etc.
+             A RRULE can also be typed in, if needed.
+        """
+        return self.Recurring
 # ------------------------------------------------------------------------------------- addEvent ----------------------
     def addEvent(self, key, item):
         """   Stores event data into the store.
+              The event may have been edited, so forget its cached next occurrence.
         """
-        self.store[key] = item
+        self.store[key] = self.__padEvent(item)
+        self.recurrence.invalidate(key)
 # ------------------------------------------------------------------------------------- deleteEvent -------------------
     def deleteEvent(self, key):
         """   Deletes a event from the store if it exist, if not ignore.
@@ -93,6 +123,7 @@ class eventsStore():
         """
         if key in self.store:
             del self.store[key]
+            self.recurrence.invalidate(key)
             self.saveEvents()
 # ------------------------------------------------------------------------------------- numberOfEvents ----------------
     @property
@@ -106,7 +137,7 @@ class eventsStore():
              If the key doesn't exist, return error massage in the Notes filed.'
         """
         try:
-            return self.store[key]
+            return self.__event(key)
         except KeyError:
             return ["", "", "", "", "", "Record not found", ""]             #  May need to extend for extra fields,
                                                                              #  so the error message is always in the notes field.
@@ -118,54 +149,100 @@ class eventsStore():
         for key in sorted(self.store):
             lstEvent.append(self.store[key][0:7])                           #  Don't return stage flags.'
 
+        for key in sorted(self.virtual, key=lambda key: self.virtual[key][11]):
+            lstEvent.append(self.virtual[key][0:7])
+
         return lstEvent
+# ------------------------------------------------------------------------------------- isReadOnly --------------------
+    def isReadOnly(self, key):
+        """  Returns True if the event is a public holiday, these can't be edited or deleted.
+        """
+        return key in self.virtual and key not in self.store
 # ------------------------------------------------------------------------------------- updateEvents ------------------
     def updateEvents(self):
-        """  For each event in the store, calculate the time between the due date and now.
+        """  For each event in the store, calculate the time between the next occurrence and now.
              The time interval, in seconds, is stored to the end of the event data,
              to be investigated later.
+
+             If an event has rolled on to a new occurrence, its stage flags are reset.
+             The public holidays are checked in the same way, after the user events.
+
+             Any reminders are displayed together at the end, and the stores are saved once if anything changed.
+        """
+        now     = datetime.datetime.now()
+        changed = [False, self.refreshHolidays(now.date())]
+
+        for index, store in enumerate([self.store, self.virtual]):
+            for key in store.copy():
+                dtDue  = self.nextDue(key, now)
+                dtLeft = int((dtDue - now).total_seconds())                                    #  Convert timedelta to seconds.
+
+                nextDue = dtDue.strftime("%Y-%m-%d %H:%M")
+                if store[key][11] != nextDue:
+                    if store[key][11]:                                                          #  Not set by an older store.
+                        store[key][7:11] = ["False", "False", "False", "False"]
+                    store[key][11] = nextDue
+                    changed[index] = True
+
+                store[key][6] = self.__formatSeconds(dtLeft)       #  Time left in seconds.
+
+                if dtDue.date() >= now.date():                      #  A one off event that has passed, has nothing to remind.
+                    if self.__checkEvent(key, dtLeft):
+                        changed[index] = True
+
+        self.reminders.flush()
+
+        if changed[0]:
+            self.saveEvents()
+        if changed[1]:
+            self.saveHolidays()
+# ------------------------------------------------------------------------------------- refreshHolidays ---------------
+    def refreshHolidays(self, today):
+        """  Merge the public holidays from the holiday provider into the virtual store.
+             Holidays already held keep their stage flags, holidays that have dropped out are forgotten.
+             Returns True if the holidays held have changed.
         """
-        now = datetime.datetime.now()
-        #print(f" Running updateEvents {now}")
-        for key in self.store.copy():
-            dateDue = self.store[key][1]
-            dateDue = self.checkYear(dateDue, now)
-            timeDue = self.store[key][2]
-            dtDue   = datetime.datetime.strptime(f"{dateDue} {timeDue}", "%d/%m/%Y %H:%M")  #  Now a dateTime
-            dtLeft  = int((dtDue - now).total_seconds())                                    #  Convert timedelta to seconds.
-
-            self.store[key][6] = self.__formatSeconds(dtLeft)      #  Time left in seconds.
-            self.__checkEvent(key, dtLeft)
-# ------------------------------------------------------------------------------------- checkYear ---------------------
-    def checkYear(self, dateDue, now):
-        """  Rule 1 : If the year if before the current year [i.e. original birthday year] use current year.
-             Rule 2 : If the month is before the current month [i.e. original birthday month] add 1 to year.
-             Rule 3 : If the day is before the current day [i.e. original birthday day] add 1 to year.
-
-             for example - if now if 27/11/2024 and date due is 02/04/1958.
-                           Should return 02/04/2025.
-
-             Both dateDue input and output are in string format.
-             now is input in datetime format.
-
-              Made the method callable, is a means of determining the actual due date.
+        holidays = self.holidays.events(today)
+
+        if holidays.keys() == self.virtual.keys() and all(self.virtual[key][1] == holidays[key][1] for key in holidays):
+            return False
+
+        virtual = {}
+        for key, event in holidays.items():
+            if key in self.virtual and self.virtual[key][1] == event[1]:
+                virtual[key] = self.virtual[key]
+            else:
+                virtual[key] = list(event)
+                self.recurrence.invalidate(key)
+
+        for key in self.virtual.keys() - virtual.keys():
+            self.recurrence.invalidate(key)
+
+        self.virtual = virtual
+
+        return True
+# ------------------------------------------------------------------------------------- nextDue -----------------------
+    def nextDue(self, key, now=None):
+        """  Returns the next occurrence of an event as a datetime.
+
+             The event date is stored as "d MMMM yyyy" and the time as "HH:mm", the Recurring column says how it repeats.
+             The date is only parsed if the cached occurrence has passed, or the event has been edited.
+             Made the method callable, is a means of determining the actual due date.
         """
-        curDay   = now.day
-        curMonth = now.month
-        curYear  = now.year
-        dueDate  = datetime.datetime.strptime(dateDue, "%d %B %Y")  #  Convert string to Python dateTime.
-        dueDay   = dueDate.day
-        dueMonth = dueDate.month
-        dueYear  = dueDate.year
-
-        if dueYear < curYear:
-            dueYear = curYear
-        if dueMonth < curMonth:
-            dueYear = curYear + 1
-        if dueYear == curYear and dueMonth == curMonth and dueDay < curDay:  #  Event has just passed this month.
-            dueYear = curYear + 1
-
-        return f"{dueDay}/{dueMonth}/{dueYear}"
+        if now is None:
+            now = datetime.datetime.now()
+
+        event   = self.__event(key)
+        timeDue = event[2] if event[2] else "00:00"
+        text    = f"{event[1]} {timeDue}"
+
+        occurrence = self.recurrence.cached(key, event[4], text, now)
+        if occurrence is not None:
+            return occurrence                           #  Not passed or edited, no need to parse the date.
+
+        dtStart = datetime.datetime.strptime(text, "%d %B %Y %H:%M")
+
+        return self.recurrence.nextOccurrence(key, event[4], dtStart, now, text)
 # ------------------------------------------------------------------------------------- _checkEvent -------------------
     def __checkEvent(self, key, secondsLeft):
         """  For each event, calculate the time left in seconds.
@@ -176,46 +253,55 @@ class eventsStore():
                 Stage 2 becomes active after 10 days.
                 stage 1 becomes active after 1 day.
                 Now becomes active with 1 minute to go - mainly intended for event with a time.
+
+             Only the most urgent stage is reminded, any earlier stages it has skipped past are acknowledged with it.
+             So, an event found to be 2 days away after a long break gives one reminder, not three.
+
+             Returns True if the event was found to be due.
         """
         match secondsLeft:
-            case secondsLeft if (secondsLeft <= 60 and self.store[key][10] == "False"):
-                self.__eventDue(key, "Now")
-            case secondsLeft if (secondsLeft <= self.stage3 and self.store[key][9] == "False"):
-                self.__eventDue(key, "Stage 3")
-            case secondsLeft if (secondsLeft <= self.stage2 and self.store[key][8] == "False"):
-                self.__eventDue(key, "Stage 2")
-            case secondsLeft if (secondsLeft <= self.stage1 and self.store[key][7] == "False"):
-                self.__eventDue(key, "Stage 1")
+            case secondsLeft if secondsLeft <= 60:
+                stage, flag = "Now", 10
+            case secondsLeft if secondsLeft <= self.stage1:
+                stage, flag = "Stage 1", 7
+            case secondsLeft if secondsLeft <= self.stage2:
+                stage, flag = "Stage 2", 8
+            case secondsLeft if secondsLeft <= self.stage3:
+                stage, flag = "Stage 3", 9
+            case _:
+                return False
+
+        if self.__event(key)[flag] != "False":                     #  Already reminded.
+            return False
+
+        self.__eventDue(key, stage)
+        return True
 # ------------------------------------------------------------------------------------- _eventDue ---------------------
     def __eventDue(self, key, stage):
         """  Called when an event is found to be due.
-             An appropriate notification is displayed for the event.
+             An appropriate reminder is queued for the event, they are displayed at the end of updateEvents.
+             The store is not saved here, updateEvents saves once for all events.
         """
-        event     = self.store[key]
+        event     = self.__event(key)
         eventDue  = event[6]
         eventName = event[0]
-        toast = Toast(self.parent)
-        toast.setDuration(0)        #  Do not timeout.
-        toast.applyPreset(ToastPreset.INFORMATION_DARK)
-        toast.setTitle("Event Reminder")
-        toast.setText(f" {eventName} in {eventDue}")
+        text      = f" {eventName} in {eventDue}"
 
         match stage:
             case "Stage 3":
-                self.store[key][9] = "True"
+                event[9] = "True"
 
             case "Stage 2":
-                self.store[key][8] = "True"
+                event[8:10] = ["True", "True"]
 
             case "Stage 1":
-                self.store[key][7] = "True"
+                event[7:10] = ["True", "True", "True"]
 
             case "Now":
-                self.store[key][10] = "True"
-                toast.setText(f" {eventName}  NOW")
-        
-        toast.show()
-        self.saveEvents()
+                event[7:11] = ["True", "True", "True", "True"]
+                text = f" {eventName}  NOW"
+
+        self.reminders.add(text)
 # ------------------------------------------------------------------------------------- saveEvents --------------------
     def saveEvents(self):
         """  Saves the event store to a text file in csv format.
@@ -233,11 +319,51 @@ class eventsStore():
                 csvFile = csv.reader(csvFile)
                 for rows in csvFile:
                     key = f"{rows[0]}"
-                    item = rows
+                    item = self.__padEvent(rows)
                     self.store[key] = item
 
         except FileNotFoundError:
             print("Event store not found, using empty sore.")
+# ------------------------------------------------------------------------------------- saveHolidays ------------------
+    def saveHolidays(self):
+        """  Saves the public holidays to a text file in csv format, so their stage flags are kept.
+        """
+        with open (self.virtName, "w", newline="", encoding="utf-8") as csvFile:
+            writer = csv.writer(csvFile, quoting=csv.QUOTE_ALL)
+            for key in sorted(self.virtual):
+                writer.writerow(self.virtual[key])
+# ------------------------------------------------------------------------------------- loadHolidays ------------------
+    def loadHolidays(self):
+        """  Loads the public holidays saved last time, only to restore their stage flags.
+             The holidays themselves are refreshed from the holiday provider.
+        """
+        try:
+            with open (self.virtName, "r", encoding="utf-8") as csvFile:
+                csvFile = csv.reader(csvFile)
+                for rows in csvFile:
+                    self.virtual[rows[0]] = self.__padEvent(rows)
+
+        except FileNotFoundError:
+            pass
+# ------------------------------------------------------------------------------------- _event ------------------------
+    def __event(self, key):
+        """  Returns the event from either store, the user events first.
+             Raises KeyError if not found.
+        """
+        if key in self.store:
+            return self.store[key]
+
+        return self.virtual[key]
+# ------------------------------------------------------------------------------------- _padEvent ---------------------
+    def __padEvent(self, item):
+        """  Older stores do not hold the Next Due column, so add an empty one.
+        """
+        defaults = ["", "", "00:00", "", "", "", "", "False", "False", "False", "False", ""]
+
+        if len(item) < len(defaults):
+            item.extend(defaults[len(item):])
+
+        return item
 # ------------------------------------------------------------------------------------- _formatSeconds ----------------
     def __formatSeconds(self, seconds):
         """  Formats number of seconds into a human readable form i.e. hours:minutes:seconds
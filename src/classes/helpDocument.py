@@ -0,0 +1,183 @@
+###############################################################################################################
+#    helpDocument.py   Copyright (C) <2026>  <Kevin Scott>                                                    #
+#                                                                                                             #
+#    The help file, loaded once and shared - pages are rendered when needed and the text is indexed.          #
+#                                                                                                             #
+#    import src.classes.helpDocument as hd                                                                    #
+#                                                                                                             #
+#    helpDocument = hd.getHelpDocument(myLogger)                                                              #
+#                                                                                                             #
+#    helpDocument.load()                 Load the help file in the background, if not already.                #
+#    helpDocument.isReady                True once loaded.                                                    #
+#    helpDocument.pageCount              The number of pages.                                                 #
+#    helpDocument.pageImage(page, width) The page as a QImage, None if still being rendered.                  #
+#    helpDocument.search(text)           The pages holding text, a list of [page, snippet].                   #
+#    helpDocument.ready                  Signal, the help file has loaded.                                    #
+#    helpDocument.pageRendered           Signal, emitted with the page number of a page now rendered.         #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import re
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from PyQt6.QtCore import QObject, QFile, QIODevice, QSize, QTimer, pyqtSignal
+from PyQt6.QtPdf  import QPdfDocument, QPdfPageRenderer
+
+from src.projectPaths import HELP_PATH
+
+CACHE_PAGES = 8                         #  The number of rendered pages kept.
+SNIPPET     = 40                        #  The characters either side of a match, shown in the search results.
+
+
+class HelpDocument(QObject):
+    """  The help file, loaded once and shared - so opening help again does not load it again.
+
+         The file is loaded through a QFile, which QPdfDocument reads in the background - ready is
+         emitted when done.  A page is rendered only when asked for, on a QPdfPageRenderer thread,
+         and the last CACHE_PAGES rendered are kept - pageRendered is emitted when one is ready.
+
+         Once loaded, the text of each page is read one page at a time while pyKlock is idle.  A search
+         is then just a look through that text, a search before the index is done finishes it first.
+    """
+    ready        = pyqtSignal()
+    pageRendered = pyqtSignal(int)
+
+    def __init__(self, fileName, myLogger):
+        super().__init__()
+
+        self.myLogger = myLogger
+        self.helpFile = QFile(str(fileName), self)
+        self.document = QPdfDocument(self)
+        self.cache    = OrderedDict()           #  [[page, width], QImage], least recently used first.
+        self.requests = {}                      #  [request id, [page, width]], pages being rendered.
+        self.texts    = []                      #  The text of each page indexed so far.
+        self.folded   = []                      #  The same, in lower case for searching.
+
+        self.renderer = QPdfPageRenderer(self)
+        self.renderer.setRenderMode(QPdfPageRenderer.RenderMode.MultiThreaded)
+        self.renderer.setDocument(self.document)
+        self.renderer.pageRendered.connect(self.rendered)
+
+        self.indexTimer = QTimer(self)
+        self.indexTimer.timeout.connect(self.indexPage)
+
+        self.document.statusChanged.connect(self.statusChanged)
+# ------------------------------------------------------------------------------------- load --------------------------
+    def load(self):
+        """  Load the help file in the background, if not already loaded or loading.
+        """
+        if self.document.status() != QPdfDocument.Status.Null:
+            return
+
+        if not self.helpFile.open(QIODevice.OpenModeFlag.ReadOnly):
+            self.myLogger.error(f" Cannot open help file {self.helpFile.fileName()} :: {self.helpFile.errorString()}")
+            return
+
+        self.document.load(self.helpFile)
+# ------------------------------------------------------------------------------------- statusChanged -----------------
+    def statusChanged(self, status):
+        """  Once loaded, start indexing the text.
+        """
+        if status == QPdfDocument.Status.Ready:
+            self.myLogger.info(f" Help file loaded, {self.pageCount} pages")
+            self.indexTimer.start(0)                #  One page each time pyKlock is idle.
+            self.ready.emit()
+        elif status == QPdfDocument.Status.Error:
+            self.myLogger.error(f" Cannot load help file {self.helpFile.fileName()} :: {self.document.error()}")
+            self.helpFile.close()
+# ------------------------------------------------------------------------------------- isReady -----------------------
+    @property
+    def isReady(self):
+        return self.document.status() == QPdfDocument.Status.Ready
+# ------------------------------------------------------------------------------------- pageCount ---------------------
+    @property
+    def pageCount(self):
+        return self.document.pageCount()
+# ------------------------------------------------------------------------------------- pageImage ---------------------
+    def pageImage(self, page, width):
+        """  Returns the page rendered width pixels wide as a QImage, from the cache.
+             Returns None if not rendered yet - it is asked for, and pageRendered emitted when ready.
+        """
+        key = (page, width)
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        if self.isReady and 0 <= page < self.pageCount and key not in self.requests.values():
+            pageSize  = self.document.pagePointSize(page)
+            height    = round(width * pageSize.height() / pageSize.width())
+            requestId = self.renderer.requestPage(page, QSize(width, height))
+            self.requests[requestId] = key
+
+        return None
+# ------------------------------------------------------------------------------------- rendered ----------------------
+    def rendered(self, page, imageSize, image, options, requestId):
+        """  A page has been rendered, keep it in the cache - dropping the least recently used.
+        """
+        key = self.requests.pop(requestId, None)
+        if key is None or image.isNull():
+            return
+
+        self.cache[key] = image
+        while len(self.cache) > CACHE_PAGES:
+            self.cache.popitem(last=False)
+
+        self.pageRendered.emit(page)
+# ------------------------------------------------------------------------------------- indexPage ---------------------
+    def indexPage(self):
+        """  Read the text of the next page, stop once all are read.
+        """
+        if len(self.texts) >= self.pageCount:
+            self.indexTimer.stop()
+            return
+
+        text = self.document.getAllText(len(self.texts)).text()
+        self.texts.append(text)
+        self.folded.append(text.lower())
+# ------------------------------------------------------------------------------------- search ------------------------
+    def search(self, text):
+        """  Returns the pages holding text [case is ignored], a list of [page, snippet] - one for each match.
+        """
+        if not self.isReady or not text.strip():
+            return []
+
+        while len(self.texts) < self.pageCount:             #  Finish the index, if still going.
+            self.indexPage()
+        self.indexTimer.stop()
+
+        wanted = text.strip().lower()
+        found  = []
+        for page, folded in enumerate(self.folded):
+            start = folded.find(wanted)
+            while start != -1:
+                snippet = self.texts[page][max(0, start - SNIPPET):start + len(wanted) + SNIPPET]
+                found.append([page, re.sub(r"\s+", " ", snippet).strip()])
+                start = folded.find(wanted, start + len(wanted))
+
+        return found
+
+
+# ------------------------------------------------------------------------------------- getHelpDocument ---------------
+@lru_cache(maxsize=None)
+def getHelpDocument(myLogger):
+    """  Returns the help document, there is only one - kept loaded once the help has been opened.
+    """
+    return HelpDocument(f"{HELP_PATH}/pyKlock.pdf", myLogger)
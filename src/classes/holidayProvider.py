@@ -0,0 +1,85 @@
+###############################################################################################################
+#    holidayProvider.py   Copyright (C) <2026>  <Kevin Scott>                                                 #
+#                                                                                                             #
+#    Provides the public holidays of the configured country as read only events.                              #
+#                                                                                                             #
+#    import src.classes.holidayProvider as hp                                                                 #
+#                                                                                                             #
+#    provider = hp.HolidayProvider(myConfig, myLogger)                                                        #
+#                                                                                                             #
+#    provider.events(today)          A dictionary - [key, event] of the holidays in the next twelve months.   #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import datetime
+
+import src.classes.holidayService as hs
+
+SUFFIX = " [Public Holiday]"         #  Added to the holiday name, so it can not clash with a user event.
+
+
+class HolidayProvider():
+    """  Provides the public holidays of the configured country as read only events.
+
+         The events are in the same format as the events store, so they are reminded in the same way.
+         They cover a rolling twelve months from today, made from this year's and next year's holiday tables.
+         The events are only made again when the day changes, the tables only when the year rolls over
+         or the country is changed - the tables themselves are cached by the holiday service.
+    """
+    def __init__(self, myConfig, myLogger):
+        self.myConfig = myConfig
+        self.myLogger = myLogger
+        self.service  = hs.getHolidayService(myLogger)
+        self.built    = None                #  [date, country] the events were made for.
+        self.tables   = None                #  [year, country] the tables were read for.
+        self.holidays = []                  #  [date, name] for this year and next.
+        self.store    = {}
+# ------------------------------------------------------------------------------------- events ------------------------
+    def events(self, today):
+        """  Returns a dictionary - [key, event] of the holidays from today for twelve months.
+             Returns an empty dictionary if no country is configured.
+        """
+        country = self.myConfig.EVENTS_HOLIDAY_COUNTRY
+
+        if self.built == [today, country]:
+            return self.store
+
+        self.store = {}
+        self.built = [today, country]
+        code       = self.service.code(country) if country else None
+
+        if country and code is None:
+            self.myLogger.error(f" Unknown public holiday country {country}, no holidays added to events.")
+
+        if code is None:
+            return self.store
+
+        if self.tables != [today.year, country]:
+            self.holidays = self.service.holidays(code, today.year) + self.service.holidays(code, today.year + 1)
+            self.tables   = [today.year, country]
+            self.myLogger.info(f" Public holidays for {country} {today.year} - {today.year + 1} added to events.")
+
+        until = today.replace(year=today.year + 1) if not (today.month == 2 and today.day == 29) else today + datetime.timedelta(days=365)
+
+        for date, name in self.holidays:
+            if today <= date < until:
+                key = f"{name} ({date:%d %b}){SUFFIX}"        #  The same name can fall twice in a year, i.e. Bank Holiday.
+                self.store.setdefault(key, [key, date.strftime("%d %B %Y"), "00:00", "Holiday", "Once",
+                                            f"Public holiday in {country}", "", "False", "False", "False", "False", ""])
+
+        return self.store
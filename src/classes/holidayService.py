@@ -0,0 +1,188 @@
+###############################################################################################################
+#    holidayService.py   Copyright (C) <2026>  <Kevin Scott>                                                  #
+#                                                                                                             #
+#    Public holiday tables by country and year, cached in memory and on disc.                                 #
+#                                                                                                             #
+#    import src.classes.holidayService as hs                                                                  #
+#                                                                                                             #
+#    service = hs.getHolidayService(myLogger)                                                                 #
+#                                                                                                             #
+#    service.countries               A sorted list of [name, code] of the known countries.                    #
+#    service.code(name)              The code of a country, i.e. GB for United Kingdom.                       #
+#    service.holidays(code, year)    A list of [date, name] of the holidays, date is a datetime.date.         #
+#    service.precompute(code, year)  Work out the years either side in the background.                        #
+#    service.close()                 Save the disc cache and stop the background thread.                      #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import json
+import datetime
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import workalendar
+import workalendar.registry
+
+import src.projectPaths as pp
+
+MAX_TABLES = 64             #  The number of [country, year] tables held in memory.
+ADJACENT   = 1              #  The number of years either side worked out in the background.
+
+
+class HolidayService():
+    """  Public holiday tables by country and year, cached in memory and on disc.
+
+         A table is looked for in a least recently used memory cache, then the disc cache, and only then
+         worked out by workalendar - Easter based calendars are slow to work out.
+         The disc cache is json - [code:year, [[iso date, name], ...]] - keyed by the workalendar version,
+         so it is thrown away if workalendar is updated.
+
+         After a table is asked for, the years either side are worked out on a background thread.
+         So stepping through the years in the Public Holidays window is instant.
+    """
+    def __init__(self, myLogger, storeName=pp.HOL_CACHE_PATH):
+        self.myLogger  = myLogger
+        self.storeName = storeName
+        self.tables    = OrderedDict()          #  Memory cache - [code:year, list of [date, name]].
+        self.disc      = {}                     #  Disc cache   - [code:year, list of [iso date, name]].
+        self.dirty     = False
+        self.lock      = threading.Lock()
+        self.executor  = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Holidays")
+        self.version   = getattr(workalendar, "__version__", "unknown")
+
+        calendars      = workalendar.registry.registry.get_calendars()      #  This returns a dictionary
+        self.countries = sorted([calendar.name.replace("'", ""), code] for code, calendar in calendars.items())
+        self.codes     = dict(self.countries)
+
+        self.loadCache()
+# ------------------------------------------------------------------------------------- code --------------------------
+    def code(self, name):
+        """  Returns the code of a country, i.e. GB for United Kingdom - or None if not known.
+        """
+        return self.codes.get(name)
+# ------------------------------------------------------------------------------------- holidays ----------------------
+    def holidays(self, code, year):
+        """  Returns a list of [date, name] of the holidays of the country in the year, date is a datetime.date.
+        """
+        key = f"{code}:{year}"
+
+        with self.lock:
+            table = self.tables.get(key)
+            if table is not None:
+                self.tables.move_to_end(key)
+                return table
+
+            stored = self.disc.get(key)
+
+        if stored is not None:
+            table = [[datetime.date.fromisoformat(date), name] for date, name in stored]
+        else:
+            table = self.compute(code, year)
+
+        self.remember(key, table)
+
+        return table
+# ------------------------------------------------------------------------------------- compute -----------------------
+    def compute(self, code, year):
+        """  Work out the holidays with workalendar, and add them to the disc cache.
+        """
+        try:
+            hols = calendarFor(code).holidays(year)
+        except Exception as error:              #  workalendar raises all sorts for years it does not cover.
+            self.myLogger.error(f" Cannot work out holidays for {code} in {year} :: {error}")
+            return []
+
+        table = [[date, name.replace("'", "")] for date, name in hols]
+
+        with self.lock:
+            self.disc[f"{code}:{year}"] = [[date.isoformat(), name] for date, name in table]
+            self.dirty = True
+
+        return table
+# ------------------------------------------------------------------------------------- remember ----------------------
+    def remember(self, key, table):
+        """  Add a table to the memory cache, dropping the least recently used if full.
+        """
+        with self.lock:
+            self.tables[key] = table
+            self.tables.move_to_end(key)
+            while len(self.tables) > MAX_TABLES:
+                self.tables.popitem(last=False)
+# ------------------------------------------------------------------------------------- precompute --------------------
+    def precompute(self, code, year):
+        """  Work out the years either side on the background thread, if not already cached.
+             The disc cache is saved once they are done.
+        """
+        for near in range(year - ADJACENT, year + ADJACENT + 1):
+            with self.lock:
+                cached = f"{code}:{near}" in self.tables
+            if not cached:
+                self.executor.submit(self.holidays, code, near)
+
+        self.executor.submit(self.saveCache)
+# ------------------------------------------------------------------------------------- loadCache ---------------------
+    def loadCache(self):
+        """  Load the disc cache, it is ignored if not found or from a different workalendar.
+        """
+        try:
+            with open(self.storeName, "r", encoding="utf-8") as jsonFile:
+                store = json.load(jsonFile)
+        except (OSError, ValueError):
+            return
+
+        if store.get("version") == self.version:
+            self.disc = store.get("tables", {})
+# ------------------------------------------------------------------------------------- saveCache ---------------------
+    def saveCache(self):
+        """  Save the disc cache, if anything new has been worked out.
+        """
+        with self.lock:
+            if not self.dirty:
+                return
+            store      = {"version": self.version, "tables": dict(self.disc)}
+            self.dirty = False
+
+        try:
+            os.makedirs(os.path.dirname(self.storeName) or ".", exist_ok=True)
+            with open(self.storeName, "w", encoding="utf-8") as jsonFile:
+                json.dump(store, jsonFile, separators=(",", ":"))
+        except OSError as error:
+            self.myLogger.error(f" Cannot save holiday cache {self.storeName} :: {error}")
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Save the disc cache and stop the background thread, called when pyKlock closes.
+        """
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.saveCache()
+
+# ------------------------------------------------------------------------------------- calendarFor -------------------
+@lru_cache(maxsize=None)
+def calendarFor(code):
+    """  Returns the workalendar calendar of a country, created once and re-used.
+    """
+    return workalendar.registry.registry.get(code)()
+# ------------------------------------------------------------------------------------- getHolidayService -------------
+@lru_cache(maxsize=None)
+def getHolidayService(myLogger):
+    """  Returns the holiday service, there is only one - so the caches are shared.
+    """
+    return HolidayService(myLogger)
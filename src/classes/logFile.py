@@ -0,0 +1,152 @@
+###############################################################################################################
+#    logFile.py   Copyright (C) <2026>  <Kevin Scott>                                                         #
+#                                                                                                             #
+#    A log file read through a memory map, the line offsets are indexed as needed.                            #
+#                                                                                                             #
+#    import src.classes.logFile as lf                                                                         #
+#                                                                                                             #
+#    logFile = lf.LogFile(fileName)                                                                           #
+#                                                                                                             #
+#    logFile.refresh()               Index any new lines, returns True if anything new was indexed.           #
+#    logFile.lineCount               The number of lines indexed so far.                                      #
+#    logFile.lines(first, count)     A list of count lines from line first, as text.                          #
+#    logFile.indexed                 True once the whole file has been indexed.                               #
+#                                                                                                             #
+#    lf.backups(fileName)            A list of the rotated backups of a log file, newest first.               #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import glob
+import mmap
+
+from contextlib import contextmanager
+
+import numpy as np
+
+CHUNK = 8 * 1024 * 1024     #  The most bytes indexed by each call of refresh().
+
+
+class LogFile():
+    """  A log file read through a memory map, the line offsets are indexed as needed.
+
+         Nothing is read into memory but the start of each line - the index.  It is built a CHUNK of bytes
+         at a time by refresh(), using NumPy to find the new lines, so a large log opens straight away and is
+         indexed over the next few calls.  Lines appended later are indexed from where it left off, so the
+         file can be followed like tail -f.
+
+         The file is mapped only while it is being read, no handle is held between calls.  So the logger
+         can still rotate the file at midnight on Windows, the new file is noticed and indexed from the start.
+    """
+    def __init__(self, fileName):
+        self.fileName = fileName
+        self.reset()
+# ------------------------------------------------------------------------------------- reset -------------------------
+    def reset(self):
+        """  Forget the index, the file will be indexed again from the start.
+        """
+        self.starts  = np.zeros(1, dtype=np.int64)     #  The byte offset of the start of each line.
+        self.offset  = 0                               #  The bytes indexed so far.
+        self.size    = 0                               #  The size of the file at the last refresh.
+        self.inode   = None
+        self.indexed = False
+# ------------------------------------------------------------------------------------- lineCount ---------------------
+    @property
+    def lineCount(self):
+        """  The number of lines indexed so far, a last line without a new line is counted once it is indexed.
+        """
+        return len(self.starts) - 1 + int(self.indexed and self.offset > self.starts[-1])
+# ------------------------------------------------------------------------------------- mapped ------------------------
+    @contextmanager
+    def mapped(self):
+        """  The file mapped read only, or None if it is missing or empty.
+        """
+        try:
+            logFile = open(self.fileName, "rb")
+        except OSError:
+            yield None
+            return
+
+        with logFile:
+            try:
+                memMap = mmap.mmap(logFile.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:                  #  An empty file can not be mapped.
+                yield None
+                return
+
+            with memMap:
+                yield memMap
+# ------------------------------------------------------------------------------------- refresh -----------------------
+    def refresh(self):
+        """  Index up to CHUNK bytes not yet indexed, returns True if anything new was indexed.
+             If the file is smaller than before, or a different file, it has been rotated - start again.
+        """
+        try:
+            stat = os.stat(self.fileName)
+        except OSError:
+            stat = None
+
+        before = [self.lineCount, self.offset]
+
+        if stat is None or stat.st_size < self.size or (self.inode is not None and stat.st_ino != self.inode):
+            self.reset()
+            if stat is None:
+                self.indexed = True             #  Missing, nothing to index - i.e. a log not written yet.
+                return before != [0, 0]
+
+        self.inode   = stat.st_ino
+        self.size    = stat.st_size
+        self.indexed = self.offset >= self.size
+
+        if not self.indexed:
+            with self.mapped() as memMap:
+                if memMap is not None and len(memMap) > self.offset:
+                    end    = min(len(memMap), self.offset + CHUNK)
+                    block  = np.frombuffer(memMap, dtype=np.uint8, count=end - self.offset, offset=self.offset)
+                    starts = np.flatnonzero(block == ord("\n")) + self.offset + 1
+                    del block                   #  The map can not close while NumPy holds a view of it.
+
+                    self.starts  = np.concatenate((self.starts, starts))
+                    self.offset  = end
+                    self.size    = max(self.size, end)
+                    self.indexed = end >= self.size
+
+        return [self.lineCount, self.offset] != before
+# ------------------------------------------------------------------------------------- lines -------------------------
+    def lines(self, first, count):
+        """  Returns a list of count lines from line first, as text - fewer if near the end.
+        """
+        last = min(first + count, self.lineCount)
+        if first >= last:
+            return []
+
+        with self.mapped() as memMap:
+            if memMap is None:
+                return []
+
+            ends = list(self.starts[first + 1:last + 1]) + [self.offset] * (last - len(self.starts) + 1)
+
+            return [memMap[start:end].rstrip(b"\r\n").decode("utf-8", errors="replace")
+                    for start, end in zip(self.starts[first:last], ends, strict=False)]
+
+# ------------------------------------------------------------------------------------- backups -----------------------
+def backups(fileName):
+    """  Returns a list of the backups of a log file rotated by TimedRotatingFileHandler, newest first.
+         They are named after the date, i.e. pyKlock.log.2026-07-22
+    """
+    return sorted(glob.glob(f"{glob.escape(str(fileName))}.*"), reverse=True)
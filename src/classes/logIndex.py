@@ -0,0 +1,251 @@
+###############################################################################################################
+#    logIndex.py   Copyright (C) <2026>  <Kevin Scott>                                                        #
+#                                                                                                             #
+#    A time and level index of the log and its rotated backups, searched in the background.                   #
+#                                                                                                             #
+#    import src.classes.logIndex as li                                                                        #
+#                                                                                                             #
+#    index = li.LogIndex(fileName, myLogger)                                                                  #
+#                                                                                                             #
+#    index.found                     Signal, emitted with a FilteredLog when a search is done.                #
+#    index.start()                   Index the log and its backups in the background.                         #
+#    index.search(level, start, end, text)   Search in the background, start & end as li.timeKey().           #
+#    index.close()                   Stop the background thread.                                              #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import re
+import bisect
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import src.classes.logFile as lf
+
+#  Where the time stamp and level start on each line - "2026-07-22 10:00:00,000 : INFO : message"
+#  or {"time": "2026-07-22 10:00:00,000", "level": "INFO", ...} from the JSON lines log.
+FORMATS = {"text": [0, 26],
+           "json": [10, 46]}
+
+STAMP  = 23                                                         #  The length of a time stamp.
+DIGITS = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18, 20, 21, 22]  #  The digits in a time stamp.
+POWERS = 10 ** np.arange(len(DIGITS) - 1, -1, -1, dtype=np.int64)
+LEVELS = {ord("D"): 10, ord("I"): 20, ord("W"): 30, ord("E"): 40, ord("C"): 50}
+BATCH  = 100000                                                     #  The most lines worked out in one go.
+
+
+class FileIndex():
+    """  The time and level of each line of one log file, as NumPy columns.
+
+         A time is held as the digits of its time stamp, i.e. 20260722100000000 - the log is in local time,
+         so this sorts and compares without any time zone.  A line without a time stamp, i.e. from a
+         traceback, takes the time and level of the line before.
+
+         The time stamp and level are at the same place on every line, so they are picked out for a
+         BATCH of lines at once by NumPy, without splitting or decoding any lines.
+    """
+    def __init__(self, fileName):
+        self.logFile = lf.LogFile(fileName)
+        self.reset()
+# ------------------------------------------------------------------------------------- reset -------------------------
+    def reset(self):
+        """  Forget the times and levels, they are worked out again from the start.
+        """
+        self.times  = np.zeros(0, dtype=np.int64)
+        self.levels = np.zeros(0, dtype=np.uint8)
+        self.inode  = None
+# ------------------------------------------------------------------------------------- update ------------------------
+    def update(self):
+        """  Index any new lines, the last line is done again in case it was only part written.
+        """
+        self.logFile.refresh()
+        while not self.logFile.indexed:
+            self.logFile.refresh()
+
+        if self.logFile.inode != self.inode or self.logFile.lineCount < len(self.times):
+            self.reset()                        #  The log has rotated.
+            self.inode = self.logFile.inode
+
+        first = max(0, len(self.times) - 1)
+        lines = self.logFile.lineCount
+
+        with self.logFile.mapped() as memMap:
+            if memMap is None:
+                return
+
+            data   = np.frombuffer(memMap, dtype=np.uint8)
+            times  = [self.times[:first]]
+            levels = [self.levels[:first]]
+            for start in range(first, lines, BATCH):
+                batchTimes, batchLevels = parseLines(data, self.logFile.starts[start:min(lines, start + BATCH)])
+                times.append(batchTimes)
+                levels.append(batchLevels)
+            del data                            #  The map can not close while NumPy holds a view of it.
+
+        times  = np.concatenate(times)
+        levels = np.concatenate(levels)
+
+        #  A line without a time stamp takes the time and level of the line before.
+        stamped     = np.where(levels > 0, np.arange(len(levels)), 0)
+        np.maximum.accumulate(stamped, out=stamped)
+        self.times  = times[stamped]
+        self.levels = levels[stamped]
+# ------------------------------------------------------------------------------------- search ------------------------
+    def search(self, level, start, end, pattern):
+        """  Returns the line numbers at or above the level, between the start & end times, matching the pattern.
+        """
+        mask = (self.levels >= level) & (self.times >= start) & (self.times <= end)
+
+        if pattern is not None and mask.any():
+            found = np.zeros(len(mask), dtype=bool)
+            with self.logFile.mapped() as memMap:
+                if memMap is not None:
+                    places = [match.start() for match in pattern.finditer(memMap)]
+                    lines  = np.searchsorted(self.logFile.starts, places, side="right") - 1
+                    found[lines[lines < len(found)]] = True
+            mask &= found
+
+        return np.flatnonzero(mask)
+
+
+class FilteredLog():
+    """  The lines found by a search, across a number of log files.
+         Looks like a LogFile to the log viewer, but never changes.
+    """
+    def __init__(self, parts):
+        self.parts   = parts                    #  A list of [LogFile, line numbers], oldest first.
+        self.counts  = np.cumsum([0] + [len(lines) for _logFile, lines in parts]).tolist()
+        self.indexed = True
+
+    @property
+    def lineCount(self):
+        return self.counts[-1]
+
+    def refresh(self):
+        return False
+
+    def lines(self, first, count):
+        """  Returns a list of count lines from line first of the lines found, as text.
+        """
+        text = []
+        last = min(first + count, self.lineCount)
+        part = bisect.bisect_right(self.counts, first) - 1
+
+        while first < last and part < len(self.parts):
+            logFile, numbers = self.parts[part]
+            start = first - self.counts[part]
+            for number in numbers[start:start + last - first]:
+                text.extend(logFile.lines(int(number), 1))
+            first = self.counts[part + 1]
+            part += 1
+
+        return text
+
+
+class LogIndex(QObject):
+    """  A time and level index of the log and its rotated backups, searched in the background.
+
+         Each file is indexed once on a background thread, then only the new lines of the current log.
+         A search is by level, time and text [case is ignored] across all the files, nothing is read
+         into memory but the index - the text is searched straight through the memory map.
+    """
+    found = pyqtSignal(object)
+
+    def __init__(self, fileName, myLogger):
+        super().__init__()
+
+        self.fileName = str(fileName)
+        self.myLogger = myLogger
+        self.files    = {}                      #  [file name, FileIndex].
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LogIndex")
+# ------------------------------------------------------------------------------------- start -------------------------
+    def start(self):
+        """  Index the log and its backups in the background.
+        """
+        self.executor.submit(self.updateAll)
+# ------------------------------------------------------------------------------------- updateAll ---------------------
+    def updateAll(self):
+        """  Index any new lines, in all the log files - oldest first.
+        """
+        fileNames = lf.backups(self.fileName)[::-1] + [self.fileName]
+
+        for fileName in list(self.files):
+            if fileName not in fileNames:
+                del self.files[fileName]        #  Rotated out of the backups.
+
+        for fileName in fileNames:
+            fileIndex = self.files.get(fileName)
+            if fileIndex is None:
+                fileIndex = self.files[fileName] = FileIndex(fileName)
+            if fileName == self.fileName or not len(fileIndex.times):
+                fileIndex.update()              #  A backup does not change.
+
+        return [self.files[fileName] for fileName in fileNames]
+# ------------------------------------------------------------------------------------- search ------------------------
+    def search(self, level, start, end, text):
+        """  Search in the background, found is emitted with a FilteredLog of the lines.
+        """
+        self.executor.submit(self.runSearch, level, start, end, text)
+# ------------------------------------------------------------------------------------- runSearch ---------------------
+    def runSearch(self, level, start, end, text):
+        """  The search, run on the background thread.
+        """
+        pattern = re.compile(re.escape(text.encode("utf-8")), re.IGNORECASE) if text else None
+
+        try:
+            parts = [[fileIndex.logFile, fileIndex.search(level, start, end, pattern)] for fileIndex in self.updateAll()]
+        except (OSError, ValueError) as error:
+            self.myLogger.error(f" Cannot search the log :: {error}")
+            parts = []
+
+        self.found.emit(FilteredLog(parts))
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop the background thread, a search in progress is left to finish.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# ------------------------------------------------------------------------------------- parseLines --------------------
+def parseLines(data, starts):
+    """  Returns the times and levels of the lines starting at starts, level 0 if a line has no time stamp.
+         The format is found from the first character of the file - a { is the JSON lines log.
+    """
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.uint8)
+
+    timeAt, levelAt = FORMATS["json" if data[0] == ord("{") else "text"]
+    last            = len(data) - 1
+
+    stamps = data[np.minimum(starts[:, None] + timeAt + np.arange(STAMP), last)]
+    digits = stamps[:, DIGITS].astype(np.int64) - ord("0")
+    valid  = ((digits >= 0) & (digits <= 9)).all(axis=1) & (stamps[:, 4] == ord("-")) & (stamps[:, 13] == ord(":"))
+
+    levels = valid.astype(np.uint8)                 #  1 if the level is not known.
+    marks  = data[np.minimum(starts + levelAt, last)]
+    for mark, level in LEVELS.items():
+        levels[valid & (marks == mark)] = level
+
+    return np.where(valid, digits @ POWERS, 0), levels
+# ------------------------------------------------------------------------------------- timeKey -----------------------
+def timeKey(dateTime):
+    """  Returns a QDateTime as the digits of a log time stamp, to compare with the index.
+    """
+    return int(dateTime.toString("yyyyMMddHHmmsszzz"))
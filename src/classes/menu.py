@@ -137,6 +137,9 @@ class Menu(QMenuBar):
         self.actEquinox = QAction("Season Equinox", self)
         self.actEquinox.setObjectName("Season Equinox")
         self.actEquinox.triggered.connect(self.openInfoViewer)
+        self.actSunMoon = QAction("Sun and Moon", self)
+        self.actSunMoon.setObjectName("Sun and Moon")
+        self.actSunMoon.triggered.connect(self.openInfoViewer)
         self.actWeather = QAction("Current Weather", self)
         self.actWeather.setObjectName("Current Weather")
         self.actWeather.triggered.connect(self.openInfoViewer)
@@ -149,7 +152,7 @@ class Menu(QMenuBar):
         self.actLicence.triggered.connect(self.parent.openTextFile)
 
         self.actLogFile = QAction("Log File", self)
-        self.actLogFile.triggered.connect(self.parent.openTextFile)
+        self.actLogFile.triggered.connect(self.parent.openLogFile)
 
         self.actAbout = QAction("About", self)
         self.actAbout.triggered.connect(self.parent.openAbout)
@@ -202,6 +205,7 @@ class Menu(QMenuBar):
         mnuInfo.addAction(self.actPublicHolidays)
         mnuInfo.addAction(self.actViewCNY)
         mnuInfo.addAction(self.actEquinox)
+        mnuInfo.addAction(self.actSunMoon)
         mnuInfo.addSeparator()
         mnuInfo.addAction(self.actWeather)
 
@@ -281,11 +285,11 @@ class Menu(QMenuBar):
         """
         self.stopWatchViewer = sw.StopWatch(self.parent)
         self.stopWatchViewer.show()
-    # ----------------------------------------------------------------------------------------------------------------------- openStopWatchViewer() -
+    # ----------------------------------------------------------------------------------------------------------------------- openCountDownViewer() -
     def openCountDownViewer(self):
         """   Open the CountDown viewer.
         """
-        self.countDownViewer = cd.CountDown(self.parent, self.logger, self.config)
+        self.countDownViewer = cd.CountDown(self.parent, self.config, self.logger)
         self.countDownViewer.show()
     # ----------------------------------------------------------------------------------------------------------------------- openInfoViewer() ------
     def openInfoViewer(self):
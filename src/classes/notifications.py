@@ -0,0 +1,95 @@
+###############################################################################################################
+#    notifications.py   Copyright (C) <2026>  <Kevin Scott>                                                   #
+#                                                                                                             #
+#    A class that queues reminders and displays them as toasts.                                               #
+#                                                                                                             #
+#    import src.classes.notifications as nt                                                                   #
+#                                                                                                             #
+#    notifications = nt.Notifications(parent, myLogger)                                                       #
+#                                                                                                             #
+#    notifications.add(text)     Queue a reminder.                                                            #
+#    notifications.flush()       Display all queued reminders, as one toast if more then one.                 #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+from pyqttoast import Toast, ToastPreset
+
+
+class Notifications():
+    """  A class that queues reminders and displays them as toasts.
+
+         When pyKlock starts after a long break, a lot of events can become due in the same minute.
+         Rather then stack a permanent toast for each, the reminders are queued and displayed in
+         one summary toast when flushed.
+
+         The number of toasts on screen at once is capped, any more are held by pyqttoast until
+         one is closed.
+    """
+    MAX_ON_SCREEN = 3           #  Number of toasts that can be displayed at once.
+    MAX_LINES     = 10          #  Number of reminders listed in a summary toast.
+# ------------------------------------------------------------------------------------- __init__ ----------------------
+    def __init__(self, parent, myLogger, title="Event Reminder"):
+        self.parent   = parent
+        self.myLogger = myLogger
+        self.title    = title
+        self.pending  = []
+
+        Toast.setMaximumOnScreen(self.MAX_ON_SCREEN)
+# ------------------------------------------------------------------------------------- add ---------------------------
+    def add(self, text):
+        """  Queue a reminder, it will be displayed on the next flush.
+        """
+        self.pending.append(text)
+# ------------------------------------------------------------------------------------- numberPending -----------------
+    @property
+    def numberPending(self):
+        """  Returns the number of reminders waiting to be displayed.
+        """
+        return len(self.pending)
+# ------------------------------------------------------------------------------------- flush -------------------------
+    def flush(self):
+        """  Display the queued reminders.
+
+             A single reminder is displayed on its own, more then one are coalesced into a summary toast.
+             Returns the toast, or None if there was nothing to display.
+        """
+        if not self.pending:
+            return None
+
+        if len(self.pending) == 1:
+            title = self.title
+            text  = self.pending[0]
+        else:
+            title = f"{self.title}s  [{len(self.pending)}]"
+            lines = self.pending[:self.MAX_LINES]
+            extra = len(self.pending) - len(lines)
+            if extra:
+                lines.append(f" ... and {extra} more.")
+            text = "\n".join(lines)
+
+        self.myLogger.info(f" Displaying {len(self.pending)} reminder(s).")
+        self.pending = []
+
+        toast = Toast(self.parent)
+        toast.setDuration(0)        #  Do not timeout.
+        toast.applyPreset(ToastPreset.INFORMATION_DARK)
+        toast.setTitle(title)
+        toast.setText(text)
+        toast.show()
+
+        return toast
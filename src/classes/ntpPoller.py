@@ -0,0 +1,241 @@
+###############################################################################################################
+#    ntpPoller.py   Copyright (C) <2026>  <Kevin Scott>                                                       #
+#                                                                                                             #
+#    Polls a pool of NTP servers in the background, and keeps the last good offset and delay.                 #
+#                                                                                                             #
+#    import src.classes.ntpPoller as ntpp                                                                     #
+#                                                                                                             #
+#    poller = ntpp.getNTPPoller(myConfig, myLogger)                                                           #
+#                                                                                                             #
+#    poller.sample                   The last good sample, or None if no server has answered yet.             #
+#    poller.now()                    The NTP time now, interpolated from the last good sample.                #
+#    poller.pollNow()                Wake the poller, to poll straight away.                                  #
+#    poller.close()                  Stop the poller thread, called when pyKlock closes.                      #
+#                                                                                                             #
+#    poller.sampled(sample)          Signal - a new good sample.                                              #
+#    poller.failed(message)          Signal - no server answered.                                             #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import time
+import threading
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from functools import lru_cache
+
+import ntplib
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+STEADY_OFFSET = 0.005                   #  Offsets that move less then this between polls, let the poll interval grow.
+
+#  A sample from a NTP server.
+#      offset, delay and rootDelay are in seconds, mono is time.monotonic() and wall is time.time() when received.
+Sample = namedtuple("Sample", ["server", "offset", "delay", "rootDelay", "stratum", "mono", "wall"])
+
+
+class NTPPoller(QObject):
+    """  Polls a pool of NTP servers in the background, on its own thread.
+
+         All the servers are queried in parallel, the sample with the shortest round trip delay is kept.
+         A server is either a host name or host:port, so it can be pointed at a local UDP server for testing.
+
+         The poll interval is 2 ** pollExp seconds, between minPoll and maxPoll as RFC 5905 [64s to 1024s default].
+             If the offset is steady, the interval is doubled.
+             If the offset has moved, the interval is halved.
+             If no server answers, the interval is doubled - backing off until a server answers.
+
+         Between polls the NTP time is interpolated from the last good sample, no network is used.
+    """
+    sampled = pyqtSignal(object)
+    failed  = pyqtSignal(str)
+
+    def __init__(self, myLogger, servers, minPoll=6, maxPoll=10, timeout=2):
+        super().__init__()
+
+        self.myLogger = myLogger
+        self.servers  = []
+        self.minPoll  = minPoll
+        self.maxPoll  = max(minPoll, maxPoll)
+        self.timeout  = timeout
+        self.pollExp  = minPoll
+        self.failures = 0
+        self.sample   = None                    #  The last good sample.
+        self.nextPoll = time.monotonic()        #  When the next poll is due, in time.monotonic().
+        self.thread   = None
+        self.stopping = threading.Event()
+        self.wake     = threading.Event()
+
+        for server in servers:
+            try:
+                self.servers.append(self.parseServer(server))
+            except ValueError as error:
+                myLogger.warning(f" NTP server {server!r} passed over :: {error}")
+
+        self.executor = ThreadPoolExecutor(max_workers=max(1, len(self.servers)), thread_name_prefix="NTP")
+# ------------------------------------------------------------------------------------- parseServer -------------------
+    @staticmethod
+    def parseServer(server):
+        """  Splits a server into [host, port], the port defaults to the NTP port 123.
+             A server is host, host:port, an IPv6 address or [IPv6 address]:port.
+             Raises ValueError if the server can not be understood.
+        """
+        text = str(server).strip()
+
+        if text.startswith("["):                                #  [IPv6 address] or [IPv6 address]:port.
+            host, bracket, port = text[1:].partition("]")
+            if not bracket or (port and not port.startswith(":")):
+                raise ValueError("expected [address]:port")
+            port = port[1:]
+        elif text.count(":") > 1:                               #  An IPv6 address, without a port.
+            host, port = text, ""
+        else:
+            host, _sep, port = text.rpartition(":") if ":" in text else (text, "", "")
+
+        if not host:
+            raise ValueError("no host")
+        if not port:
+            return [host, 123]
+        if not port.isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"bad port {port!r}")
+
+        return [host, int(port)]
+# ------------------------------------------------------------------------------------- start -------------------------
+    def start(self):
+        """  Start the poller thread, the first poll is straight away.
+        """
+        if self.thread and self.thread.is_alive():
+            return
+
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="NTPPoller", daemon=True)
+        self.thread.start()
+        self.myLogger.info(f" NTP poller started :: {[f'{host}:{port}' for host, port in self.servers]}")
+# ------------------------------------------------------------------------------------- run ---------------------------
+    def run(self):
+        """  The poller thread, polls then sleeps until the next poll is due or it is woken.
+        """
+        while not self.stopping.is_set():
+            try:
+                self.poll()
+            except (RuntimeError, CancelledError):      #  The executor has been shut down, pyKlock is closing.
+                break
+
+            self.wake.wait(max(0, self.nextPoll - time.monotonic()))
+            self.wake.clear()
+# ------------------------------------------------------------------------------------- poll --------------------------
+    def poll(self):
+        """  Query all the servers in parallel, keep the best sample and work out the next poll interval.
+             Returns the best sample, or None if no server answered.
+        """
+        results = self.executor.map(self.query, self.servers)
+        samples = [sample for sample in results if sample]
+
+        if samples:
+            best = min(samples, key=lambda sample: sample.delay)
+
+            if self.sample and abs(best.offset - self.sample.offset) < STEADY_OFFSET:
+                self.pollExp = min(self.pollExp + 1, self.maxPoll)
+            elif self.sample:
+                self.pollExp = max(self.pollExp - 1, self.minPoll)
+
+            self.failures = 0
+            self.sample   = best
+            self.myLogger.debug(f" NTP sample {best.server} :: offset {best.offset:+.4f}s :: delay {best.delay:.4f}s :: poll {2 ** self.pollExp}s")
+            self.sampled.emit(best)
+        else:
+            best          = None
+            self.failures += 1
+            self.pollExp  = min(self.pollExp + 1, self.maxPoll)
+            self.myLogger.warning(f" No response from any NTP server :: failures {self.failures} :: poll {2 ** self.pollExp}s")
+            self.failed.emit("No response from any NTP server")
+
+        self.nextPoll = time.monotonic() + 2 ** self.pollExp
+
+        return best
+# ------------------------------------------------------------------------------------- query -------------------------
+    def query(self, server):
+        """  Query a single server, returns a sample or None if the server did not answer.
+             A new client each time, so the queries can run in parallel.
+        """
+        host, port = server
+
+        try:
+            response = ntplib.NTPClient().request(host, version=3, port=port, timeout=self.timeout)
+        except (ntplib.NTPException, OSError) as error:
+            self.myLogger.debug(f" NTP server {host}:{port} :: {error}")
+            return None
+
+        return Sample(f"{host}:{port}", response.offset, response.delay, response.root_delay,
+                      response.stratum, time.monotonic(), time.time())
+# ------------------------------------------------------------------------------------- now ---------------------------
+    def now(self):
+        """  Returns the NTP time now, as time.time() seconds, interpolated from the last good sample.
+             Returns None if no server has answered yet.
+        """
+        sample = self.sample
+        if sample is None:
+            return None
+
+        return time.time() + sample.offset
+# ------------------------------------------------------------------------------------- age ---------------------------
+    @property
+    def age(self):
+        """  Returns the seconds since the last good sample, or None.
+        """
+        sample = self.sample
+        if sample is None:
+            return None
+
+        return time.monotonic() - sample.mono
+# ------------------------------------------------------------------------------------- secondsToPoll -----------------
+    @property
+    def secondsToPoll(self):
+        """  Returns the seconds until the next poll.
+        """
+        return max(0, self.nextPoll - time.monotonic())
+# ------------------------------------------------------------------------------------- pollNow -----------------------
+    def pollNow(self):
+        """  Wake the poller, to poll straight away.
+        """
+        self.nextPoll = time.monotonic()
+        self.wake.set()
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop the poller thread, called when pyKlock closes.
+             A query in flight is left to time out on its own, the threads are daemons.
+        """
+        self.stopping.set()
+        self.wake.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+        if self.thread:
+            self.thread.join(self.timeout)
+            self.myLogger.info(" NTP poller stopped.")
+
+# ------------------------------------------------------------------------------------- getNTPPoller ------------------
+@lru_cache(maxsize=None)
+def getNTPPoller(myConfig, myLogger):
+    """  Returns the NTP poller, there is only one - so the servers are not polled more then needed.
+         Created and started on the first call, and re-used on further calls.
+    """
+    poller = NTPPoller(myLogger, myConfig.NTP_SERVERS, myConfig.NTP_MIN_POLL, myConfig.NTP_MAX_POLL)
+    poller.start()
+
+    return poller
@@ -0,0 +1,146 @@
+###############################################################################################################
+#    recurrence.py   Copyright (C) <2026>  <Kevin Scott>                                                      #
+#                                                                                                             #
+#    Works out when an event next occurs, using the Recurring column of the events store.                     #
+#                                                                                                             #
+#    import src.classes.recurrence as rc                                                                      #
+#                                                                                                             #
+#    recurrence = rc.Recurrence(myLogger)                                                                     #
+#                                                                                                             #
+#    recurrence.nextOccurrence(key, rule, dtStart, now)   Returns the next occurrence of an event.            #
+#    recurrence.cached(key, rule, text, now)              The cached occurrence if still valid, else None.    #
+#    recurrence.invalidate(key)                           Forgets a cached occurrence, after an edit.         #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import datetime
+
+from dateutil import rrule
+
+RULES = ["", "Yearly", "Monthly", "Weekly", "Daily", "Once"]       #  The named rules, offered in the Add Event window.
+
+
+class Recurrence():
+    """  A class that works out when an event next occurs.
+
+         The Recurring column of an event can hold -
+            ""  or "False" or "True"  -  Yearly, events have always been rolled forward a year, so keep doing so.
+            "Yearly", "Monthly", "Weekly" or "Daily".
+            "Once"                    -  The event does not repeat, once passed it stays passed.
+            An RFC 5545 RRULE         -  i.e. "FREQ=MONTHLY;BYDAY=1MO" or "RRULE:FREQ=WEEKLY;INTERVAL=2;COUNT=10".
+
+         The next occurrence of each event is cached, and only worked out again once that occurrence
+         has passed [or the event has been edited] - rather than every minute for every event.
+
+         An occurrence is treated as passed once its date is before today, so an event stays due all of its day.
+    """
+# ------------------------------------------------------------------------------------- __init__ ----------------------
+    def __init__(self, myLogger):
+        self.myLogger = myLogger
+        self.cache    = {}          #  key : [occurrence, rule, dtStart, final, text]
+# ------------------------------------------------------------------------------------- nextOccurrence ----------------
+    def nextOccurrence(self, key, rule, dtStart, now, text=None):
+        """  Returns the next occurrence, as a datetime, of the event on or after today.
+
+             If the event has no more occurrences [Once, or a RRULE with a COUNT or UNTIL], the last
+             occurrence is returned - which will be in the past.
+
+             rule    - the Recurring column of the event.
+             dtStart - the original due date and time of the event, as a datetime.
+             now     - the current datetime.
+             text    - the due date and time as stored, so cached() can be checked without parsing them.
+        """
+        cached = self.cache.get(key)
+
+        if cached and cached[1] == rule and cached[2] == dtStart:
+            if cached[3] or cached[0].date() >= now.date():
+                cached[4] = text
+                return cached[0]                                #  Still valid, no need to work it out again.
+
+        occurrence, final = self.__findOccurrence(rule, dtStart, now)
+        self.cache[key]   = [occurrence, rule, dtStart, final, text]
+
+        return occurrence
+# ------------------------------------------------------------------------------------- cached ------------------------
+    def cached(self, key, rule, text, now):
+        """  Returns the cached next occurrence of an event, if still valid - else None.
+             text is the due date and time as stored, so nothing needs to be parsed to check the cache.
+        """
+        cached = self.cache.get(key)
+
+        if cached and cached[4] is not None and cached[1] == rule and cached[4] == text:
+            if cached[3] or cached[0].date() >= now.date():
+                return cached[0]
+
+        return None
+# ------------------------------------------------------------------------------------- invalidate --------------------
+    def invalidate(self, key=None):
+        """  Forget the cached occurrence of an event, or of all events if no key is given.
+        """
+        if key is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(key, None)
+# ------------------------------------------------------------------------------------- __findOccurrence --------------
+    def __findOccurrence(self, rule, dtStart, now):
+        """  Works out the first occurrence of the event on or after today.
+
+             Returns the occurrence and a flag, True if there will never be another occurrence.
+        """
+        recurrence = self.__parseRule(rule, dtStart)
+
+        if recurrence is None:                                  #  A one off event.
+            return dtStart, True
+
+        today      = datetime.datetime.combine(now.date(), datetime.time.min)
+        occurrence = recurrence.after(today, inc=True)
+
+        if occurrence is None:                                  #  The rule has run out, return the last occurrence.
+            occurrence = recurrence.before(today) or dtStart
+            return occurrence, True
+
+        return occurrence, False
+# ------------------------------------------------------------------------------------- __parseRule -------------------
+    def __parseRule(self, rule, dtStart):
+        """  Converts the Recurring column of an event into a dateutil rrule.
+
+             Returns None if the event does not repeat.
+             If the rule cannot be understood, an error is logged and the event is treated as yearly.
+        """
+        text = rule.strip()
+
+        match text.upper():
+            case "" | "FALSE" | "TRUE" | "YEARLY":
+                return rrule.rrule(rrule.YEARLY, dtstart=dtStart)
+            case "MONTHLY":
+                return rrule.rrule(rrule.MONTHLY, dtstart=dtStart)
+            case "WEEKLY":
+                return rrule.rrule(rrule.WEEKLY, dtstart=dtStart)
+            case "DAILY":
+                return rrule.rrule(rrule.DAILY, dtstart=dtStart)
+            case "ONCE" | "NONE":
+                return None
+
+        if not text.upper().startswith("RRULE:"):
+            text = f"RRULE:{text}"
+
+        try:
+            return rrule.rrulestr(text, dtstart=dtStart, forceset=True)
+        except (ValueError, TypeError) as e:
+            self.myLogger.error(f" Unknown recurring rule {rule} : {e}")
+            return rrule.rrule(rrule.YEARLY, dtstart=dtStart)
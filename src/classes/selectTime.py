@@ -56,7 +56,10 @@ class SelectTime:
         """ Returns a function to return the time at position in timeTypes."""
         return self.__funcs[position](self)
 
-    #def __init__(self):
+    def __init__(self, clock=None):
+        """  clock is an optional clock discipline, if given all times are NTP corrected [if TIME_DISCIPLINED].
+        """
+        self.__clock = clock
         #logging.basicConfig(filename='selectTime.log',
                             #filemode='w',
                             #format='%(name)s - %(levelname)s - %(message)s',
@@ -68,25 +71,37 @@ class SelectTime:
 #
 # The time functions can't be made property's, this seems to upset the dictionary of functions - they are not callable.
 #
+    def __timeStamp(self):
+        """  returns now as time.time() seconds, from the clock discipline if given."""
+        return self.__clock.now() if self.__clock else time.time()
+
+    def __localNow(self):
+        """  returns now as a local datetime."""
+        return datetime.datetime.fromtimestamp(self.__timeStamp())
+
+    def __utcNow(self):
+        """  returns now as a naive UTC datetime, as datetime.utcnow()."""
+        return datetime.datetime.fromtimestamp(self.__timeStamp(), datetime.timezone.utc).replace(tzinfo=None)
+
     def __getNowTime(self):
         """  returns now as hour, minutes and seconds"""
-        now = datetime.datetime.now()
+        now = self.__localNow()
 
         return now.hour, now.minute, now.second
 # ------------------------------------------------------------------------------------- getGMTTime --------------------
     def getGMTTime(self):
         """ returns current time as GMT."""
-        return time.strftime("%H:%M:%S", time.gmtime())
+        return time.strftime("%H:%M:%S", time.gmtime(self.__timeStamp()))
 
 # ------------------------------------------------------------------------------------- getLocalTime -------------------
     def getLocalTime(self):
         """ returns current time as Local time."""
-        return time.strftime("%H:%M:%S", time.localtime())
+        return time.strftime("%H:%M:%S", time.localtime(self.__timeStamp()))
 
 # ------------------------------------------------------------------------------------- getUTCTim ----------------------
     def getUTCTime(self):
         """ returns current time as UTC time."""
-        return "{:%H:%M:%S}".format(datetime.datetime.utcnow())
+        return "{:%H:%M:%S}".format(self.__utcNow())
 
 # ------------------------------------------------------------------------------------- getFuzzyTime -------------------
     def getFuzzyTime(self):
@@ -178,7 +193,7 @@ class SelectTime:
               see http://en.wikipedia.org/wiki/Swatch_Internet_Time
         """
 
-        __utcNow = datetime.datetime.utcnow()
+        __utcNow = self.__utcNow()
         __utcPlus1 = __utcNow + datetime.timedelta(hours=+1)
         __noOfSeconds = (__utcPlus1.hour * 3600) + (__utcPlus1.minute * 60) + __utcPlus1.second
         __noOfBeats = __noOfSeconds / 86.4
@@ -196,7 +211,7 @@ class SelectTime:
               see http://en.wikipedia.org/wiki/New_Earth_Time
         """
 
-        __utcNow = datetime.datetime.utcnow()
+        __utcNow = self.__utcNow()
 
         __hour = __utcNow.hour
         __mins = __utcNow.minute
@@ -214,7 +229,7 @@ class SelectTime:
               Formulae pinched from http://en.wikipedia.org/wiki/Julian_day
         """
 
-        now = datetime.datetime.utcnow()
+        now = self.__utcNow()
 
         a = (14 - now.month) / 12
         y = now.year + 4800 - a
@@ -349,7 +364,7 @@ class SelectTime:
         """
 
         __SolDataEpoch = datetime.datetime(day=6, month=1, year=2000)
-        __utcNow = datetime.datetime.utcnow()
+        __utcNow = self.__utcNow()
         __daysSinceEpoch = (__utcNow - __SolDataEpoch).days + (__utcNow - __SolDataEpoch).seconds / 86400
         __MarsSolDate = (__daysSinceEpoch / 1.027491252) + 44796.0 - 0.00096
 
@@ -363,7 +378,7 @@ class SelectTime:
         """
 
         __SolDataEpoch = datetime.datetime(day=6, month=1, year=2000)
-        __utcNow = datetime.datetime.utcnow()
+        __utcNow = self.__utcNow()
         __daysSinceEpoch = (__utcNow - __SolDataEpoch).days + (__utcNow - __SolDataEpoch).seconds / 86400
 
         __marsSolDate = (__daysSinceEpoch / 1.027491252) + 44796.0 - 0.00096
@@ -422,7 +437,7 @@ class SelectTime:
         Unix time, or POSIX time, is a system for describing instants in time, defined as the number of seconds
         elapsed since midnight Coordinated Universal Time (UTC) of Thursday, January 1, 1970  """
 
-        __tday = datetime.datetime.utcnow()
+        __tday = self.__utcNow()
         __epoch = datetime.datetime(1970, 1, 1)
         __secs = (__tday - __epoch).total_seconds()
 
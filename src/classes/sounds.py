@@ -6,6 +6,9 @@
 #                                                                                                             #
 #    23 January 2026 - Amended playPips to play at a given volume.                                            #
 #    16 April 2026   - Added playAlarm().                                                                     #
+#    19 October 2026 - Sounds are now decoded once and played from memory by the sound engine.                #
+#                      The chimes are now scheduled ahead, to start on the second.                            #
+#                      playPips and playAlarm return an id, the sound can be cancelled.                       #
 #                                                                                                             #
 ###############################################################################################################
 #                                                                                                             #
@@ -21,7 +24,11 @@
 #                                                                                                             #
 #      self.sounds      = snds.Sounds(self.myConfig)                                                          #
 #                                                                                                             #
-#      self.sounds.playSounds()  - will play sounds depending upon options.                                   #
+#      self.sounds.scheduleChimes()  - will schedule the next chime depending upon options.                   #
+#      id = self.sounds.playPips(volume)   - play the pips, returns straight away.                            #
+#      id = self.sounds.playAlarm(volume)  - play the alarm, returns straight away.                           #
+#      self.sounds.cancel(id)              - stop a sound early.                                              #
+#      self.sounds.finished                - signal [id, completed] fired when a sound has ended.             #
 #                                                                                                             #
 #      Current options -                                                                                      #
 #                       Play chimes ever hour.                                                                #
@@ -35,11 +42,14 @@
 #                                                                                                             #
 ###############################################################################################################
 
-from audioplayer import AudioPlayer
+import time
+import datetime
 
 from PyQt6.QtWidgets import QMessageBox
 
 import src.projectPaths as pp
+import src.classes.audioEngine as ae
+import src.classes.clockDiscipline as cd
 
 
 class Sounds():
@@ -50,11 +60,26 @@ class Sounds():
          If SOUNDS_HOUR_CHIMES is called then Westminster type chimes are played on the hour.
          If SOUNDS_QUARTER_CHIMES is called then Westminster type chimes are played on the quarter hour.
          If SOUNDS_HOUR_PIPS is called then the BBC type pips are played on the hour.
+
+         The sounds are played by the shared sound engine, which holds them decoded in memory.
+         The quarter chimes, pips, alarm and the next hour chime are decoded at start up,
+         after each chime the next hour chime is decoded ready.
+
+         The next chime is scheduled ahead with the sound engine, against a monotonic deadline.
+         So it starts on the quarter, rather then when the one second klock timer notices a new minute.
+         The pips are started early, so the long final pip marks the hour.
     """
+    PRE_ROLL = {"thepips.mp3": 6.0}         #  Seconds from the start of the sound to the moment it marks.
 
     def __init__(self, myConfig, myLogger, check=True):
         self.myConfig = myConfig
         self.myLogger = myLogger
+        self.engine   = ae.getAudioEngine(myLogger)
+        self.clock    = cd.getClockDiscipline(myConfig, myLogger)
+        self.started  = self.engine.started
+        self.finished = self.engine.finished
+
+        self.armed    = None                #  The chime scheduled with the engine - [boundary, path, id].
 
         self.strHour = {
             0  : "twelve",
@@ -73,67 +98,129 @@ class Sounds():
 
         if check:
             self.checkHourChimes()
-# ------------------------------------------------------------------------------------- playSounds ----------------------
-    def playSounds(self, timeText):
-        """  Called to play the actual sounds.
-             The config file should of been read in __init__.
+
+        self.preloadSounds(datetime.datetime.now().hour + 1)
+# ------------------------------------------------------------------------------------- scheduleChimes ------------------
+    def scheduleChimes(self):
+        """  Schedule the chime for the next quarter hour with the sound engine.
+
+             Called every minute, the chime is only scheduled again if the boundary or sound has changed.
+             The wall clock boundary is converted into a monotonic deadline, less any pre roll of the sound.
+             The wall clock is NTP corrected if TIME_DISCIPLINED, so the chimes agree with the klock.
         """
-        hours    = int(timeText[0:2])
-        minutes  = int(timeText[3:5])
-        sndPath  = ""
+        wallNow   = self.clock.nowDateTime()
+        monoNow   = time.monotonic_ns()
+        hourStart = wallNow.replace(minute=0, second=0, microsecond=0)
+        boundary  = hourStart + datetime.timedelta(minutes=15 * (wallNow.minute // 15 + 1))
+        sndPath   = self.chimeFor(boundary.hour, boundary.minute)
 
-        if minutes not in [0, 15, 30, 45]:      #  Only process further if on the hour or a quarter.
+        if self.armed and self.armed[:2] == [boundary, sndPath]:
+            return
+
+        if not sndPath:
+            self.cancelChimes()
             return
 
-        if hours > 12:
-            hours -= 12                         #  Work on a 12 hour klock.
+        preRoll  = self.PRE_ROLL.get(sndPath.split("\\")[-1], 0.0)
+        delay    = (boundary - wallNow).total_seconds() - preRoll
+        deadline = monoNow + int(delay * 1_000_000_000)
+
+        id         = self.engine.schedule(sndPath, self.myConfig.SOUNDS_VOLUME, deadline, ae.MIX)
+        self.armed = [boundary, sndPath, id]
+        self.myLogger.debug(f" Chime scheduled for {boundary:%H:%M:%S} :: {sndPath} :: pre roll {preRoll}s")
+
+        self.preloadSounds(boundary.hour + 1)        #  Have the next hour chime decoded ready.
+# ------------------------------------------------------------------------------------- cancelChimes --------------------
+    def cancelChimes(self):
+        """  Cancel any scheduled chime, i.e. if sounds have been switched off.
+        """
+        if self.armed:
+            self.engine.cancel(self.armed[2])
+            self.armed = None
+# ------------------------------------------------------------------------------------- chimeFor ------------------------
+    def chimeFor(self, hours, minutes):
+        """  Returns the path of the sound to be played at the given time, depending upon options.
+             Returns "" if nothing is to be played.
+        """
+        sndPath = ""
+
+        if minutes not in [0, 15, 30, 45]:      #  Only process further if on the hour or a quarter.
+            return sndPath
 
-        if self.myConfig.SOUNDS_HOUR_CHIMES:
-            if minutes == 0:
-                if self.myConfig.SOUNDS_WESTMINSTER:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\westminster\\{self.strHour[hours]}.mp3"
-                if self.myConfig.SOUNDS_CUCKOO:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\cuckoo\\{self.strHour[hours]}.mp3"
-                if self.myConfig.SOUNDS_HOUR_PIPS:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\thepips.mp3"
+        if self.myConfig.SOUNDS_HOUR_CHIMES and minutes == 0:
+            sndPath = self.hourChime(hours)
 
         if self.myConfig.SOUNDS_QUARTER_CHIMES:
             match minutes:
                 case 15:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\westminster\\quarterchime.mp3"
+                    sndPath = self.soundPath("westminster\\quarterchime.mp3")
                 case 30:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\westminster\\halfchime.mp3"
+                    sndPath = self.soundPath("westminster\\halfchime.mp3")
                 case 45:
-                    sndPath = f"{pp.RESOURCE_PATH}\\Sounds\\westminster\\threequarterchime.mp3"
-
-        if sndPath:
-            # Playback stops when the object is destroyed (GC"ed), so save a reference to the object for non-blocking playback.
-            try:
-                self.player = AudioPlayer(sndPath)
-                self.player.volume = self.myConfig.SOUNDS_VOLUME
-                self.player.play(block=False)
-            except Exception as e:
-                self.myLogger.error(f"Error {e}")
+                    sndPath = self.soundPath("westminster\\threequarterchime.mp3")
+
+        return sndPath
+# ------------------------------------------------------------------------------------- hourChime -----------------------
+    def hourChime(self, hours):
+        """  Returns the path of the hour chime for the given hour, depending upon options.
+             Returns "" if no hour chime is selected.
+        """
+        hours = hours % 12                          #  Work on a 12 hour klock, 0 is twelve.
+
+        if self.myConfig.SOUNDS_HOUR_PIPS:
+            return self.soundPath("thepips.mp3")
+        if self.myConfig.SOUNDS_CUCKOO:
+            return self.soundPath(f"cuckoo\\{self.strHour[hours]}.mp3")
+        if self.myConfig.SOUNDS_WESTMINSTER:
+            return self.soundPath(f"westminster\\{self.strHour[hours]}.mp3")
+
+        return ""
+# ------------------------------------------------------------------------------------- soundPath -----------------------
+    def soundPath(self, name):
+        """  Returns the full path of a sound file.
+        """
+        return f"{pp.RESOURCE_PATH}\\Sounds\\{name}"
+# ------------------------------------------------------------------------------------- preloadSounds -------------------
+    def preloadSounds(self, nextHour):
+        """  Have the sound engine decode the sounds that will be needed soon.
+             These are the quarter chimes, the pips, the alarm and the hour chime for nextHour.
+             Sounds already decoded are skipped by the engine.
+        """
+        paths = [self.soundPath("westminster\\quarterchime.mp3"),
+                 self.soundPath("westminster\\halfchime.mp3"),
+                 self.soundPath("westminster\\threequarterchime.mp3"),
+                 self.soundPath("thepips.mp3"),
+                 self.soundPath("alarm.mp3")]
+
+        hourChime = self.hourChime(nextHour)
+        if hourChime:
+            paths.append(hourChime)
+
+        self.engine.preload(paths)
 # ------------------------------------------------------------------------------------- playPips ------------------------
-    def playPips(self, volume):
+    def playPips(self, volume, policy=ae.MIX):
         """  Enable the pips to be played to test the volume.
+             Plays along side any chime or alarm by default, so a test does not silence them.
+             Returns straight away with the id of the sound, the finished signal is fired when played.
         """
-        try:
-            player = AudioPlayer(f"{pp.RESOURCE_PATH}\\Sounds\\thepips.mp3")
-            player.volume = volume
-            player.play(block=True)
-        except Exception as e:
-            self.myLogger.error(f"Error {e}")
+        return self.engine.play(self.soundPath("thepips.mp3"), volume, policy)
 # ------------------------------------------------------------------------------------- playAlarm -----------------------
-    def playAlarm(self, volume):
-        """  Plays an alarm sound.
+    def playAlarm(self, volume, policy=ae.MIX):
+        """  Plays an alarm sound, along side any chime by default.
+             Returns straight away with the id of the sound, the finished signal is fired when played.
+        """
+        return self.engine.play(self.soundPath("alarm.mp3"), volume, policy)
+# ------------------------------------------------------------------------------------- cancel --------------------------
+    def cancel(self, id):
+        """  Stop a sound early, or remove it from the queue.
+        """
+        if id:
+            self.engine.cancel(id)
+# ------------------------------------------------------------------------------------- close ---------------------------
+    def close(self):
+        """  Stop the sound engine, called when pyKlock closes.
         """
-        try:
-            player = AudioPlayer(f"{pp.RESOURCE_PATH}\\Sounds\\alarm.mp3")
-            player.volume = volume
-            player.play(block=True)
-        except Exception as e:
-            self.myLogger.error(f"Error {e}")
+        self.engine.close()
 # ------------------------------------------------------------------------------------- checkHourChimes -----------------
     def checkHourChimes(self):
         """  There should be one and only one hour chime selected.
@@ -5,6 +5,7 @@
 #     For changes see history.txt                                                                             #
 #                                                                                                             #
 #     March 2026    Changed the timer to use timer.perf_Counter()                                             #
+#     October 2026  Whole nanoseconds from time.perf_counter_ns(), with laps and splits.                      #
 #                                                                                                             #
 ###############################################################################################################
 #    Copyright (C) <2022>  <Kevin Scott>                                                                      #
@@ -22,61 +23,107 @@
 #                                                                                                             #
 ###############################################################################################################
 
+
+import csv
 import time
 
-from datetime import timedelta
+from collections import namedtuple
+
+Lap = namedtuple("Lap", ["number", "lapNs", "splitNs"])     #  A lap, its own time and the total at its end.
+
 
 class timer():
     """  A Simple class that implements a stopwatch.
 
+         The time is kept as whole nanoseconds from time.perf_counter_ns(), so nothing is lost to rounding
+         however long the stopwatch runs.  The stopwatch does no work of its own, the time is only worked
+         out when asked for.
+
     usage:
         stopwatch = timer()
-        stopwatch.start()           Starts the stopwatch.
-        stopwatch.stop()            Stops the stopwatch, stops the ticks.
-        stopwatch.pause()           Pauses the stopwatch, the ticks still continue.
-        stopwatch.elapsedTime       Return the current value of the stopwatch.
-        stopwatch.timerRunning      Returns True if the stopwatch has been started.
+        stopwatch.start()           Starts the stopwatch, from zero.
+        stopwatch.stop()            Stops the stopwatch.
+        stopwatch.pause()           Pauses the stopwatch.
+        stopwatch.resume()          Carries on after a pause.
+        stopwatch.lap()             Records a lap, returns it as a Lap.
+        stopwatch.laps              The laps recorded, a list of Lap.
+        stopwatch.elapsedNs         Return the current value of the stopwatch, in nanoseconds.
+        stopwatch.elapsedTime       Return the current value of the stopwatch, as 00:00:00.00.
+        stopwatch.timerRunning      Returns True if the stopwatch is running.
+        stopwatch.exportCSV(name)   Writes the laps to a CSV file.
     """
 
     def __init__(self):
-        self.isRunning = False
-        self.startTime = 0
+        self.clear()
 
     def start(self):
+        self.clear()
         self.isRunning = True
-        self.startTime = time.perf_counter()
+        self.startNs   = time.perf_counter_ns()
 
     def stop(self):
-        self.isRunning = False
+        self.pause()
 
     def clear(self):
-        self.isRunning  = False
-        self.start_time = 0
-        self.duration   = "00:00:00.000000"
+        self.isRunning = False
+        self.startNs   = 0
+        self.heldNs    = 0                      #  The time run up to the last pause.
+        self.laps      = []
 
     def pause(self):
-        self.isRunning = False
+        if self.isRunning:
+            self.heldNs   += time.perf_counter_ns() - self.startNs
+            self.isRunning = False
 
     def resume(self):
-        self.isRunning = True
+        if not self.isRunning:
+            self.startNs   = time.perf_counter_ns()
+            self.isRunning = True
+
+    def lap(self):
+        """  Records a lap, the time since the last lap and the total time so far [the split].
+        """
+        splitNs = self.elapsedNs
+        lastNs  = self.laps[-1].splitNs if self.laps else 0
+        newLap  = Lap(len(self.laps) + 1, splitNs - lastNs, splitNs)
+        self.laps.append(newLap)
+
+        return newLap
 
     @property
     def timerRunning(self):
         return self.isRunning
 
+    @property
+    def elapsedNs(self):
+        """  Returns the current value in nanoseconds, while paused or stopped the time when it was paused.
+        """
+        if self.isRunning:
+            return self.heldNs + time.perf_counter_ns() - self.startNs
+        return self.heldNs
+
     @property
     def elapsedTime(self):
-            """  Returns the current value [ticks] in hours, minutes seconds {00:00:00}
-
-                If the stopwatch is paused return the paused time.
-
-                If the stopwatch is not running "00:00:00.00" is returned.
-                    The [-4] is used to truncate to 2 decimal places.
-            """
-            if self.timerRunning:
-                self.duration = str(timedelta(seconds=time.perf_counter()- self.startTime))
-                return self.duration[:-4]
-            if self.startTime == 0:
-                return "00:00:00.00"
-            else:
-                return self.duration[:-4]
+        """  Returns the current value in hours, minutes seconds and hundredths {00:00:00.00}
+        """
+        return formatNs(self.elapsedNs)
+
+    def exportCSV(self, fileName):
+        """  Writes the laps to a CSV file, the times as text and as nanoseconds.
+        """
+        with open(fileName, "w", newline="", encoding="utf-8") as csvFile:     # In context manager.
+            writer = csv.writer(csvFile)
+            writer.writerow(["Lap", "Lap Time", "Split", "Lap ns", "Split ns"])
+            for lap in self.laps:
+                writer.writerow([lap.number, formatNs(lap.lapNs), formatNs(lap.splitNs), lap.lapNs, lap.splitNs])
+
+# ----------------------------------------------------------------------------------------------------------------------- formatNs() ------------
+def formatNs(ns):
+    """  Returns nanoseconds as hours, minutes seconds and hundredths {00:00:00.00}, the hundredths are truncated.
+    """
+    hundredths     = ns // 10_000_000
+    seconds, hund  = divmod(hundredths, 100)
+    minutes, secs  = divmod(seconds, 60)
+    hours, mins    = divmod(minutes, 60)
+
+    return f"{hours:02d}:{mins:02d}:{secs:02d}.{hund:02d}"
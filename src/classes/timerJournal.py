@@ -0,0 +1,127 @@
+###############################################################################################################
+#    timerJournal.py   Copyright (C) <2026>  <Kevin Scott>                                                    #
+#                                                                                                             #
+#    A small journal on disc of the count downs and alarms, so they survive pyKlock being closed.             #
+#                                                                                                             #
+#    import src.classes.timerJournal as tj                                                                    #
+#                                                                                                             #
+#    journal = tj.TimerJournal(fileName, myLogger)                                                            #
+#                                                                                                             #
+#    records = journal.load()            The count downs and alarms still set, a list of dictionaries.        #
+#    journal.started(record)             A count down or alarm has been set, a dictionary.                    #
+#    journal.stopped(name)               A count down or alarm has been stopped or has ended.                 #
+#    journal.full                        True once the journal has grown, and should be written again.        #
+#    journal.compact(records)            Write the journal again, with just the records given.                #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import json
+
+COMPACT = 200                           #  Write the journal again once it has this many lines.
+
+
+class TimerJournal():
+    """  A small journal on disc of the count downs and alarms, so they survive pyKlock being closed.
+
+         The journal is a JSON lines file, a line is added each time a count down or alarm is set or
+         stopped - nothing is written again, so a line is all that is lost if pyKlock stops part way.
+         A line that can not be read, i.e. half written, is passed over.
+
+         Reading the journal plays the lines back in order, a name set again replaces the one before.
+         Once the journal has COMPACT lines it is written again with only those still set, to a
+         temporary file renamed over the journal.
+    """
+    def __init__(self, fileName, myLogger):
+        self.fileName = str(fileName)
+        self.myLogger = myLogger
+        self.lines    = 0                       #  The number of lines in the journal.
+# ------------------------------------------------------------------------------------- load --------------------------
+    def load(self):
+        """  Returns the count downs and alarms still set, as a list of dictionaries in the order set.
+        """
+        records = {}
+        self.lines = 0
+
+        try:
+            with open(self.fileName, encoding="utf-8") as journalFile:     # In context manager.
+                for line in journalFile:
+                    self.lines += 1
+                    try:
+                        entry = json.loads(line)
+                        name  = entry["name"]
+                        if entry["op"] == "start":
+                            records.pop(name, None)
+                            records[name] = entry["record"]
+                        else:
+                            records.pop(name, None)
+                    except (ValueError, KeyError, TypeError):
+                        self.myLogger.warning(f" Timer journal line {self.lines} can not be read, passed over")
+        except FileNotFoundError:
+            pass
+        except OSError as error:
+            self.myLogger.error(f" Cannot read timer journal {self.fileName} :: {error}")
+
+        return list(records.values())
+# ------------------------------------------------------------------------------------- started -----------------------
+    def started(self, record):
+        """  A count down or alarm has been set, record is a dictionary with at least a name.
+        """
+        self.append({"op": "start", "name": record["name"], "record": record})
+# ------------------------------------------------------------------------------------- stopped -----------------------
+    def stopped(self, name):
+        """  A count down or alarm has been stopped, or has ended.
+        """
+        self.append({"op": "stop", "name": name})
+# ------------------------------------------------------------------------------------- append ------------------------
+    def append(self, entry):
+        """  Add a line to the journal, written through to the disc.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.fileName) or ".", exist_ok=True)
+            with open(self.fileName, "a", encoding="utf-8") as journalFile:  # In context manager.
+                journalFile.write(json.dumps(entry) + "\n")
+                journalFile.flush()
+                os.fsync(journalFile.fileno())
+            self.lines += 1
+        except OSError as error:
+            self.myLogger.error(f" Cannot write timer journal {self.fileName} :: {error}")
+# ------------------------------------------------------------------------------------- full --------------------------
+    @property
+    def full(self):
+        """  Returns True once the journal has COMPACT lines, and should be written again.
+        """
+        return self.lines >= COMPACT
+# ------------------------------------------------------------------------------------- compact -----------------------
+    def compact(self, records):
+        """  Write the journal again with just the records given, the ones still set.
+             Written to a temporary file then renamed over the journal, so it is never left half written.
+        """
+        tempName = f"{self.fileName}.tmp"
+
+        try:
+            os.makedirs(os.path.dirname(self.fileName) or ".", exist_ok=True)
+            with open(tempName, "w", encoding="utf-8") as journalFile:      # In context manager.
+                for record in records:
+                    journalFile.write(json.dumps({"op": "start", "name": record["name"], "record": record}) + "\n")
+                journalFile.flush()
+                os.fsync(journalFile.fileno())
+            os.replace(tempName, self.fileName)
+            self.lines = len(records)
+        except OSError as error:
+            self.myLogger.error(f" Cannot write timer journal {self.fileName} :: {error}")
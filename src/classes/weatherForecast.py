@@ -0,0 +1,92 @@
+###############################################################################################################
+#    weatherForecast.py   Copyright (C) <2026>  <Kevin Scott>                                                 #
+#                                                                                                             #
+#    The hourly forecast from an openMeteo response as NumPy columns, with the daily figures worked out.      #
+#                                                                                                             #
+#    import src.classes.weatherForecast as wf                                                                 #
+#                                                                                                             #
+#    forecast = wf.Forecast(response)                                                                         #
+#                                                                                                             #
+#    forecast.times                  The local time of each hour, as seconds.                                 #
+#    forecast.hourly[name]           A column of the hourly variable, i.e. forecast.hourly["temperature_2m"]. #
+#    forecast.daily[name]            A column of the daily figure, i.e. forecast.daily["tempMax"].            #
+#    forecast.days                   The number of whole days in the forecast.                                #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import warnings
+
+import numpy as np
+
+#  The hourly forecast variables asked for, in this order.
+HOURLY = ["temperature_2m", "precipitation", "precipitation_probability", "wind_speed_10m", "weather_code"]
+
+FORECAST_DAYS = 7
+HOURS         = 24
+
+
+class Forecast():
+    """  The hourly forecast from an openMeteo response as NumPy columns, with the daily figures worked out.
+
+         The hourly columns are views straight onto the flatbuffers bytes of the response, nothing is copied.
+         The daily figures are worked out in one go, by reshaping each column to [days, 24] and reducing
+         along the hours - the low and high temperature, total and chance of rain, highest wind and the
+         worst weather code [the WMO codes rise with severity].
+
+         A forecast is made once per fetch by the weather service, so switching tabs just shows it again.
+    """
+    def __init__(self, response):
+        hourly = response.Hourly()
+
+        if hourly is None:
+            self.times  = np.zeros(0, dtype=np.int64)
+            self.hourly = {name: np.zeros(0, dtype=np.float32) for name in HOURLY}
+        else:
+            offset      = response.UtcOffsetSeconds()
+            self.times  = np.arange(hourly.Time(), hourly.TimeEnd(), hourly.Interval(), dtype=np.int64) + offset
+            self.hourly = {name: hourly.Variables(index).ValuesAsNumpy() for index, name in enumerate(HOURLY)
+                           if index < hourly.VariablesLength()}
+
+        self.days  = len(self.times) // HOURS
+        self.daily = self.workOutDaily()
+# ------------------------------------------------------------------------------------- workOutDaily ------------------
+    def workOutDaily(self):
+        """  Returns a dictionary - [name, column] of the daily figures, worked out from the hourly columns.
+        """
+        hours = self.days * HOURS
+
+        def byDay(name):
+            """  The hourly column as [days, 24], or NaN if openMeteo did not send it.
+            """
+            column = self.hourly.get(name)
+            if not isinstance(column, np.ndarray) or len(column) < hours:
+                return np.full((self.days, HOURS), np.nan, dtype=np.float32)
+            return column[:hours].reshape(self.days, HOURS)
+
+        temperature = byDay("temperature_2m")
+
+        with warnings.catch_warnings():         #  A missing column is all NaN, which numpy warns about.
+            warnings.simplefilter("ignore", RuntimeWarning)
+
+            return {"date"      : self.times[:hours:HOURS],
+                    "tempMin"   : np.nanmin(temperature, axis=1),
+                    "tempMax"   : np.nanmax(temperature, axis=1),
+                    "rain"      : np.nansum(byDay("precipitation"), axis=1),
+                    "rainChance": np.nanmax(byDay("precipitation_probability"), axis=1),
+                    "windMax"   : np.nanmax(byDay("wind_speed_10m"), axis=1),
+                    "code"      : np.nanmax(byDay("weather_code"), axis=1)}
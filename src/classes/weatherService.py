@@ -0,0 +1,248 @@
+###############################################################################################################
+#    weatherService.py   Copyright (C) <2026>  <Kevin Scott>                                                  #
+#                                                                                                             #
+#    Fetches the weather from openMeteo.com in the background, cached on disc and served when offline.        #
+#                                                                                                             #
+#    import src.classes.weatherService as ws                                                                  #
+#                                                                                                             #
+#    service = ws.getWeatherService(myConfig, myLogger)                                                       #
+#                                                                                                             #
+#    service.snapshot                The last good Snapshot, or None if there has never been one.             #
+#    service.updated                 Signal, emitted with a Snapshot after each good fetch.                   #
+#    service.failed                  Signal, emitted with a message when a fetch fails.                       #
+#    service.refreshNow()            Wake the service, to fetch straight away.                                #
+#    service.close()                 Stop the background thread.                                              #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+# pip install openmeteo-requests, requests_cache, retry_requests
+
+import os
+import time
+import threading
+
+from collections import namedtuple
+from functools import lru_cache
+
+import requests_cache
+
+from openmeteo_sdk.WeatherApiResponse import WeatherApiResponse
+from retry_requests import retry
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+import src.projectPaths as pp
+import src.classes.weatherForecast as wf
+
+#  The current weather variables asked for, in this order.
+CURRENT = ["temperature_2m", "relative_humidity_2m", "apparent_temperature", "is_day", "wind_direction_10m",
+           "wind_speed_10m", "wind_gusts_10m", "precipitation", "showers", "rain", "weather_code", "cloud_cover",
+           "pressure_msl", "surface_pressure"]
+
+RETRY_WAIT = 60             #  Seconds to wait after a failed fetch, doubled for each failure up to the TTL.
+
+#  A weather snapshot.
+#      fetched is time.time() of the fetch, stale is True if it is older then the TTL [i.e. offline].
+#      current is a dictionary - [variable, value], forecast is a weatherForecast.Forecast,
+#      response is the decoded openMeteo response.
+Snapshot = namedtuple("Snapshot", ["fetched", "stale", "current", "forecast", "response"])
+
+
+class WeatherError(Exception):
+    """  Raised when a weather response can not be fetched or decoded.
+    """
+
+
+class WeatherService(QObject):
+    """  Fetches the weather from openMeteo.com in the background, on its own thread.
+
+         Responses are held in a requests_cache SQLite cache at data/weatherCache.sqlite, for WEATHER_TTL seconds
+         [default 900 - openMeteo updates every 15 minutes].  So a restart inside the TTL does not use the network.
+         The weather is fetched again each time the TTL runs out, a failed fetch is tried again after
+         RETRY_WAIT seconds, doubling up to the TTL.
+
+         The raw bytes of the last good response are also saved to data/weather.bin.  They are loaded at start up,
+         so the last good snapshot is served straight away - marked stale if older then the TTL, i.e. when offline.
+
+         The url is from WEATHER_URL, so the service can be pointed at a local HTTP server for testing.
+    """
+    updated = pyqtSignal(object)
+    failed  = pyqtSignal(str)
+
+    def __init__(self, myConfig, myLogger, cacheName=pp.WEATHER_CACHE_PATH, snapName=pp.WEATHER_SNAP_PATH):
+        super().__init__()
+
+        self.myConfig  = myConfig
+        self.myLogger  = myLogger
+        self.snapName  = snapName
+        self.ttl       = myConfig.WEATHER_TTL
+        self.failures  = 0
+        self.snapshot  = None                   #  The last good snapshot.
+        self.nextFetch = time.monotonic()       #  When the next fetch is due, in time.monotonic().
+        self.thread    = None
+        self.stopping  = threading.Event()
+        self.wake      = threading.Event()
+
+        os.makedirs(os.path.dirname(cacheName) or ".", exist_ok=True)
+        cacheSession = requests_cache.CachedSession(str(cacheName), backend="sqlite", expire_after=self.ttl)
+        self.session = retry(cacheSession, retries=3, backoff_factor=0.2)
+
+        self.loadSnapshot()
+# ------------------------------------------------------------------------------------- start -------------------------
+    def start(self):
+        """  Start the service thread, the first fetch is straight away - it is from the cache if inside the TTL.
+        """
+        if self.thread and self.thread.is_alive():
+            return
+
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="WeatherService", daemon=True)
+        self.thread.start()
+        self.myLogger.info(f" Weather service started :: {self.myConfig.WEATHER_URL} :: TTL {self.ttl}s")
+# ------------------------------------------------------------------------------------- run ---------------------------
+    def run(self):
+        """  The service thread, fetches then sleeps until the next fetch is due or it is woken.
+        """
+        while not self.stopping.is_set():
+            self.fetch()
+
+            self.wake.wait(max(0, self.nextFetch - time.monotonic()))
+            self.wake.clear()
+# ------------------------------------------------------------------------------------- fetch -------------------------
+    def fetch(self):
+        """  Fetch the weather and work out when to fetch again.
+             Returns the new snapshot, or None if the fetch failed - the last good snapshot is kept.
+        """
+        try:
+            data = self.request()
+            snapshot = makeSnapshot(data, time.time(), False)
+        except WeatherError as error:
+            self.failures  += 1
+            self.nextFetch  = time.monotonic() + min(self.ttl, RETRY_WAIT * 2 ** (self.failures - 1))
+            self.myLogger.warning(f" Weather fetch failed :: failures {self.failures} :: {error}")
+            if self.snapshot and not self.snapshot.stale and time.time() - self.snapshot.fetched > self.ttl:
+                self.snapshot = self.snapshot._replace(stale=True)
+            self.failed.emit(str(error))
+            return None
+
+        self.failures  = 0
+        self.nextFetch = time.monotonic() + self.ttl
+        self.snapshot  = snapshot
+        self.saveSnapshot(data)
+        self.updated.emit(snapshot)
+
+        return snapshot
+# ------------------------------------------------------------------------------------- request -----------------------
+    def request(self):
+        """  Request the weather from openMeteo, returns the raw flatbuffers bytes.
+        """
+        params = {"latitude"     : self.myConfig.LOCATION_LATITUDE,
+                  "longitude"    : self.myConfig.LOCATION_LONGITUDE,
+                  "current"      : ",".join(CURRENT),
+                  "hourly"       : ",".join(wf.HOURLY),
+                  "forecast_days": wf.FORECAST_DAYS,
+                  "timezone"     : "auto",
+                  "format"       : "flatbuffers"}
+
+        try:
+            response = self.session.get(self.myConfig.WEATHER_URL, params=params, timeout=10)
+            response.raise_for_status()
+        except Exception as error:              #  requests and retry_requests raise all sorts.
+            raise WeatherError(f"Cannot fetch {self.myConfig.WEATHER_URL} :: {error}") from error
+
+        if getattr(response, "from_cache", False):
+            self.myLogger.debug(" Weather response from the cache.")
+
+        return response.content
+# ------------------------------------------------------------------------------------- loadSnapshot ------------------
+    def loadSnapshot(self):
+        """  Load the last good response saved, so there is something to show straight away.
+        """
+        try:
+            with open(self.snapName, "rb") as snapFile:
+                data = snapFile.read()
+            fetched = os.path.getmtime(self.snapName)
+        except OSError:
+            return
+
+        try:
+            self.snapshot = makeSnapshot(data, fetched, time.time() - fetched > self.ttl)
+        except WeatherError as error:
+            self.myLogger.error(f" Cannot read saved weather {self.snapName} :: {error}")
+# ------------------------------------------------------------------------------------- saveSnapshot ------------------
+    def saveSnapshot(self, data):
+        """  Save the raw bytes of the last good response.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.snapName) or ".", exist_ok=True)
+            with open(self.snapName, "wb") as snapFile:
+                snapFile.write(data)
+        except OSError as error:
+            self.myLogger.error(f" Cannot save weather {self.snapName} :: {error}")
+# ------------------------------------------------------------------------------------- refreshNow --------------------
+    def refreshNow(self):
+        """  Wake the service, to fetch straight away.
+        """
+        self.nextFetch = time.monotonic()
+        self.wake.set()
+# ------------------------------------------------------------------------------------- close -------------------------
+    def close(self):
+        """  Stop the service thread, called when pyKlock closes.
+             A fetch in flight is left to time out on its own, the thread is a daemon.
+        """
+        self.stopping.set()
+        self.wake.set()
+
+# ------------------------------------------------------------------------------------- decode ------------------------
+def decode(data):
+    """  Returns the first openMeteo response in the raw bytes.
+
+         The bytes are a list of flatbuffers, each with a four byte little endian length in front.
+         An error from openMeteo part way through starts with "Unexpected".
+    """
+    if len(data) < 8:
+        raise WeatherError("Empty weather response")
+
+    length = int.from_bytes(data[:4], byteorder="little")
+    if data[:4] == b"Unex" or length > len(data) - 4:
+        raise WeatherError(f"Bad weather response :: {data[:80]!r}")
+
+    return WeatherApiResponse.GetRootAs(data, 4)
+# ------------------------------------------------------------------------------------- makeSnapshot ------------------
+def makeSnapshot(data, fetched, stale):
+    """  Returns a Snapshot from the raw bytes of a response, the forecast columns are views onto the bytes.
+    """
+    response = decode(data)
+    current  = response.Current()
+
+    if current is None:
+        raise WeatherError("No current weather in the response")
+
+    values = {name: current.Variables(index).Value() for index, name in enumerate(CURRENT)
+              if index < current.VariablesLength()}
+
+    return Snapshot(fetched, stale, values, wf.Forecast(response), response)
+# ------------------------------------------------------------------------------------- getWeatherService -------------
+@lru_cache(maxsize=None)
+def getWeatherService(myConfig, myLogger):
+    """  Returns the weather service, there is only one - created and started on the first call.
+    """
+    service = WeatherService(myConfig, myLogger)
+    service.start()
+
+    return service
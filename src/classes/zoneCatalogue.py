@@ -0,0 +1,163 @@
+###############################################################################################################
+#    zoneCatalogue.py   Copyright (C) <2026>  <Kevin Scott>                                                   #
+#                                                                                                             #
+#    A catalogue of the current time zones, built once per tzdata version and saved to disc.                  #
+#                                                                                                             #
+#    import src.classes.zoneCatalogue as zc                                                                   #
+#                                                                                                             #
+#    catalogue = zc.getZoneCatalogue(myLogger)                                                                #
+#                                                                                                             #
+#    catalogue.names                 A sorted list of the zone names.                                         #
+#    catalogue.zones                 A dictionary - [name, [region, standard offset, observes DST]].          #
+#    catalogue.label(name)           The zone as displayed in the search - i.e. Europe/London  UTC+00:00  DST #
+#    catalogue.labels()              The labels of all the zones, sorted by name.                             #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import json
+import datetime
+import zoneinfo
+
+from functools import lru_cache
+
+import src.projectPaths as pp
+import src.utils.klock_utils as utils
+
+
+class ZoneCatalogue():
+    """  A catalogue of the current time zones, built once per tzdata version and saved to disc.
+
+         Listing the zones means scanning every zone file and parsing the backward file, which is slow.
+         So the catalogue is saved as json, with the tzdata version and the size of the backward file as its key.
+         If the key of the saved catalogue matches, it is just loaded - otherwise it is built again and saved.
+
+         Each zone holds its region [the part before the first /], its standard UTC offset in seconds
+         and whether it observes daylight saving - worked out from the offsets in January and July.
+    """
+    def __init__(self, myLogger, storeName=pp.TZ_CACHE_PATH):
+        self.myLogger  = myLogger
+        self.storeName = storeName
+        self.zones     = {}
+
+        key = self.catalogueKey()
+
+        if not self.loadCatalogue(key):
+            self.buildCatalogue()
+            self.saveCatalogue(key)
+
+        self.names = sorted(self.zones)
+# ------------------------------------------------------------------------------------- catalogueKey ------------------
+    @staticmethod
+    def catalogueKey():
+        """  Returns the key of the catalogue, it changes if tzdata or the backward file changes.
+             The tzdata package is used on Windows, otherwise the version is read from the system tzdata.zi.
+        """
+        try:
+            import tzdata
+            version = tzdata.IANA_VERSION
+        except ImportError:
+            version = "system"
+            for path in zoneinfo.TZPATH:
+                try:
+                    with open(os.path.join(path, "tzdata.zi"), "r", encoding="utf-8") as ziFile:
+                        version = ziFile.readline().strip().removeprefix("# version ")
+                    break
+                except OSError:
+                    continue
+
+        try:
+            backward = os.path.getsize(f"{pp.RESOURCE_PATH}/timeZones/backward")
+        except OSError:
+            backward = 0
+
+        return f"{version}:{backward}"
+# ------------------------------------------------------------------------------------- loadCatalogue -----------------
+    def loadCatalogue(self, key):
+        """  Load the saved catalogue, returns False if not found, unreadable or built from a different tzdata.
+        """
+        try:
+            with open(self.storeName, "r", encoding="utf-8") as jsonFile:
+                store = json.load(jsonFile)
+        except (OSError, ValueError):
+            return False
+
+        if store.get("key") != key:
+            self.myLogger.info(f" Time zone catalogue is for {store.get('key')}, now {key} - rebuilding.")
+            return False
+
+        self.zones = {zone[0]: zone[1:] for zone in store["zones"]}
+
+        return True
+# ------------------------------------------------------------------------------------- buildCatalogue ----------------
+    def buildCatalogue(self):
+        """  Build the catalogue from zoneinfo, leaving out the deprecated aliases.
+        """
+        year    = datetime.datetime.now().year
+        january = datetime.datetime(year, 1, 1, 12)
+        july    = datetime.datetime(year, 7, 1, 12)
+
+        for name in utils.getTimezones():
+            try:
+                zone = zoneinfo.ZoneInfo(name)
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                continue
+
+            winter   = january.replace(tzinfo=zone)
+            summer   = july.replace(tzinfo=zone)
+            dst      = winter.utcoffset() != summer.utcoffset()
+            standard = winter if not winter.dst() else summer
+            region   = name.split("/")[0] if "/" in name else ""
+
+            self.zones[name] = [region, int(standard.utcoffset().total_seconds()), dst]
+
+        self.myLogger.info(f" Time zone catalogue built :: {len(self.zones)} zones.")
+# ------------------------------------------------------------------------------------- saveCatalogue -----------------
+    def saveCatalogue(self, key):
+        """  Save the catalogue as compact json.
+        """
+        store = {"key"  : key,
+                 "zones": [[name, *self.zones[name]] for name in sorted(self.zones)]}
+
+        try:
+            os.makedirs(os.path.dirname(self.storeName) or ".", exist_ok=True)
+            with open(self.storeName, "w", encoding="utf-8") as jsonFile:
+                json.dump(store, jsonFile, separators=(",", ":"))
+        except OSError as error:
+            self.myLogger.error(f" Cannot save time zone catalogue {self.storeName} :: {error}")
+# ------------------------------------------------------------------------------------- label -------------------------
+    def label(self, name):
+        """  Returns the zone as displayed in the search - name, standard offset and DST if observed.
+        """
+        _region, offset, dst = self.zones[name]
+        hours, minutes = divmod(abs(offset) // 60, 60)
+        sign = "-" if offset < 0 else "+"
+
+        return f"{name}  UTC{sign}{hours:02d}:{minutes:02d}{'  DST' if dst else ''}"
+# ------------------------------------------------------------------------------------- labels ------------------------
+    def labels(self):
+        """  Returns the labels of all the zones, sorted by name.
+        """
+        return [self.label(name) for name in self.names]
+
+# ------------------------------------------------------------------------------------- getZoneCatalogue --------------
+@lru_cache(maxsize=None)
+def getZoneCatalogue(myLogger):
+    """  Returns the time zone catalogue, loaded or built on the first call, and re-used on further calls.
+    """
+    return ZoneCatalogue(myLogger)
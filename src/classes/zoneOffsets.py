@@ -0,0 +1,113 @@
+###############################################################################################################
+#    zoneOffsets.py   Copyright (C) <2026>  <Kevin Scott>                                                     #
+#                                                                                                             #
+#    A cache of time zone UTC offsets, each valid until that zone's next daylight saving transition.          #
+#                                                                                                             #
+#    import src.classes.zoneOffsets as zo                                                                     #
+#                                                                                                             #
+#    offsets = zo.getZoneOffsets()                                                                            #
+#                                                                                                             #
+#    offset, abbreviation = offsets.lookUp(zoneName, utcSeconds)                                              #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import datetime
+import zoneinfo
+
+from functools import lru_cache
+
+SEARCH_DAYS = 400           #  How far ahead to look for the next transition, a zone with none is looked at again after this.
+DAY         = 86400
+
+
+class ZoneOffsets():
+    """  A cache of time zone UTC offsets, each valid until that zone's next daylight saving transition.
+
+         The store is a dictionary - [zoneName, [offset, abbreviation, validFrom, validUntil]].
+         offset is in seconds, validFrom and validUntil are UTC seconds [as time.time()].
+
+         A look up within [validFrom, validUntil) is just a dictionary read.
+         Otherwise the zone is worked out again with zoneinfo, and the next transition found -
+         stepping a day at a time, then halving the step down to the second.
+    """
+    def __init__(self):
+        self.store = {}
+# ------------------------------------------------------------------------------------- lookUp ------------------------
+    def lookUp(self, zoneName, utcSeconds):
+        """  Returns the UTC offset in seconds and the abbreviation [i.e. BST] of the zone at utcSeconds.
+             Raises zoneinfo.ZoneInfoNotFoundError if the zone is not known.
+        """
+        entry = self.store.get(zoneName)
+
+        if entry is None or not entry[2] <= utcSeconds < entry[3]:
+            entry = self.build(zoneName, utcSeconds)
+            self.store[zoneName] = entry
+
+        return entry[0], entry[1]
+# ------------------------------------------------------------------------------------- localTime ---------------------
+    def localTime(self, zoneName, utcSeconds):
+        """  Returns the time in the zone at utcSeconds as a naive datetime, with the offset and abbreviation.
+        """
+        offset, abbreviation = self.lookUp(zoneName, utcSeconds)
+        local = datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=utcSeconds + offset)
+
+        return local, offset, abbreviation
+# ------------------------------------------------------------------------------------- build -------------------------
+    def build(self, zoneName, utcSeconds):
+        """  Work out the offset of the zone at utcSeconds, and how long it is valid for.
+        """
+        zone   = zoneinfo.ZoneInfo(zoneName)
+        offset = self.offsetAt(zone, utcSeconds)
+        start  = int(utcSeconds)
+        until  = start + SEARCH_DAYS * DAY
+
+        step = start
+        while step < until:                 #  Find the first day with a different offset.
+            step += DAY
+            if self.offsetAt(zone, step) != offset:
+                until = self.bisect(zone, offset, step - DAY, step)
+                break
+
+        local = datetime.datetime.fromtimestamp(utcSeconds, zone)
+
+        return [offset, local.tzname(), start, until]
+# ------------------------------------------------------------------------------------- bisect ------------------------
+    def bisect(self, zone, offset, low, high):
+        """  Returns the first second in (low, high] where the offset of the zone is not offset.
+        """
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.offsetAt(zone, middle) == offset:
+                low = middle
+            else:
+                high = middle
+
+        return high
+# ------------------------------------------------------------------------------------- offsetAt ----------------------
+    @staticmethod
+    def offsetAt(zone, utcSeconds):
+        """  Returns the UTC offset of the zone at utcSeconds, in seconds.
+        """
+        return int(datetime.datetime.fromtimestamp(utcSeconds, zone).utcoffset().total_seconds())
+
+# ------------------------------------------------------------------------------------- getZoneOffsets ----------------
+@lru_cache(maxsize=None)
+def getZoneOffsets():
+    """  Returns the zone offset cache, there is only one - so all the klocks share it.
+    """
+    return ZoneOffsets()
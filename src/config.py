@@ -3,7 +3,7 @@
 #                                                                                                             #
 #    A class that acts has a wrapper around the configure file - config.toml.                                 #
 #    The configure file is first read, then the properties are made available.                                #
-#    The configure file is currently in toml format.                                                          #
+#    The configure file is currently in toml format, read with tomllib and written keeping its comments.      #
 #                                                                                                             #
 ###############################################################################################################
 #                                                                                                             #
@@ -21,9 +21,36 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
+import os
+import re
+import copy
 import datetime
+import tomllib
+import threading
 
-import toml
+from collections import namedtuple
+
+import src.utils.tomlUtils as tu
+
+from src.projectPaths import CONFIG_CACHE_PATH
+
+WRITE_DELAY = 2.0           #  Seconds a write is held back, so a burst of changes is written once.
+WRITTEN     = re.compile(r"^(#\s+\(c\) Kevin Scott\s+Written ).*$", re.MULTILINE)     #  The header line with the date.
+
+#  Written as a comment above each section of the default configure file, kept when the file is written.
+NOTES = {"INFO"       : "Application name and version - do not change.",
+         "APPLICATION": "Window position & size [pixels], confirm on exit, menu & tool bar and the style sheet.",
+         "DISPLAY"    : "Colours as #rrggbb, transparent needs a restart.",
+         "TIME"       : "Time mode is Digital or Text, prefix, postfix and space are used in text time.",
+         "SOUNDS"     : "Only one of westminster, cuckoo and hour_pips - sound_volume is 0 to 100.",
+         "EVENTS"     : "Events are coloured by the days left, holidayCountry [i.e. United Kingdom] adds its public holidays.",
+         "KLOCKS"     : "The text klock colours.",
+         "WORLD_KLOCK": "Time zones shown in the world klock, as Area/City.",
+         "NTP"        : "NTP servers, as host or host:port - polled every 2 ** minPoll to 2 ** maxPoll seconds.",
+         "LOCATION"   : "Latitude and longitude in degrees north and east, for the weather, sun and moon.",
+         "WEATHER"    : "The weather is fetched from url every ttl seconds.",
+         "EPHEMERIS"  : "The years of equinoxes and Chinese New Year worked out in the background.",
+         "LOGGING"    : "json = true also writes logs/pyKlock.jsonl, one JSON record per line."}
 
 
 class Config():
@@ -35,30 +62,121 @@ class Config():
 
          The get read the directory and if the key is not found a default is returned.
 
+         The properties are also held in a frozen snapshot, made only after a change - so code run every
+         second reads myConfig.snapshot.TIME_PREFIX without looking up the dictionary each time.
+
+         Setting a property that changes its value calls the functions watching it, then writes the
+         configure file after WRITE_DELAY seconds - so a burst of changes is written once.  It is written to
+         a temporary file then renamed, so a half written config.toml is never left behind.
+
+         The file is read with tomllib, and the parsed file kept in data/config.cache - used while config.toml's
+         modified time and size are unchanged, so it is not parsed at all on most starts.  When written, only
+         the changed values are written into the existing file, so hand written comments are kept.
+
          usage:
             myConfig = myConfig.Config()
+
+            myConfig.watch("FOREGROUND", callback)      callback(name, value) is called when FOREGROUND changes.
+            myConfig.reload(newConfig)                  Use a configure file read again, the watchers are called.
+            myConfig.writeConfig()                      Write the configure file, after WRITE_DELAY seconds.
+            myConfig.writeConfig(delay=0)               Write the configure file now, i.e. on closing.
     """
 
-    def __init__(self, CONFIG_PATH, logger):
+    def __init__(self, CONFIG_PATH, logger, cacheName=CONFIG_CACHE_PATH):
 
-        self.FILE_NAME = CONFIG_PATH
-        self.logger    = logger
+        self.FILE_NAME   = CONFIG_PATH
+        self.CACHE_NAME  = cacheName
+        self.logger      = logger
+        self._snapshot   = None                 #  Made when first needed after a change.
+        self._watchers   = {}                   #  [property name, list of callbacks].
+        self._writeTimer = None
+        self._lock       = threading.RLock()    #  The write timer runs on its own thread.
 
         try:
-            with open(self.FILE_NAME, "r") as configFile:       # In context manager.
-                self.config = toml.load(configFile)             # Load the configure file, in toml.
+            self.config = tu.load(self.FILE_NAME, self.CACHE_NAME)     # Load the configure file, in toml.
         except FileNotFoundError:
             self.logger.debug("Configure file not found.")
             self.logger.debug("Writing default configure file.")
             self._writeDefaultConfig()
             self. logger.debug("Running program with default configure settings.")
-        except toml.TomlDecodeError:
+        except tomllib.TOMLDecodeError:
             self.logger.debug("Error reading configure file.")
             self.logger.debug("Writing default configure file.")
             self._writeDefaultConfig()
             self.logger.debug("Running program with default configure settings.")
 
 
+    def __setattr__(self, name, value):
+        """  Setting a property goes through its setter, then if the value has changed the snapshot
+             is remade, the watchers are called and the configure file is written after WRITE_DELAY.
+        """
+        prop = getattr(type(self), name, None)
+
+        if not isinstance(prop, property) or prop.fset is None:
+            super().__setattr__(name, value)
+            return
+
+        with self._lock:
+            try:
+                old = prop.fget(self)
+            except (KeyError, TypeError):           #  The section is missing, the setter will add it.
+                old = None
+            prop.fset(self, value)
+
+        self._snapshot = None
+        if old != value:
+            for callback in self._watchers.get(name, []):
+                callback(name, value)
+            self.writeConfig()
+
+    @property
+    def snapshot(self):
+        """  Returns a frozen Snapshot of all the properties, made once after each change - lists become tuples.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                values   = [getattr(self, name) for name in Snapshot._fields]
+                snapshot = self._snapshot = Snapshot(*[tuple(value) if isinstance(value, list) else value
+                                                       for value in values])
+        return snapshot
+
+    def reload(self, newConfig):
+        """  Use a configure file read again, i.e. changed on disc - see configWatcher.py.
+             The watchers of each property that has changed are called, returns a list of their names.
+             If the new file is missing anything needed, it is not used and None is returned.
+        """
+        with self._lock:
+            old         = self.snapshot
+            oldConfig   = self.config
+            self.config = newConfig
+            self._snapshot = None
+            try:
+                new = self.snapshot
+            except (KeyError, TypeError, AttributeError) as error:
+                self.config    = oldConfig
+                self._snapshot = old
+                self.logger.error(f"Configure file not used, it is missing {error}")
+                return None
+
+        changed = [name for name in Snapshot._fields if getattr(old, name) != getattr(new, name)]
+        for name in changed:
+            for callback in self._watchers.get(name, []):
+                callback(name, getattr(self, name))
+
+        return changed
+
+    def watch(self, name, callback):
+        """  Call callback(name, value) when the property name changes.
+        """
+        self._watchers.setdefault(name, []).append(callback)
+
+    def unwatch(self, name, callback):
+        """  Stop calling callback when the property name changes.
+        """
+        if callback in self._watchers.get(name, []):
+            self._watchers[name].remove(callback)
+
     @property
     def NAME(self):
         """  Returns the application name.
@@ -121,6 +239,18 @@ class Config():
         """
         self.config["DISPLAY"]["infoLine"] = value
 
+    @property
+    def SUN_COUNTDOWN(self):
+        """  Returns if the status bar should count down to the next sunrise or sunset.
+        """
+        return self.config["DISPLAY"].get("sunCountdown", False)
+
+    @SUN_COUNTDOWN.setter
+    def SUN_COUNTDOWN(self, value):
+        """  Sets if the status bar should count down to the next sunrise or sunset.
+        """
+        self.config["DISPLAY"]["sunCountdown"] = value
+
     @property
     def X_POS(self):
         """  Returns the X co-ordinate of the top right hand corner of the window.
@@ -317,6 +447,18 @@ class Config():
         """
         self.config["TIME"]["space"] = value
 
+    @property
+    def TIME_DISCIPLINED(self):
+        """  Returns if the displayed time is corrected by the NTP offset.
+        """
+        return self.config["TIME"].get("disciplined", False)
+
+    @TIME_DISCIPLINED.setter
+    def TIME_DISCIPLINED(self, value):
+        """  Sets if the displayed time is corrected by the NTP offset.
+        """
+        self.config["TIME"]["disciplined"] = value
+
 #---------------------------------------------------------------------------------------------- SOUNDS -----------------------
     @property
     def SOUNDS(self):
@@ -485,6 +627,18 @@ class Config():
         """  Sets the colour for events now due.
         """
         self.config["EVENTS"]["nowColour"] = value
+
+    @property
+    def EVENTS_HOLIDAY_COUNTRY(self):
+        """  Returns the country whose public holidays are added to the events, blank for none.
+        """
+        return self.config["EVENTS"].get("holidayCountry", "")
+
+    @EVENTS_HOLIDAY_COUNTRY.setter
+    def EVENTS_HOLIDAY_COUNTRY(self, value):
+        """  Sets the country whose public holidays are added to the events.
+        """
+        self.config["EVENTS"]["holidayCountry"] = value
 #---------------------------------------------------------------------------------------------- KLOCKS -----------------------
     @property
     def TK_ON_COLOUR(self):
@@ -533,24 +687,191 @@ class Config():
         """  Sets the colour for the text Klock transparency.
         """
         self.config["KLOCKS"]["tk_transparent"] = value
+#---------------------------------------------------------------------------------------------- WORLD KLOCK ------------------
+    @property
+    def WORLD_KLOCK_ZONES(self):
+        """  Returns the list of time zones shown in the World Klock.
+        """
+        return self.config.get("WORLD_KLOCK", {}).get("zones", ["Europe/London", "America/New_York", "Asia/Tokyo", "Australia/Sydney"])
+
+    @WORLD_KLOCK_ZONES.setter
+    def WORLD_KLOCK_ZONES(self, value):
+        """  Sets the list of time zones shown in the World Klock.
+        """
+        self.config.setdefault("WORLD_KLOCK", {})["zones"] = value
+#---------------------------------------------------------------------------------------------- NTP --------------------------
+    @property
+    def NTP_SERVERS(self):
+        """  Returns the list of NTP servers to poll, either host or host:port.
+        """
+        return self.config.get("NTP", {}).get("servers", ["time.enhost.uk", "0.uk.pool.ntp.org", "1.uk.pool.ntp.org"])
+
+    @NTP_SERVERS.setter
+    def NTP_SERVERS(self, value):
+        """  Sets the list of NTP servers to poll.
+        """
+        self.config.setdefault("NTP", {})["servers"] = value
+
+    @property
+    def NTP_MIN_POLL(self):
+        """  Returns the minimum NTP poll interval, as a power of 2 seconds - 6 is 64 seconds.
+        """
+        return self.config.get("NTP", {}).get("minPoll", 6)
+
+    @NTP_MIN_POLL.setter
+    def NTP_MIN_POLL(self, value):
+        """  Sets the minimum NTP poll interval, as a power of 2 seconds.
+        """
+        self.config.setdefault("NTP", {})["minPoll"] = value
+
+    @property
+    def NTP_MAX_POLL(self):
+        """  Returns the maximum NTP poll interval, as a power of 2 seconds - 10 is 1024 seconds.
+        """
+        return self.config.get("NTP", {}).get("maxPoll", 10)
+
+    @NTP_MAX_POLL.setter
+    def NTP_MAX_POLL(self, value):
+        """  Sets the maximum NTP poll interval, as a power of 2 seconds.
+        """
+        self.config.setdefault("NTP", {})["maxPoll"] = value
+#---------------------------------------------------------------------------------------------- LOCATION ---------------------
+    @property
+    def LOCATION_LATITUDE(self):
+        """  Returns the latitude of the klock, degrees north - used for the sunrise, sunset and weather.
+        """
+        return self.config.get("LOCATION", {}).get("latitude", 53.743192)
+
+    @LOCATION_LATITUDE.setter
+    def LOCATION_LATITUDE(self, value):
+        """  Sets the latitude of the klock, degrees north.
+        """
+        self.config.setdefault("LOCATION", {})["latitude"] = value
+
+    @property
+    def LOCATION_LONGITUDE(self):
+        """  Returns the longitude of the klock, degrees east - used for the sunrise, sunset and weather.
+        """
+        return self.config.get("LOCATION", {}).get("longitude", -0.198817)
+
+    @LOCATION_LONGITUDE.setter
+    def LOCATION_LONGITUDE(self, value):
+        """  Sets the longitude of the klock, degrees east.
+        """
+        self.config.setdefault("LOCATION", {})["longitude"] = value
+#---------------------------------------------------------------------------------------------- WEATHER ----------------------
+    @property
+    def WEATHER_URL(self):
+        """  Returns the url of the openMeteo forecast api.
+        """
+        return self.config.get("WEATHER", {}).get("url", "https://api.open-meteo.com/v1/forecast")
+
+    @WEATHER_URL.setter
+    def WEATHER_URL(self, value):
+        """  Sets the url of the openMeteo forecast api.
+        """
+        self.config.setdefault("WEATHER", {})["url"] = value
+
+    @property
+    def WEATHER_TTL(self):
+        """  Returns how long a weather response is cached, in seconds - the weather is fetched again after this.
+        """
+        return self.config.get("WEATHER", {}).get("ttl", 900)
+
+    @WEATHER_TTL.setter
+    def WEATHER_TTL(self, value):
+        """  Sets how long a weather response is cached, in seconds.
+        """
+        self.config.setdefault("WEATHER", {})["ttl"] = value
+#---------------------------------------------------------------------------------------------- EPHEMERIS --------------------
+    @property
+    def EPHEMERIS_FIRST_YEAR(self):
+        """  Returns the first year of the equinoxes and Chinese New Year worked out in the background.
+        """
+        return self.config.get("EPHEMERIS", {}).get("firstYear", 1)
+
+    @EPHEMERIS_FIRST_YEAR.setter
+    def EPHEMERIS_FIRST_YEAR(self, value):
+        """  Sets the first year of the equinoxes and Chinese New Year worked out in the background.
+        """
+        self.config.setdefault("EPHEMERIS", {})["firstYear"] = value
+
+    @property
+    def EPHEMERIS_LAST_YEAR(self):
+        """  Returns the last year of the equinoxes and Chinese New Year worked out in the background.
+        """
+        return self.config.get("EPHEMERIS", {}).get("lastYear", 3000)
+
+    @EPHEMERIS_LAST_YEAR.setter
+    def EPHEMERIS_LAST_YEAR(self, value):
+        """  Sets the last year of the equinoxes and Chinese New Year worked out in the background.
+        """
+        self.config.setdefault("EPHEMERIS", {})["lastYear"] = value
+#---------------------------------------------------------------------------------------------- LOGGING ----------------------
+    @property
+    def LOG_JSON(self):
+        """  Returns True if a JSON lines log is written alongside the text log, i.e. logs/pyKlock.jsonl
+        """
+        return self.config.get("LOGGING", {}).get("json", False)
+
+    @LOG_JSON.setter
+    def LOG_JSON(self, value):
+        """  Sets if a JSON lines log is written alongside the text log.
+        """
+        self.config.setdefault("LOGGING", {})["json"] = value
         
         
-    def writeConfig(self):
-        """ Write the current config file.
-        """
-        self.logger.debug("Writing configure file.")
-        strNow  = datetime.datetime.now()
-        written = strNow.strftime("%A %d %B %Y  %H:%M:%S")
-        st_toml = toml.dumps(self.config)
+    def writeConfig(self, delay=WRITE_DELAY):
+        """ Write the current config file, after delay seconds.
+            Any write already waiting is put back, so a burst of changes is written once.
+        """
+        with self._lock:
+            if self._writeTimer:
+                self._writeTimer.cancel()
+                self._writeTimer = None
+
+            if delay > 0:
+                self._writeTimer = threading.Timer(delay, self.writeConfig, kwargs={"delay": 0})
+                self._writeTimer.daemon = False                 # Let a waiting write finish, if closing.
+                self._writeTimer.start()
+                return
+
+            self.logger.debug("Writing configure file.")
+            strNow  = datetime.datetime.now()
+            written = strNow.strftime("%A %d %B %Y  %H:%M:%S")
+            config  = copy.deepcopy(self.config)               # The write may be on the timer thread.
+
+        try:
+            with open(self.FILE_NAME, "r") as configFile:       # In context manager.
+                text = configFile.read()
+        except OSError:
+            text = ("#   Configure file for pyKlock.py \n"
+                    f"#   (c) Kevin Scott   Written {written}\n"
+                    "#\n"
+                    "#   true and false are lower case \n"
+                    "#\n")
+
+        text = WRITTEN.sub(lambda match: f"{match.group(1)}{written}", text, count=1)
 
-        with open(self.FILE_NAME, "w") as configFile:       # In context manager.
-            configFile.write("#   Configure file for pyKlock.py \n")
-            configFile.write(f"#   (c) Kevin Scott   Written {written}\n")
-            configFile.write("#\n")
-            configFile.write("#   true and false are lower case \n")
-            configFile.write("#\n")
+        if self._atomicWrite([tu.update(text, config)]):
+            tu.saveCache(self.FILE_NAME, self.CACHE_NAME, config)
 
-            configFile.writelines(st_toml)
+    def _atomicWrite(self, lines):
+        """ Write the configure file to a temporary file, then rename it over config.toml.
+            The rename replaces the file in one go, so it is never left half written.
+        """
+        tempName = f"{self.FILE_NAME}.tmp"
+        try:
+            with open(tempName, "w") as configFile:         # In context manager.
+                configFile.writelines(lines)
+                configFile.flush()
+                os.fsync(configFile.fileno())
+            os.replace(tempName, self.FILE_NAME)
+        except OSError as error:
+            self.logger.error(f"Cannot write configure file {self.FILE_NAME} :: {error}")
+            return False
+
+        return True
 
 
     def _writeDefaultConfig(self):
@@ -576,7 +897,8 @@ class Config():
         config["DISPLAY"] = {"foreground" : "#00ff00",
                              "background" : "#000000",
                              "transparent": True,
-                             "infoLine"   : True}
+                             "infoLine"   : True,
+                             "sunCountdown": False}
 
         config["TIME"] = {"mode"     : "Digital",
                           "format"   : "Fuzzy Time",
@@ -584,7 +906,8 @@ class Config():
                           "alignment": "Right",
                           "prefix"   : "",
                           "postfix"  : "",
-                          "space"    : " "}
+                          "space"    : " ",
+                          "disciplined": False}
 
         config["SOUNDS"] = {"sounds"        : True,
                             "westminster"   : True,
@@ -600,22 +923,43 @@ class Config():
                             "stage1Colour": "red",
                             "stage2Colour": "yellow",
                             "stage3Colour": "green",
-                            "nowColour"   : "blue"}
+                            "nowColour"   : "blue",
+                            "holidayCountry": ""}
 
         config["KLOCKS"] = {"tk_onColour"   : "#00ff00",
                             "tk_offColour"  : "#00ff00",
                             "tk_background" : "#000000",
                             "tk_transparent": True}
 
-        st_toml = toml.dumps(config)
+        config["WORLD_KLOCK"] = {"zones": ["Europe/London", "America/New_York", "Asia/Tokyo", "Australia/Sydney"]}
+
+        config["NTP"] = {"servers": ["time.enhost.uk", "0.uk.pool.ntp.org", "1.uk.pool.ntp.org"],
+                         "minPoll": 6,
+                         "maxPoll": 10}
+
+        config["LOCATION"] = {"latitude" : 53.743192,
+                              "longitude": -0.198817}
+
+        config["WEATHER"] = {"url": "https://api.open-meteo.com/v1/forecast",
+                             "ttl": 900}
+
+        config["EPHEMERIS"] = {"firstYear": 1,
+                               "lastYear" : 3000}
+
+        config["LOGGING"] = {"json": False}
+
+        st_toml = tu.dumps(config, NOTES)
+
+        self._atomicWrite(["#   DEFAULT Configure file for pyKlock.py \n",
+                           f"#   (c) Kevin Scott   Written {written}\n",
+                           "#\n",
+                           "#   true and false are lower case \n",
+                           "\n",
+                           st_toml])                        # Write configure file.
+
+        self.config = tu.load(self.FILE_NAME, self.CACHE_NAME)     # Load the configure file, in toml.
 
-        with open(self.FILE_NAME, "w") as configFile:       # In context manager.
-            configFile.write("#   DEFAULT Configure file for pyKlock.py \n")
-            configFile.write(f"#   (c) Kevin Scott   Written {written}\n")
-            configFile.write("#\n")
-            configFile.write("#   true and false are lower case \n")
-            configFile.write("\n")
-            configFile.writelines(st_toml)                  # Write configure file.
 
-        with open(self.FILE_NAME, "r") as configFile:       # In context manager.
-            self.config = toml.load(configFile)             # Load the configure file, in toml.
+#  A frozen copy of all the Config properties, see Config.snapshot.
+Snapshot = namedtuple("Snapshot", [name for name, value in vars(Config).items()
+                                   if isinstance(value, property) and name.isupper()])
@@ -24,15 +24,18 @@
 import time
 import functools
 
-import ntplib
-
 from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame,
                             QGroupBox, QGridLayout, QLabel)
 from PyQt6.QtCore    import Qt, QTimer
 
+import src.classes.ntpPoller as ntpp
+import src.classes.clockDiscipline as cd
+
 # ----------------------------------------------------------------------------------------------------------------------- updateTime() --------------
 def buildGUI(self):
     """  Build the GUI elements.
+
+         The NTP servers are polled in the background by the NTP poller, the display is interpolated between polls.
     """
     #  Create a central widget.
     self.centralWidget = QFrame()
@@ -40,31 +43,47 @@ def buildGUI(self):
     self.centralLayout = QVBoxLayout()
     self.ButtonLayout  = QHBoxLayout()
 
-    self.ntpGroup   = QGroupBox("NTP Server Time")
-    self.ntpLayout  = QGridLayout(self.ntpGroup)
-    self.txtLegend  = QLabel("Shows the Response from a NTP server.")
-    self.ntpText    = QLabel("NTP Server Time")
-    self.ntpLabel   = QLabel("12:34:56:789")
-    self.pcText     = QLabel("PC Time")
-    self.pcLabel    = QLabel("12:34:56:789")
-    self.difText    = QLabel("Difference Time")
-    self.difLabel   = QLabel("0.00 Seconds")
-    self.offText    = QLabel("NTP Offset")
-    self.offLabel   = QLabel("0.00 Seconds")
-    self.delayText  = QLabel("NTP Root Delay")
-    self.delayLabel = QLabel("0.00 Seconds")
-
-    self.ntpLayout.addWidget(self.txtLegend,  0, 0, Qt.AlignmentFlag.AlignLeft)
-    self.ntpLayout.addWidget(self.ntpText,    1, 0, Qt.AlignmentFlag.AlignCenter)
-    self.ntpLayout.addWidget(self.ntpLabel,   1, 1, Qt.AlignmentFlag.AlignLeft)
-    self.ntpLayout.addWidget(self.pcText,     2, 0, Qt.AlignmentFlag.AlignCenter)
-    self.ntpLayout.addWidget(self.pcLabel,    2, 1, Qt.AlignmentFlag.AlignLeft)
-    self.ntpLayout.addWidget(self.difText,    3, 0, Qt.AlignmentFlag.AlignCenter)
-    self.ntpLayout.addWidget(self.difLabel,   3, 1, Qt.AlignmentFlag.AlignLeft)
-    self.ntpLayout.addWidget(self.offText,    4, 0, Qt.AlignmentFlag.AlignCenter)
-    self.ntpLayout.addWidget(self.offLabel,   5, 1, Qt.AlignmentFlag.AlignLeft)
-    self.ntpLayout.addWidget(self.delayText,  6, 0, Qt.AlignmentFlag.AlignCenter)
-    self.ntpLayout.addWidget(self.delayLabel, 6, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpGroup    = QGroupBox("NTP Server Time")
+    self.ntpLayout   = QGridLayout(self.ntpGroup)
+    self.txtLegend   = QLabel("Shows the Response from a NTP server.")
+    self.ntpText     = QLabel("NTP Server Time")
+    self.ntpLabel    = QLabel("12:34:56:789")
+    self.pcText      = QLabel("PC Time")
+    self.pcLabel     = QLabel("12:34:56:789")
+    self.difText     = QLabel("Difference Time")
+    self.difLabel    = QLabel("0.00 Seconds")
+    self.offText     = QLabel("NTP Offset")
+    self.offLabel    = QLabel("0.00 Seconds")
+    self.delayText   = QLabel("NTP Root Delay")
+    self.delayLabel  = QLabel("0.00 Seconds")
+    self.serverText  = QLabel("NTP Server")
+    self.serverLabel = QLabel("")
+    self.pollText    = QLabel("Last / Next Poll")
+    self.pollLabel   = QLabel("")
+    self.estText     = QLabel("Estimated Offset")
+    self.estLabel    = QLabel("")
+    self.driftText   = QLabel("PC Clock Drift")
+    self.driftLabel  = QLabel("")
+
+    self.ntpLayout.addWidget(self.txtLegend,   0, 0, 1, 2, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.ntpText,     1, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.ntpLabel,    1, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.pcText,      2, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.pcLabel,     2, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.difText,     3, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.difLabel,    3, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.offText,     4, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.offLabel,    4, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.delayText,   5, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.delayLabel,  5, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.serverText,  6, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.serverLabel, 6, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.pollText,    7, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.pollLabel,   7, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.estText,     8, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.estLabel,    8, 1, Qt.AlignmentFlag.AlignLeft)
+    self.ntpLayout.addWidget(self.driftText,   9, 0, Qt.AlignmentFlag.AlignCenter)
+    self.ntpLayout.addWidget(self.driftLabel,  9, 1, Qt.AlignmentFlag.AlignLeft)
 
     self.ntpGroup.setLayout(self.ntpLayout)
 
@@ -78,7 +97,10 @@ def buildGUI(self):
 
     self.centralWidget.setLayout(self.centralLayout)
 
-    self.client = ntplib.NTPClient()
+    self.poller = ntpp.getNTPPoller(self.config, self.logger)
+    self.clock  = cd.getClockDiscipline(self.config, self.logger)
+    if self.poller.sample is None:
+        self.poller.pollNow()               #  Nothing to show yet, so do not wait for the next poll.
 
     update(self)
 
@@ -92,22 +114,36 @@ def buildGUI(self):
 # ----------------------------------------------------------------------------------------------------------------------- updateTime() --------------
 def update(self):
     """  Update the time every second.
+         The NTP time is interpolated from the last good sample, no server is queried here.
+    """
+    pcTime  = time.time()
+    ntpTime = self.poller.now()
+    sample  = self.poller.sample
+
+    self.pcLabel.setText(formatTime(pcTime))
+
+    if sample is None:
+        self.ntpLabel.setText("Waiting for a NTP server")
+        self.pollLabel.setText(f"next in {self.poller.secondsToPoll:.0f} seconds")
+        return
+
+    self.ntpLabel.setText(formatTime(ntpTime))
+    self.difLabel.setText(f" {pcTime - ntpTime:.3f} seconds")
+    self.offLabel.setText(f" {sample.offset:.3f} seconds")
+    self.delayLabel.setText(f" {sample.rootDelay:.3f} seconds  [round trip {sample.delay:.3f}]")
+    self.serverLabel.setText(f" {sample.server}  [stratum {sample.stratum}]")
+    self.pollLabel.setText(f" {self.poller.age:.0f} seconds ago / next in {self.poller.secondsToPoll:.0f} seconds")
+
+    error = self.clock.errorBound()
+    used  = "in use" if self.config.TIME_DISCIPLINED else "not in use"
+    if error is not None:
+        self.estLabel.setText(f" {self.clock.offset():.3f} \u00b1 {error:.3f} seconds  [{used}]")
+    self.driftLabel.setText(f" {self.clock.drift * 1e6:+.1f} ppm  [{len(self.clock.samples)} samples]")
+# ----------------------------------------------------------------------------------------------------------------------- formatTime() --------------
+def formatTime(seconds):
+    """  Returns time.time() seconds as a string, with milliseconds.
     """
-    try:
-        response = self.client.request("time.enhost.uk")
-        ntpTime  = response.tx_time
-        offset   = response.offset
-        delay    = response.root_delay
-
-        pcTime = time.time()
-        diff   = pcTime - ntpTime
-        self.ntpLabel.setText(time.ctime(ntpTime))
-        self.pcLabel.setText(time.ctime(pcTime))
-        self.difLabel.setText(f" {diff:.2f} seconds")
-        self.offLabel.setText(f" {offset:.2f} seconds")
-        self.delayLabel.setText(f" {delay:.2f} seconds")
-    except ntplib.NTPException:
-        print("No response from server")
+    return f"{time.strftime('%H:%M:%S', time.localtime(seconds))}:{int(seconds * 1000) % 1000:03d}"
 # ----------------------------------------------------------------------------------------------------------------------- close() -------------------
 def close(self):
     """  Close down the time when not needed.
@@ -0,0 +1,232 @@
+###############################################################################################################
+#   astronomyInfo.py   Copyright (C) <2026>  <Kevin Scott>                                                    #
+#                                                                                                             #
+#    The methods for displaying sunrise, sunset, twilight, day length and moon phase.                         #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+# -*- coding: utf-8 -*-
+
+import datetime
+import functools
+
+from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QWidget, QTabWidget, QTableWidget,
+                            QTableWidgetItem, QGroupBox, QGridLayout, QLabel, QDateEdit, QSpinBox,
+                            QHeaderView, QAbstractItemView)
+from PyQt6.QtGui     import QPainter, QPen, QColor, QPolygonF
+from PyQt6.QtCore    import Qt, QDate, QPointF
+
+import src.classes.almanac as alm
+
+ROWS    = [["Astronomical Dawn", "dawn", "astronomical"], ["Nautical Dawn", "dawn", "nautical"],
+           ["Civil Dawn", "dawn", "civil"], ["Sunrise", "sunrise", None], ["Solar Noon", "noon", None],
+           ["Sunset", "sunset", None], ["Civil Dusk", "dusk", "civil"], ["Nautical Dusk", "dusk", "nautical"],
+           ["Astronomical Dusk", "dusk", "astronomical"]]
+HEADERS = ["Date", "Sunrise", "Sunset", "Day Length", "Moon"]
+
+
+class YearChart(QWidget):
+    """  A chart of the sunrise and sunset times through the year, the day light is shaded.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.days  = []
+        self.today = None
+        self.setMinimumHeight(160)
+
+    def setDays(self, days, today):
+        """  Set the days to chart and redraw, today is marked if in the year.
+        """
+        self.days  = days
+        self.today = today
+        self.update()
+
+    def paintEvent(self, event):
+        """  Draw the chart - hours down the side, days along the bottom.
+        """
+        if not self.days:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        width  = self.width()
+        height = self.height()
+        xStep  = width / len(self.days)
+
+        for hour in range(0, 25, 6):
+            y = height * hour / 24
+            painter.setPen(QPen(QColor("grey"), 1, Qt.PenStyle.DotLine))
+            painter.drawLine(QPointF(0, y), QPointF(width, y))
+
+        rises = []
+        sets  = []
+        for index, day in enumerate(self.days):
+            x = index * xStep
+            if day.sunrise is None:             #  Polar day or night.
+                top, bottom = (0, height) if day.dayLength else (height / 2, height / 2)
+            else:
+                top    = height * hourOfDay(day.sunrise) / 24
+                bottom = height * hourOfDay(day.sunset) / 24
+            rises.append(QPointF(x, top))
+            sets.append(QPointF(x, bottom))
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(255, 200, 0, 90))
+        painter.drawPolygon(QPolygonF(rises + sets[::-1]))
+
+        painter.setPen(QPen(QColor("orange"), 2))
+        painter.drawPolyline(QPolygonF(rises))
+        painter.drawPolyline(QPolygonF(sets))
+
+        if self.today is not None:
+            x = (self.today - self.days[0].date).days * xStep
+            painter.setPen(QPen(QColor("red"), 1))
+            painter.drawLine(QPointF(x, 0), QPointF(x, height))
+
+        painter.end()
+
+
+def buildGUI(self):
+    """  Build the GUI elements.
+
+         The day is worked out by the almanac for the configured location, and cached.
+         The year tab is worked out in one go, for the chart and table.
+    """
+    #  Create a central widget.
+    self.centralWidget = QFrame()
+    self.setCentralWidget(self.centralWidget)
+    self.centralLayout = QVBoxLayout()
+    self.ButtonLayout  = QHBoxLayout()
+
+    self.almanac = alm.getAlmanac(self.config)
+    self.twTab   = QTabWidget()
+
+    #  The day tab.
+    page           = QWidget(self.twTab)
+    self.dayGroup  = QGroupBox("Sun and Moon")
+    self.dayLayout = QGridLayout(self.dayGroup)
+
+    self.txtLegend = QLabel(f"For latitude {self.config.LOCATION_LATITUDE:.4f}, longitude {self.config.LOCATION_LONGITUDE:.4f}.")
+    self.txtDate   = QLabel("Date")
+    self.deDate    = QDateEdit(QDate.currentDate())
+    self.deDate.setCalendarPopup(True)
+    self.deDate.setDateRange(QDate(1970, 1, 2), QDate(2100, 12, 31))       #  Windows can not show times before 1970.
+    self.deDate.dateChanged.connect(functools.partial(update, self))
+
+    self.dayLayout.addWidget(self.txtLegend, 0, 0, 1, 2, Qt.AlignmentFlag.AlignLeft)
+    self.dayLayout.addWidget(self.txtDate,   1, 0, Qt.AlignmentFlag.AlignCenter)
+    self.dayLayout.addWidget(self.deDate,    1, 1, Qt.AlignmentFlag.AlignLeft)
+
+    self.dayLabels = []
+    for row, (title, _field, _twilight) in enumerate(ROWS + [["Day Length", None, None], ["Moon Phase", None, None]], start=2):
+        label = QLabel("")
+        self.dayLabels.append(label)
+        self.dayLayout.addWidget(QLabel(title), row, 0, Qt.AlignmentFlag.AlignCenter)
+        self.dayLayout.addWidget(label,         row, 1, Qt.AlignmentFlag.AlignLeft)
+
+    layout = QVBoxLayout(page)
+    layout.addWidget(self.dayGroup)
+    self.twTab.addTab(page, "Day")
+
+    #  The year tab.
+    page        = QWidget(self.twTab)
+    self.sbYear = QSpinBox()
+    self.sbYear.setMinimum(1971)
+    self.sbYear.setMaximum(2100)
+    self.sbYear.setValue(QDate.currentDate().year())
+    self.sbYear.valueChanged.connect(functools.partial(updateYear, self))
+
+    self.yearChart = YearChart(page)
+
+    self.tblYear = QTableWidget()
+    self.tblYear.setColumnCount(len(HEADERS))
+    self.tblYear.setHorizontalHeaderLabels(HEADERS)
+    self.tblYear.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    self.tblYear.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    self.tblYear.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+    self.tblYear.verticalHeader().setVisible(False)
+
+    yearLayout = QHBoxLayout()
+    yearLayout.addWidget(QLabel("Year"))
+    yearLayout.addWidget(self.sbYear)
+    yearLayout.addStretch()
+
+    layout = QVBoxLayout(page)
+    layout.addLayout(yearLayout)
+    layout.addWidget(self.yearChart)
+    layout.addWidget(self.tblYear)
+    self.twTab.addTab(page, "Year")
+
+    btnClose = QPushButton(text="Close", parent=self)
+    btnClose.clicked.connect(self.close)
+
+    self.ButtonLayout.addWidget(btnClose)
+
+    self.centralLayout.addWidget(self.twTab)
+    self.centralLayout.addLayout(self.ButtonLayout)
+
+    self.centralWidget.setLayout(self.centralLayout)
+
+    updateYear(self)
+# ----------------------------------------------------------------------------------------------------------------------- update() ----------------
+def update(self):
+    """  Updated the day labels, for the chosen date.
+    """
+    day = self.almanac.day(self.deDate.date().toPyDate())
+
+    for label, (_title, field, twilight) in zip(self.dayLabels, ROWS, strict=False):
+        value = getattr(day, field)
+        label.setText(formatTime(value[twilight] if twilight else value))
+
+    self.dayLabels[-2].setText(f" {alm.formatLength(day.dayLength)}")
+    self.dayLabels[-1].setText(f" {day.moonPhase}  [{day.moonLit:.0%} lit]")
+# ----------------------------------------------------------------------------------------------------------------------- updateYear() ------------
+def updateYear(self):
+    """  Updated the year chart and table, the whole year is worked out in one go.
+    """
+    days  = self.almanac.year(self.sbYear.value())
+    today = datetime.date.today()
+
+    self.yearChart.setDays(days, today if today.year == self.sbYear.value() else None)
+
+    self.tblYear.setRowCount(len(days))
+    for row, day in enumerate(days):
+        self.tblYear.setItem(row, 0, QTableWidgetItem(day.date.strftime("%d %b")))
+        self.tblYear.setItem(row, 1, QTableWidgetItem(formatTime(day.sunrise)))
+        self.tblYear.setItem(row, 2, QTableWidgetItem(formatTime(day.sunset)))
+        self.tblYear.setItem(row, 3, QTableWidgetItem(alm.formatLength(day.dayLength)))
+        self.tblYear.setItem(row, 4, QTableWidgetItem(day.moonPhase))
+
+    self.tblYear.resizeColumnsToContents()
+    if today.year == self.sbYear.value():
+        self.tblYear.scrollToItem(self.tblYear.item(today.timetuple().tm_yday - 1, 0), QAbstractItemView.ScrollHint.PositionAtCenter)
+# ----------------------------------------------------------------------------------------------------------------------- formatTime() ------------
+def formatTime(seconds):
+    """  Returns time.time() seconds as local hours and minutes, or a dash if it does not happen that day.
+    """
+    if seconds is None:
+        return " --:--"
+
+    return f" {datetime.datetime.fromtimestamp(seconds):%H:%M}"
+# ----------------------------------------------------------------------------------------------------------------------- hourOfDay() -------------
+def hourOfDay(seconds):
+    """  Returns time.time() seconds as the local hour of the day, with the fraction.
+    """
+    local = datetime.datetime.fromtimestamp(seconds)
+
+    return local.hour + local.minute / 60
@@ -24,13 +24,12 @@
 import functools
 import datetime
 
-from pymeeus.Moon import Moon
-from pymeeus.Sun import Sun
-
 from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame,
                             QGroupBox, QGridLayout, QLabel, QSpinBox)
 from PyQt6.QtCore    import Qt
 
+import src.classes.ephemerisService as eph
+
 # ----------------------------------------------------------------------------------------------------------------------- updateTime() --------------
 def buildGUI(self):
     """  Build the GUI elements.
@@ -78,6 +77,8 @@ def buildGUI(self):
 
     currentYear = datetime.datetime.now().year
 
+    self.ephemeris = eph.getEphemerisService(self.config, self.logger)
+
     self.sbYear.setMinimum(1)
     self.sbYear.setMaximum(3000)
     self.sbYear.setValue(currentYear)
@@ -112,7 +113,7 @@ def update(self):
     self.aspect       = self.data[7]
     self.index        = self.data[8]
 
-    self.startLabel.setText(findNewYearDate(self.year))
+    self.startLabel.setText(findNewYearDate(self.ephemeris, self.year))
     self.hanLabel.setText(f"{self.stemHan} {self.branchHan}")
     self.pinyinLabel.setText(f"{self.stemPinyin} {self.branchPinyin}")
     self.animalLabel.setText(f"{self.element}-{self.animal}")
@@ -176,21 +177,11 @@ def calculate(year):
     index = cycle_year % 60 + 1
     return [year, stem_han, branch_han, stem_pinyin, branch_pinyin, element, animal, aspect, index]
 # ----------------------------------------------------------------------------------------------------------------------- findNewYearDate() ---------
-def findNewYearDate(year: int):
+def findNewYearDate(ephemeris, year: int):
     """  Determines the start of the Chinese New Year.
 
-        Copied from https://www.krootl.com/blog/working-with-lunar-calendar-in-python
+         The new moon is worked out once by the ephemeris service, see ephemerisService.computeYear().
     """
-    askedYear = year
-    year -= 1
-    equinox = Sun.get_equinox_solstice(year, target="winter")
-    lowerLimit = datetime.datetime(askedYear, 1, 21)
-    phase = Moon.moon_phase(equinox, target="new")
-    newMoonDate = datetime.datetime(*phase.get_full_date()[:5])
-    while newMoonDate < lowerLimit or newMoonDate.date() == lowerLimit.date():
-        equinox = phase + 29
-        phase = Moon.moon_phase(equinox, target="new")
-        newMoonDate = datetime.datetime(*phase.get_full_date()[:5])
+    newMoonDate = datetime.datetime(*ephemeris.newYear(year))
 
     return newMoonDate.strftime("%d %B %Y")
-
@@ -24,12 +24,12 @@
 import functools
 import datetime
 
-from pymeeus.Sun import Sun
-
 from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame,
                             QGroupBox, QGridLayout, QLabel, QSpinBox)
 from PyQt6.QtCore    import Qt
 
+import src.classes.ephemerisService as eph
+
 def buildGUI(self):
     """  Build the GUI elements.
     """
@@ -56,6 +56,8 @@ def buildGUI(self):
 
     currentYear = datetime.datetime.now().year
 
+    self.ephemeris = eph.getEphemerisService(self.config, self.logger)
+
     self.sbYearOfEquinox.setMinimum(1)
     self.sbYearOfEquinox.setMaximum(3000)
     self.sbYearOfEquinox.setValue(currentYear)
@@ -92,18 +94,7 @@ def buildGUI(self):
 def update(self):
     """    Updated the labels.
     """
-    epoch = Sun.get_equinox_solstice(self.sbYearOfEquinox.value(), target="spring")
-    y, m, d, h, mi, s = epoch.get_full_date()
-    self.lblSpring.setText(f" {d}/{m}/{y}  {h:02}:{mi:02}")
-
-    epoch = Sun.get_equinox_solstice(self.sbYearOfEquinox.value(), target="summer")
-    y, m, d, h, mi, s = epoch.get_full_date()
-    self.lblSummer.setText(f" {d}/{m}/{y}  {h:02}:{mi:02}")
-
-    epoch = Sun.get_equinox_solstice(self.sbYearOfEquinox.value(), target="autumn")
-    y, m, d, h, mi, s = epoch.get_full_date()
-    self.lblAutumn.setText(f" {d}/{m}/{y}  {h:02}:{mi:02}")
+    labels = [self.lblSpring, self.lblSummer, self.lblAutumn, self.lblWinter]
 
-    epoch = Sun.get_equinox_solstice(self.sbYearOfEquinox.value(), target="winter")
-    y, m, d, h, mi, s = epoch.get_full_date()
-    self.lblWinter.setText(f" {d}/{m}/{y}  {h:02}:{mi:02}")
\ No newline at end of file
+    for label, (y, m, d, h, mi) in zip(labels, self.ephemeris.seasons(self.sbYearOfEquinox.value()), strict=True):
+        label.setText(f" {d}/{m}/{y}  {h:02}:{mi:02}")
@@ -24,25 +24,19 @@
 import functools
 import datetime
 
-import workalendar.registry
-
 from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QSpacerItem, QSizePolicy,
                             QGroupBox, QGridLayout, QLabel, QComboBox, QSpinBox, QListWidget)
 from PyQt6.QtCore    import Qt
 
+import src.classes.holidayService as hs
+
 def init(self):
     """  Execute some initialising stuff.
+         The countries and holiday tables are held by the holiday service, so are only worked out once.
     """
-    self.countryNames = []
-    self.countryCodes = []
-
-    calendars = workalendar.registry.registry.get_calendars()  # This returns a dictionary
-    for code, calendar_class in calendars.items():
-        self.countryCodes.append(code.replace("'", ""))
-        self.countryNames.append(f"{calendar_class.name!r}".replace("'", ""))
+    self.holidayService = hs.getHolidayService(self.logger)
+    self.displayNames   = [name for name, _code in self.holidayService.countries]
 
-    self.displayNames = sorted(self.countryNames)
-    
     self.UK = self.displayNames.index("United Kingdom")
 
 def buildGUI(self):
@@ -113,14 +107,12 @@ def update(self):
 
     year     = self.sbYear.value()
     country  = self.cbCountry.currentText()
-    index    = self.countryNames.index(self.cbCountry.currentText())
+    code     = self.holidayService.code(country)
 
     self.txtLegend.setText(f"Displaying Public Holidays dates for {country} in {year}. ")
 
-    CalendarClass = workalendar.registry.registry.get(self.countryCodes[index])
-    calendar      = CalendarClass()
-    hols          = calendar.holidays(year)
+    for date, name in self.holidayService.holidays(code, year):
+        self.lwHolidays.addItem(name)
+        self.lwDates.addItem(date.strftime("%d %B %Y"))
 
-    for hol in hols:
-        self.lwHolidays.addItem(hol[1].replace("'", ""))
-        self.lwDates.addItem(hol[0].strftime("%d %B %Y"))
+    self.holidayService.precompute(code, year)          #  Have the years either side ready.
@@ -1,7 +1,7 @@
 ###############################################################################################################
-#   equinoxInfo.py   Copyright (C) <2026>  <Kevin Scott>                                                      #
+#   weatherInfo.py   Copyright (C) <2026>  <Kevin Scott>                                                      #
 #                                                                                                             #
-#    The methods for displaying equinox dates for a given year.                                               #
+#    The methods for displaying the current weather and forecast.                                             #
 #                                                                                                             #
 #    For changes see history.txt                                                                              #
 #                                                                                                             #
@@ -21,15 +21,83 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
+import time
+import functools
+
+import numpy as np
+
 import src.utils.weatherUtils as wu
+import src.classes.weatherService as ws
+
+from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFormLayout, QFrame, QWidget, QTabWidget,
+                            QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView)
+from PyQt6.QtGui     import QPainter, QPen, QColor, QPolygonF
+from PyQt6.QtCore    import Qt, QPointF
+
+#  The current weather rows - [title, show], show is given the snapshot's current dictionary.
+ROWS = [["Conditions",    lambda c: wu.describe(c["weather_code"])],
+        ["Temperature",   lambda c: f"{c['temperature_2m']:.1f} °C"],
+        ["Feels Like",    lambda c: f"{c['apparent_temperature']:.1f} °C"],
+        ["Humidity",      lambda c: f"{c['relative_humidity_2m']:.0f} %"],
+        ["Wind",          lambda c: f"{c['wind_speed_10m']:.0f} km/h from the {wu.compassPoint(c['wind_direction_10m'])}"],
+        ["Gusts",         lambda c: f"{c['wind_gusts_10m']:.0f} km/h"],
+        ["Precipitation", lambda c: f"{c['precipitation']:.1f} mm"],
+        ["Cloud Cover",   lambda c: f"{c['cloud_cover']:.0f} %"],
+        ["Pressure",      lambda c: f"{c['pressure_msl']:.0f} hPa"]]
+
+HEADERS = ["Day", "Conditions", "Low", "High", "Rain", "Wind"]
+
+#  The hourly sparklines - [title, hourly column, colour, units].
+SPARKLINES = [["Temperature", "temperature_2m", "orange", "°C"],
+              ["Rain",        "precipitation",  "deepskyblue", "mm"],
+              ["Wind",        "wind_speed_10m", "lightgreen", "km/h"]]
+
+
+class Sparkline(QWidget):
+    """  A small line chart of a NumPy column, scaled to fit - the day boundaries are marked.
+    """
+    def __init__(self, colour, parent=None):
+        super().__init__(parent)
+        self.colour = QColor(colour)
+        self.values = np.zeros(0, dtype=np.float32)
+        self.setMinimumHeight(40)
+
+    def setValues(self, values):
+        """  Set the column to draw and redraw.
+        """
+        self.values = values
+        self.update()
+
+    def paintEvent(self, event):
+        """  Draw the line, the points are worked out in one go with NumPy.
+        """
+        finite = np.isfinite(self.values)
+        if finite.sum() < 2:
+            return
+
+        width  = self.width()
+        height = self.height() - 4
+        low    = np.min(self.values[finite])
+        span   = max(np.max(self.values[finite]) - low, 1e-6)
+        xs     = np.linspace(0, width, len(self.values))
+        ys     = 2 + height - (np.nan_to_num(self.values, nan=low) - low) / span * height
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(QPen(QColor("grey"), 1, Qt.PenStyle.DotLine))
+        for x in xs[::24][1:]:
+            painter.drawLine(QPointF(x, 0), QPointF(x, self.height()))
+
+        painter.setPen(QPen(self.colour, 1.5))
+        painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), ys.tolist(), strict=True)]))
+        painter.end()
 
-from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFormLayout, QFrame, QWidget, QTabWidget, 
-                            QGroupBox, QGridLayout, QLabel,)
-from PyQt6.QtCore    import Qt
 
 def initWeather(self, myConfig, myLogger):
-    self.weatherData = wu.Weather(myConfig, myLogger)
-    self.weatherData.connect()
+    """  Get the weather service, it fetches in the background - so opening the window does not wait for the network.
+    """
+    self.weatherService = ws.getWeatherService(myConfig, myLogger)
     
 def buildGUI(self):
     """  Build the GUI elements.
@@ -40,9 +108,12 @@ def buildGUI(self):
     self.centralLayout = QVBoxLayout()
     self.ButtonLayout  = QHBoxLayout()
 
+    btnRefresh = QPushButton(text="Refresh", parent=self)
+    btnRefresh.clicked.connect(self.weatherService.refreshNow)
     btnClose = QPushButton(text="Close", parent=self)
     btnClose.clicked.connect(self.close)
 
+    self.ButtonLayout.addWidget(btnRefresh)
     self.ButtonLayout.addWidget(btnClose)
 
     self.twTab = QTabWidget()
@@ -57,30 +128,123 @@ def buildGUI(self):
 
     self.centralWidget.setLayout(self.centralLayout)
 
+    #  callback needed to pass self as argument to update()
+    self.weatherCallback = functools.partial(update, self)
+    self.weatherService.updated.connect(self.weatherCallback)
+    self.weatherService.failed.connect(self.weatherCallback)
+
+    update(self)
+
 # ----------------------------------------------------------------------------------------------------------------------- Info() ----------------
 def Current(self):
     """  Display Current Weather.
     """
-    current = self.weatherData.getCurrentWeather()
-
     page   = QWidget(self.twTab)
     layout = QFormLayout()
     layout.setFormAlignment(Qt.AlignmentFlag.AlignCenter)
     page.setLayout(layout)
 
+    self.weatherLabels = []
+    for title, _show in ROWS:
+        label = QLabel("")
+        self.weatherLabels.append(label)
+        layout.addRow(f"{title} ", label)
+
+    self.lblUpdated = QLabel("")
+    layout.addRow("Updated ", self.lblUpdated)
+
     self.twTab.addTab(page, "Current Weather")
 # ----------------------------------------------------------------------------------------------------------------------- Info() ----------------
 def Forecast(self):
     """  Display Weather Forecast.
+
+         A table of the next seven days, with sparklines of the hourly forecast below.
     """
     page   = QWidget(self.twTab)
-    layout = QFormLayout()
-    layout.setFormAlignment(Qt.AlignmentFlag.AlignCenter)
+    layout = QVBoxLayout()
     page.setLayout(layout)
 
+    self.tblForecast = QTableWidget()
+    self.tblForecast.setColumnCount(len(HEADERS))
+    self.tblForecast.setHorizontalHeaderLabels(HEADERS)
+    self.tblForecast.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    self.tblForecast.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    self.tblForecast.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+    self.tblForecast.verticalHeader().setVisible(False)
+    layout.addWidget(self.tblForecast)
+
+    sparkLayout     = QFormLayout()
+    self.sparklines = []
+    self.sparkRange = []
+    for title, _column, colour, _units in SPARKLINES:
+        sparkline = Sparkline(colour, page)
+        rangeText = QLabel("")
+        self.sparklines.append(sparkline)
+        self.sparkRange.append(rangeText)
+        sparkLayout.addRow(f"{title} ", sparkline)
+        sparkLayout.addRow("", rangeText)
+    layout.addLayout(sparkLayout)
+
+    self.shownFetched = None                #  The fetch time of the forecast on show, so it is only filled once.
+
     self.twTab.addTab(page, "Weather Forecast")
-# ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
-def update(self):
-    """    Updated the labels.
+# ----------------------------------------------------------------------------------------------------------------------- update() --------------
+def update(self, *args):
+    """  Updated the labels from the last good snapshot.
+         Called when the window opens and when the service has fetched, or failed to fetch, the weather.
+    """
+    snapshot = self.weatherService.snapshot
+
+    if snapshot is None:
+        self.lblUpdated.setText("Waiting for openMeteo.com")
+        return
+
+    for label, (_title, show) in zip(self.weatherLabels, ROWS, strict=True):
+        try:
+            label.setText(show(snapshot.current))
+        except KeyError:
+            label.setText("")
+
+    updated = time.strftime("%H:%M  %d %B %Y", time.localtime(snapshot.fetched))
+    self.lblUpdated.setText(f"{updated}  [offline - last good weather]" if snapshot.stale else updated)
+
+    if snapshot.fetched != self.shownFetched:
+        self.shownFetched = snapshot.fetched
+        updateForecast(self, snapshot.forecast)
+# ----------------------------------------------------------------------------------------------------------------------- updateForecast() ------
+def updateForecast(self, forecast):
+    """  Fill the forecast table and sparklines from the forecast columns, no request is made.
+    """
+    daily = forecast.daily
+
+    self.tblForecast.setRowCount(forecast.days)
+    for row in range(forecast.days):
+        day  = time.strftime("%a %d %b", time.gmtime(int(daily["date"][row])))     #  Dates are already local.
+        code = daily["code"][row]
+        rows = [day,
+                wu.describe(code) if np.isfinite(code) else "",
+                f"{daily['tempMin'][row]:.0f} °C",
+                f"{daily['tempMax'][row]:.0f} °C",
+                f"{daily['rain'][row]:.1f} mm  [{daily['rainChance'][row]:.0f} %]",
+                f"{daily['windMax'][row]:.0f} km/h"]
+        for col, text in enumerate(rows):
+            self.tblForecast.setItem(row, col, QTableWidgetItem(text.replace("nan", "-")))
+
+    self.tblForecast.resizeColumnsToContents()
+
+    for sparkline, rangeText, (_title, column, _colour, units) in zip(self.sparklines, self.sparkRange, SPARKLINES, strict=True):
+        values = forecast.hourly.get(column)
+        values = values if isinstance(values, np.ndarray) else np.zeros(0, dtype=np.float32)
+        sparkline.setValues(values)
+        if len(values) and np.isfinite(values).any():
+            rangeText.setText(f"{np.nanmin(values):.1f} to {np.nanmax(values):.1f} {units}")
+        else:
+            rangeText.setText("")
+# ----------------------------------------------------------------------------------------------------------------------- close() ----------------
+def close(self):
+    """  Stop listening to the weather service, when the window closes.
     """
-    pass
\ No newline at end of file
+    if getattr(self, "weatherCallback", None):
+        self.weatherService.updated.disconnect(self.weatherCallback)
+        self.weatherService.failed.disconnect(self.weatherCallback)
+        self.weatherCallback = None
@@ -21,19 +21,24 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
+import zoneinfo
 import functools
-import datetime
 
-import zoneinfo as zi
-
-from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame,
-                            QGroupBox, QGridLayout, QLabel, QComboBox)
+from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QFrame, QTableWidget, QTableWidgetItem,
+                            QGroupBox, QGridLayout, QLabel, QLineEdit, QCompleter, QHeaderView, QAbstractItemView)
 from PyQt6.QtCore    import Qt, QTimer
 
-import src.utils.klock_utils as utils
+import src.classes.zoneOffsets as zo
+import src.classes.zoneCatalogue as zc
+import src.classes.clockDiscipline as cd
+
+HEADERS = ["Time Zone", "Time", "Date", "Offset", ""]
 
 def buildGUI(self):
     """  Build the GUI elements.
+
+         The chosen time zones are shown in a table, one row per zone, and saved in config.toml.
+         Zones are found by typing any part of the name or offset, from the saved time zone catalogue.
     """
     #  Create a central widget.
     self.centralWidget = QFrame()
@@ -41,36 +46,53 @@ def buildGUI(self):
     self.centralLayout = QVBoxLayout()
     self.ButtonLayout  = QHBoxLayout()
 
-    self.wkGroup  = QGroupBox("World Klock")
-    self.wkLayout = QGridLayout(self.wkGroup)
+    self.clock       = cd.getClockDiscipline(self.config, self.logger)
+    self.zoneOffsets = zo.getZoneOffsets()
+    self.catalogue   = zc.getZoneCatalogue(self.logger)
+    self.worldZones  = list(self.config.WORLD_KLOCK_ZONES)
+    self.wkGroup     = QGroupBox("World Klock")
+    self.wkLayout    = QGridLayout(self.wkGroup)
 
-    self.txtLegend    = QLabel("Shows the local time for the selected time zone.")
+    self.txtLegend    = QLabel("Shows the local time for the selected time zones.")
     self.txtLocalTime = QLabel("Local Time")
     self.txtLocalTime.setStyleSheet("font-size: 24pt;")
     self.lblLocalTime = QLabel("12:34:56")
     self.lblLocalTime.setStyleSheet("font-size: 24pt;")
-    self.txtWorldTime = QLabel("World Klock Time")
-    self.txtWorldTime.setStyleSheet("font-size: 24pt;")
-    self.lblWorldTime = QLabel("12:34:56")
-    self.lblWorldTime.setStyleSheet("font-size: 24pt;")
-    self.txtTimeZone  = QLabel("Time Zone")
-    self.txtTimeZone.setStyleSheet("font-size: 24pt;")
-    self.cbTimeZone   = QComboBox()
-
-    self.cbTimeZone.insertItems(0, utils.getTimezones())
-    self.cbTimeZone.setCurrentText("GMT")
 
-    #  callback needed to pass self as argument to update()
-    cbTypeOfEasterCallback = functools.partial(update, self)
-    self.cbTimeZone.currentTextChanged.connect(cbTypeOfEasterCallback)
+    self.tblZones = QTableWidget()
+    self.tblZones.setColumnCount(len(HEADERS))
+    self.tblZones.setHorizontalHeaderLabels(HEADERS)
+    self.tblZones.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+    self.tblZones.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+    self.tblZones.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+    self.tblZones.verticalHeader().setVisible(False)
 
-    self.wkLayout.addWidget(self.txtLegend,    0, 0, Qt.AlignmentFlag.AlignLeft)
-    self.wkLayout.addWidget(self.txtLocalTime, 1, 0, Qt.AlignmentFlag.AlignLeft)
-    self.wkLayout.addWidget(self.lblLocalTime, 1, 1, Qt.AlignmentFlag.AlignCenter)
-    self.wkLayout.addWidget(self.txtWorldTime, 2, 0, Qt.AlignmentFlag.AlignLeft)
-    self.wkLayout.addWidget(self.lblWorldTime, 2, 1, Qt.AlignmentFlag.AlignCenter)
-    self.wkLayout.addWidget(self.txtTimeZone,  4, 0, Qt.AlignmentFlag.AlignCenter)
-    self.wkLayout.addWidget(self.cbTimeZone,   4, 1, Qt.AlignmentFlag.AlignLeft)
+    self.txtTimeZone  = QLabel("Time Zone")
+    self.leTimeZone   = QLineEdit()
+    self.leTimeZone.setPlaceholderText("Type to search i.e. London or +05:30")
+
+    completer = QCompleter(self.catalogue.labels(), self)
+    completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+    completer.setFilterMode(Qt.MatchFlag.MatchContains)
+    completer.setMaxVisibleItems(15)
+    completer.activated.connect(functools.partial(addZone, self))
+    self.leTimeZone.setCompleter(completer)
+    self.leTimeZone.returnPressed.connect(functools.partial(addZone, self))
+
+    btnAdd = QPushButton(text="Add Zone", parent=self)
+    btnAdd.clicked.connect(functools.partial(addZone, self))
+
+    btnRemove = QPushButton(text="Remove Zone", parent=self)
+    btnRemove.clicked.connect(functools.partial(removeZone, self))
+
+    self.wkLayout.addWidget(self.txtLegend,    0, 0, 1, 4, Qt.AlignmentFlag.AlignLeft)
+    self.wkLayout.addWidget(self.txtLocalTime, 1, 0, 1, 2, Qt.AlignmentFlag.AlignLeft)
+    self.wkLayout.addWidget(self.lblLocalTime, 1, 2, 1, 2, Qt.AlignmentFlag.AlignCenter)
+    self.wkLayout.addWidget(self.tblZones,     2, 0, 1, 4)
+    self.wkLayout.addWidget(self.txtTimeZone,  3, 0, Qt.AlignmentFlag.AlignLeft)
+    self.wkLayout.addWidget(self.leTimeZone,   3, 1)
+    self.wkLayout.addWidget(btnAdd,            3, 2)
+    self.wkLayout.addWidget(btnRemove,         3, 3)
 
     self.wkGroup.setLayout(self.wkLayout)
 
@@ -84,6 +106,8 @@ def buildGUI(self):
 
     self.centralWidget.setLayout(self.centralLayout)
 
+    loadZones(self)
+
     #  Set up short timer to update the clock every second
     #  callback needed to pass self as argument to update()
     timerCallback = functools.partial(update, self)
@@ -91,15 +115,83 @@ def buildGUI(self):
     self.Timer.timeout.connect(timerCallback)
     self.Timer.start(1000)
 
-# ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
+# ----------------------------------------------------------------------------------------------------------------------- loadZones() -------------
+def loadZones(self):
+    """  Fill the table with a row for each chosen zone, the cells are then updated in place every second.
+         Any zone not known to zoneinfo [i.e. a typo in config.toml] is dropped.
+    """
+    for zoneName in list(self.worldZones):
+        try:
+            self.zoneOffsets.lookUp(zoneName, self.clock.now())
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            self.logger.error(f" World Klock :: unknown time zone {zoneName}, dropped.")
+            self.worldZones.remove(zoneName)
+
+    self.tblZones.setRowCount(len(self.worldZones))
+
+    for row, zoneName in enumerate(self.worldZones):
+        self.tblZones.setItem(row, 0, QTableWidgetItem(zoneName))
+        for col in range(1, len(HEADERS)):
+            self.tblZones.setItem(row, col, QTableWidgetItem(""))
+
+    update(self)
+
+    for col in range(1, len(HEADERS)):
+        self.tblZones.resizeColumnToContents(col)
+# ----------------------------------------------------------------------------------------------------------------------- addZone() ---------------
+def addZone(self, label=None):
+    """  Add the zone in the search box to the table, and save the zones.
+         The search box holds a label from the catalogue, the zone name is the first part.
+    """
+    text     = label if isinstance(label, str) else self.leTimeZone.text()
+    zoneName = text.strip().split("  ")[0]
+
+    if zoneName not in self.catalogue.zones or zoneName in self.worldZones:
+        return
+
+    QTimer.singleShot(0, self.leTimeZone.clear)     #  Clear after the completer has filled in the text.
+
+    self.worldZones.append(zoneName)
+    saveZones(self)
+    loadZones(self)
+# ----------------------------------------------------------------------------------------------------------------------- removeZone() ------------
+def removeZone(self):
+    """  Remove the selected zones from the table, and save the zones.
+    """
+    rows = sorted({index.row() for index in self.tblZones.selectedIndexes()}, reverse=True)
+
+    for row in rows:
+        del self.worldZones[row]
+
+    if rows:
+        saveZones(self)
+        loadZones(self)
+# ----------------------------------------------------------------------------------------------------------------------- saveZones() -------------
+def saveZones(self):
+    """  Save the chosen zones in config.toml.
+    """
+    self.config.WORLD_KLOCK_ZONES = list(self.worldZones)
+    self.config.writeConfig()
+# ----------------------------------------------------------------------------------------------------------------------- update() ----------------
 def update(self):
     """    Updated the labels.
+
+           UTC is read once, each zone is then the cached UTC offset added on.
+           The offsets are only worked out again when a zone passes a daylight saving transition.
     """
-    localNow = datetime.datetime.now()
-    worldNow = datetime.datetime.now(zi.ZoneInfo(self.cbTimeZone.currentText()))
+    utcNow = self.clock.now()
+
+    self.lblLocalTime.setText(self.clock.nowDateTime().strftime("%H %M %S"))
+
+    for row, zoneName in enumerate(self.worldZones):
+        local, offset, abbreviation = self.zoneOffsets.localTime(zoneName, utcNow)
+        hours, minutes = divmod(abs(offset) // 60, 60)
+        sign = "-" if offset < 0 else "+"
 
-    self.lblLocalTime.setText(localNow.strftime("%H %M %S"))
-    self.lblWorldTime.setText(worldNow.strftime("%H %M %S"))
+        self.tblZones.item(row, 1).setText(local.strftime("%H:%M:%S"))
+        self.tblZones.item(row, 2).setText(local.strftime("%a %d %b"))
+        self.tblZones.item(row, 3).setText(f"{sign}{hours:02d}:{minutes:02d}")
+        self.tblZones.item(row, 4).setText(abbreviation)
 # ----------------------------------------------------------------------------------------------------------------------- close() -------------------
 def close(self):
     """  Close down the time when not needed.
@@ -21,11 +21,12 @@
 
 from PyQt6.QtWidgets import (QHBoxLayout, QVBoxLayout, QGridLayout, QPushButton, QApplication, QFrame, QMainWindow, 
                              QGroupBox, QLabel, QProgressBar)
-from PyQt6.QtCore    import QTimer, QDateTime
+from PyQt6.QtCore    import QTimer
 from PyQt6.QtCore    import Qt, QSize, QPoint
 
 import src.classes.styles as styles
 import src.classes.systemInfo as si
+import src.classes.clockDiscipline as cd
 
 import src.utils.textKlockCodes as tkc
 import src.utils.klock_utils as utils
@@ -41,6 +42,7 @@ class textKlock(QMainWindow):
         self.styles      = styles.Styles()             #  Styles for the battery progress bar.
         self.systemInfo  = si.SysInfo()
         self.parent      = parent
+        self.clock       = cd.getClockDiscipline(self.config, self.parent.logger)
         self.onColour    = self.config.TK_ON_COLOUR
         self.offColour   = self.config.TK_OFF_COLOUR
         self.backColour  = self.config.TK_BACKGROUND
@@ -150,7 +152,7 @@ class textKlock(QMainWindow):
     def updateTime(self):
         """  Update the time and status bar every second.
         """
-        dtCurrent = QDateTime.currentDateTime()
+        dtCurrent = self.clock.nowQDateTime()            #  NTP corrected, if TIME_DISCIPLINED.
         txtDate   = dtCurrent.toString("dddd dd MMMM yyyy")
         txtTime   = dtCurrent.toString("HH:mm:ss")
         hours     = int(txtTime[0:2])
@@ -25,14 +25,96 @@
     to write to log - log.debug(text message) [also can use log, error, info, warning, critical & exception]
 
     can add exc_info=True to include exception information, not needed with log.exception
+
+    add_json_handler(logger, logger_name) adds a JSON lines log alongside, i.e. pyKlock.jsonl - one record per line.
+
+    The files are written on a background thread, a log call only puts the record on a queue - see QueueLogHandler.
+    queue_stats(logger) returns the queue depth, the most it has held and the records dropped.
+    stop_logging(logger) writes out the queue and carries on logging straight to the files, called at close down.
 """
 
 import sys
+import copy
+import json
+import queue
+import atexit
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
 
 FORMATTER = logging.Formatter("%(asctime)s : %(levelname)s : %(message)s")  # Could add if needed - %(funcName)s:%(lineno)d
 
+QUEUE_SIZE    = 10000               # The most records waiting to be written.
+BLOCK_LEVEL   = logging.WARNING     # When the queue is full, records at or above this wait for room - below are dropped.
+BLOCK_TIMEOUT = 1.0                 # The most seconds to wait for room, then the record is dropped.
+
+
+class QueueLogListener(QueueListener):
+    """  A QueueListener that waits for room to stop, the queue may be full.
+    """
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueLogHandler(QueueHandler):
+    """  Puts each record on a bounded queue, a QueueListener writes them to the files on its own thread.
+         So a log call from the GUI thread never waits on the disc, nor on the midnight rotation.
+
+         If the queue is full, a warning or worse waits up to BLOCK_TIMEOUT for room, anything less is dropped.
+         The drops and the most records held are counted, see queue_stats().
+    """
+    def __init__(self, log_queue, *handlers):
+        super().__init__(log_queue)
+        self.dropped    = 0
+        self.high_water = 0
+        self.listener   = QueueLogListener(log_queue, *handlers, respect_handler_level=True)
+
+    def prepare(self, record):
+        """  Merge the message and arguments and keep the exception as text, so the record can cross threads.
+             Unlike QueueHandler.prepare() the record is not formatted, the file handlers do that.
+        """
+        record = copy.copy(record)
+        record.msg  = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = FORMATTER.formatException(record.exc_info)
+        record.exc_info   = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if record.levelno >= BLOCK_LEVEL:
+                self.queue.put(record, timeout=BLOCK_TIMEOUT)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        self.high_water = max(self.high_water, self.queue.qsize())
+
+
+class JsonFormatter(logging.Formatter):
+    """  Formats a record as one line of JSON.
+
+         time and level always come first, at the same place on every line as in the text log - so
+         src/classes/logIndex.py can pick them out without decoding the JSON.
+    """
+    def format(self, record):
+        entry = {"time"    : self.formatTime(record),
+                 "level"   : record.levelname,
+                 "message" : record.getMessage(),
+                 "module"  : record.module,
+                 "function": record.funcName,
+                 "line"    : record.lineno,
+                 "thread"  : record.threadName}
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:                           # Already text, if it came through the queue.
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False)
+
 
 def get_console_handler():
     console_handler = logging.StreamHandler(sys.stdout)
@@ -46,11 +128,71 @@ def get_file_handler(logger_name):
     return file_handler
 
 
+def get_json_handler(logger_name):
+    json_handler = TimedRotatingFileHandler(logger_name, when="midnight", backupCount=7, encoding="utf-8")
+    json_handler.setFormatter(JsonFormatter())
+    return json_handler
+
+
+def json_log_name(logger_name):
+    """  Returns the name of the JSON lines log kept alongside a text log, i.e. pyKlock.jsonl for pyKlock.log.
+    """
+    return f"{str(logger_name).removesuffix('.log')}.jsonl"
+
+
+def add_json_handler(logger, logger_name):
+    """  Add a JSON lines log alongside the text log, named as the text log with .jsonl - if LOGGING json.
+    """
+    json_name    = json_log_name(logger_name)
+    json_handler = get_json_handler(json_name)
+
+    queue_handler = get_queue_handler(logger)
+    if queue_handler:                                   # Written by the listener thread, with the text log.
+        queue_handler.listener.handlers += (json_handler,)
+    else:
+        logger.addHandler(json_handler)
+    return json_name
+
+
+def get_queue_handler(logger):
+    """  Returns the logger's queue handler, or None if it is writing straight to the files.
+    """
+    return next((handler for handler in logger.handlers if isinstance(handler, QueueLogHandler)), None)
+
+
+def queue_stats(logger):
+    """  Returns the records waiting, the most ever waiting and the records dropped - all 0 once stopped.
+    """
+    queue_handler = get_queue_handler(logger)
+    if queue_handler is None:
+        return 0, 0, 0
+    return queue_handler.queue.qsize(), queue_handler.high_water, queue_handler.dropped
+
+
+def stop_logging(logger):
+    """  Write out the records waiting and stop the listener thread.
+         The file handlers are then added straight to the logger, so anything logged later is not lost.
+    """
+    queue_handler = get_queue_handler(logger)
+    if queue_handler is None:
+        return
+
+    queue_handler.listener.stop()                       # Waits for the queue to be written.
+    logger.removeHandler(queue_handler)
+    for handler in queue_handler.listener.handlers:
+        handler.flush()
+        logger.addHandler(handler)
+
+
 def get_logger(logger_name):
     logger = logging.getLogger(logger_name)
     logger.setLevel(logging.DEBUG)               # better to have too much log than not enough
-    # logger.addHandler(get_console_handler())   # add to log to console
-    logger.addHandler(get_file_handler(logger_name))
+    # handlers = [get_file_handler(logger_name), get_console_handler()]   # add to log to console
+    handlers = [get_file_handler(logger_name)]
+    queue_handler = QueueLogHandler(queue.Queue(QUEUE_SIZE), *handlers)
+    logger.addHandler(queue_handler)
+    queue_handler.listener.start()
+    atexit.register(stop_logging, logger)        # In case pyKlock does not close down cleanly.
     # with this pattern, it's rarely necessary to propagate the error up to parent
     logger.propagate = False
     return logger
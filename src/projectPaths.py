@@ -33,17 +33,33 @@ FROZEN        = False
 if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):   #  Running as a stand alone executable.
     FROZEN        = True
     CONFIG_PATH   = "config.toml"
+    CONFIG_CACHE_PATH = "data/config.cache"
     LOGGER_PATH   = "pyKlock.log"
     RESOURCE_PATH = "resources"
     HELP_PATH     = "help"
     FR_DATA_PATH  = "data/friends.txt"
     EV_DATA_PATH  = "data/events.txt"
+    EV_HOL_PATH   = "data/holidayEvents.txt"
+    TZ_CACHE_PATH = "data/timeZones.json"
+    HOL_CACHE_PATH = "data/holidays.json"
+    EPH_CACHE_PATH = "data/ephemeris.json"
+    WEATHER_CACHE_PATH = "data/weatherCache"
+    WEATHER_SNAP_PATH  = "data/weather.bin"
+    TIMERS_PATH   = "data/timers.jsonl"
     STYLE_PATH    = "resources/style"
 else:
      CONFIG_PATH   = MAIN_PATH / "config.toml"
+     CONFIG_CACHE_PATH = MAIN_PATH / "data/config.cache"
      LOGGER_PATH   = MAIN_PATH / "logs/pyKlock.log"
      RESOURCE_PATH = MAIN_PATH / "resources"
      HELP_PATH     = MAIN_PATH / "help"
      FR_DATA_PATH  = MAIN_PATH / "data/friends.txt"
      EV_DATA_PATH  = MAIN_PATH / "data/events.txt"
+     EV_HOL_PATH   = MAIN_PATH / "data/holidayEvents.txt"
+     TZ_CACHE_PATH = MAIN_PATH / "data/timeZones.json"
+     HOL_CACHE_PATH = MAIN_PATH / "data/holidays.json"
+     EPH_CACHE_PATH = MAIN_PATH / "data/ephemeris.json"
+     WEATHER_CACHE_PATH = MAIN_PATH / "data/weatherCache"
+     WEATHER_SNAP_PATH  = MAIN_PATH / "data/weather.bin"
+     TIMERS_PATH   = MAIN_PATH / "data/timers.jsonl"
      STYLE_PATH    = MAIN_PATH / "resources/style"
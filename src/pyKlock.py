@@ -20,6 +20,7 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
+import os
 import time
 
 from PyQt6.QtWidgets import (QMainWindow, QFrame, QLabel, QLCDNumber, QStackedLayout, QColorDialog,
@@ -32,16 +33,34 @@ import src.utils.klock_utils as utils                                 #  Need to
 
 import src.classes.menu as mu
 import src.classes.sounds as snds
+import src.classes.ntpPoller as ntpp
+import src.classes.clockDiscipline as cd
+import src.classes.holidayService as hs
+import src.classes.ephemerisService as eph
+import src.classes.almanac as alm
+import src.classes.weatherService as ws
 import src.classes.styles as styles
 import src.classes.selectTime as st
 import src.classes.systemInfo as si
 import src.classes.eventsStore as es
+import src.classes.configWatcher as cw
+import src.classes.countDown as cnt
+import src.classes.notifications as nt
+import src.logger as Logger
 
 import src.windows.about as About
 import src.windows.textViewer as tw
+import src.windows.logViewer as lv
 import src.windows.helpViewer as hp
 import src.windows.settings as stngs
 
+#  The settings applied straight away when changed in config.toml, see configReloaded().
+#  TRANSPARENT needs a restart, the rest are read from the config when next used.
+LIVE_SETTINGS = ["FOREGROUND", "BACKGROUND", "TIME_FONT", "TIME_FORMAT", "TIME_MODE", "TIME_PREFIX", "TIME_POSTFIX",
+                 "TIME_SPACE", "MENU_BAR", "TOOL_BAR", "X_POS", "Y_POS", "SOUNDS"]
+
+MISSED_LATE = 60 * 1_000_000_000    #  A count down ending more then a minute late [in ns] was missed while closed.
+
 class KlockWindow(QMainWindow):
     def __init__(self, myConfig, myLogger):
         super().__init__()
@@ -56,19 +75,33 @@ class KlockWindow(QMainWindow):
         self.setWindowTitle("pyKlock")
         self.setGeometry(self.Xpos, self.Ypos, self.width, self.height)
 
-        self.selectTime    = st.SelectTime()
+        self.clock         = cd.getClockDiscipline(self.config, self.logger)
+        self.selectTime    = st.SelectTime(self.clock)
         self.systemInfo    = si.SysInfo()
         self.styles        = styles.Styles()             #  Styles for the battery progress bar.
         self.sounds        = snds.Sounds(self.config, self.logger)
+        self.ntpPoller     = ntpp.getNTPPoller(self.config, self.logger)
+        self.holidays      = hs.getHolidayService(self.logger)
+        self.ephemeris     = eph.getEphemerisService(self.config, self.logger)
+        self.almanac       = alm.getAlmanac(self.config)
+        self.weather       = ws.getWeatherService(self.config, self.logger)      #  Fetches in the background.
+        self.countDowns    = cnt.getCountDownService(self.logger)               #  Carry on when the viewer is closed.
         self.timeFont      = QFont()
         self.textWindow    = None                        #  No text external window yet.
         self.helpWindow    = None
+        self.logWindow     = None
         self.startTime     = time.perf_counter()
         self.lblWidth      = 0                           #  Used to measure size of time text and do we need to resize.
         self.lblHeight     = 0
         self.lastMin       = -1
         self.minimumWidth  = 500
 
+        self.countDownAlarms = set()                     #  The ids of count down alarm sounds, while playing.
+
+        self.countDowns.countDownEnd.connect(self.countDownEnded)
+        self.sounds.finished.connect(self.countDownAlarmFinished)
+        self.countDowns.countDownMissed.connect(self.countDownMissed)
+
         self.nowTotalBytesReceived  = self.systemInfo.TotalRawBytesReceived        #  Use to measure network speed.
         self.nowTotalBytesSent      = self.systemInfo.TotalRawBytesSent
         self.lastTotalBytesReceived = self.nowTotalBytesReceived
@@ -76,6 +109,8 @@ class KlockWindow(QMainWindow):
         self.newTime                = time.time()
         self.lastTime               = self.newTime
 
+        self.ephemeris.precompute()      #  Work out the equinoxes and Chinese New Years in the background.
+
         self.menu   = mu.Menu(self.config, self.logger, self.eventsStore, self)
         self.myMenu = self.menu.buildMenu()
 
@@ -112,6 +147,13 @@ class KlockWindow(QMainWindow):
         self.updateBattery()
         self.eventsStore.updateEvents()
 
+        #  Apply changes to config.toml on disc straight away, the rest are read when next used.
+        self.configWatcher = cw.ConfigWatcher(self.config, self.logger)
+        self.configWatcher.reloaded.connect(self.configReloaded)
+
+        self.countDowns.clock = self.clock  #  Alarms go off by the klock's time, NTP corrected if TIME_DISCIPLINED.
+        self.countDowns.restore()           #  The count downs and alarms set when pyKlock closed.
+
         #  This returns a QRect(x, y, width, height)
         print(QApplication.primaryScreen().availableVirtualGeometry())
         print(QApplication.primaryScreen().availableGeometry() )
@@ -207,19 +249,24 @@ class KlockWindow(QMainWindow):
         self.stsState   = QLabel("cisN")
         self.stsFrmt    = QLabel("L.E.D.")
         self.stsIdle    = QLabel("idle : 7s")
+        self.stsSun     = QLabel("Sunset in 0h 00m")
 
         self.stsDate.setAlignment(Qt.AlignmentFlag.AlignLeft)
         self.stsBattery.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.stsState.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.stsFrmt.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.stsIdle.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.stsSun.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         self.statusBar.addPermanentWidget(self.stsDate,  1)
         self.statusBar.addPermanentWidget(self.stsBattery,  1)
         self.statusBar.addPermanentWidget(self.stsState, 1)
         self.statusBar.addPermanentWidget(self.stsFrmt, 1)
+        self.statusBar.addPermanentWidget(self.stsSun,  1)
         self.statusBar.addPermanentWidget(self.stsIdle,  1)
 
+        self.stsSun.setVisible(False)                   #  Shown by updateMinute(), if SUN_COUNTDOWN.
+
         #self.stsBattery.setGeometry(0, 0, 8, 1)
         self.stsBattery.setFixedHeight(14)
         self.stsBattery.setFixedWidth(100)
@@ -257,13 +304,13 @@ class KlockWindow(QMainWindow):
         if not self.isVisible():            #  Only update the time etc if the klock is visible.
             return
 
-        dtCurrent = QDateTime.currentDateTime()
+        dtCurrent = self.clock.nowQDateTime()            #  NTP corrected, if TIME_DISCIPLINED.
         txtTime   = dtCurrent.toString("HH:mm:ss")
         
         self.stsState.setText(f"{utils.getState()}")
         self.stsIdle.setText(utils.getIdleDuration())
 
-        if self.config.INFO_LINE:
+        if self.config.snapshot.INFO_LINE:
             self.updateInfoLine()
 
         currentMin = dtCurrent.time().minute()
@@ -279,15 +326,35 @@ class KlockWindow(QMainWindow):
         self.lcdTime.display(txtTime)       #  Must be Digital text mode by now.
     # ----------------------------------------------------------------------------------------------------------------------- updateTime() ----------
     def updateMinute(self, txtDate, txtTime):
-        """  Update the battery, date and check the events and maybe play a sound every minute.
+        """  Update the battery, date, sun count down and check the events and maybe schedule a sound every minute.
         """
         self.updateBattery()
         self.eventsStore.updateEvents()
         
         self.stsDate.setText(txtDate)
+
+        snapshot = self.config.snapshot
+
+        self.stsSun.setVisible(snapshot.SUN_COUNTDOWN)
+        if snapshot.SUN_COUNTDOWN:
+            self.updateSunCountdown()
                 
-        if self.config.SOUNDS:
-            self.sounds.playSounds(txtTime)
+        if snapshot.SOUNDS:
+            self.sounds.scheduleChimes()
+        else:
+            self.sounds.cancelChimes()
+    # ----------------------------------------------------------------------------------------------------------------------- updateSunCountdown() --
+    def updateSunCountdown(self):
+        """  Count down to the next sunrise or sunset, from the almanac's cached days - no astronomy every tick.
+        """
+        event = self.almanac.nextSunEvent(self.clock.now())
+
+        if event is None:                   #  Polar day or night.
+            self.stsSun.setText("")
+            return
+
+        name, when = event
+        self.stsSun.setText(f"{name} in {alm.formatLength(when - self.clock.now())}")
     # ----------------------------------------------------------------------------------------------------------------------- updateInfoLine() ------
     def updateInfoLine(self):
         """  Updates the info line.
@@ -349,10 +416,11 @@ class KlockWindow(QMainWindow):
         self.timeFormat = self.menu.combo.currentText()
         self.stsFrmt.setText(f"{self.timeFormat}")        
 
-        textTime = f"{self.config.TIME_PREFIX}{self.selectTime.getTime(self.timeFormat)}{self.config.TIME_POSTFIX}"
+        snapshot = self.config.snapshot
+        textTime = f"{snapshot.TIME_PREFIX}{self.selectTime.getTime(self.timeFormat)}{snapshot.TIME_POSTFIX}"
 
-        if self.config.TIME_SPACE != " ":
-            textTime = textTime.replace(" ", self.config.TIME_SPACE)
+        if snapshot.TIME_SPACE != " ":
+            textTime = textTime.replace(" ", snapshot.TIME_SPACE)
 
         self.txtTime.setText(textTime)
         self.txtWidth       = self.txtTime.fontMetrics().boundingRect(self.txtTime.text()).width()
@@ -481,6 +549,13 @@ class KlockWindow(QMainWindow):
         if self.textWindow is None:
             self.textWindow = tw.TextViewer(self, action.text(), self.logger)
             self.textWindow.show()
+    # ----------------------------------------------------------------------------------------------------------------------- openLogFile -----------
+    def openLogFile(self):
+        """  Open a log viewer, it follows the log as it is written.
+        """
+        if self.logWindow is None:
+            self.logWindow = lv.LogViewer(self, self.logger)
+            self.logWindow.show()
     # ----------------------------------------------------------------------------------------------------------------------- openAbout -------------
     def openAbout(self, event):
         """  Open an About window, which display application, system information and run times.
@@ -496,6 +571,116 @@ class KlockWindow(QMainWindow):
         dlg.exec()
 
         self.updateValues()         #  not sure if config has changes - so, update.
+    # ----------------------------------------------------------------------------------------------------------------------- configReloaded() ------
+    def configReloaded(self, changed):
+        """  Apply the settings changed in config.toml on disc, reloaded by the config watcher.
+             Only changes from the file are applied - not pyKlock's own, i.e. saveConfig when closing.
+             The colours and position are applied once, however many of them changed.
+        """
+        names = set(changed) & set(LIVE_SETTINGS)
+
+        if names & {"FOREGROUND", "BACKGROUND"}:
+            self.foregroundColour = self.config.FOREGROUND
+            self.backgroundColour = self.config.BACKGROUND
+            self.updateColour()
+
+        if names & {"X_POS", "Y_POS"}:
+            self.Xpos = self.config.X_POS
+            self.Ypos = self.config.Y_POS
+            self.move(self.Xpos, self.Ypos)
+
+        for name in names - {"FOREGROUND", "BACKGROUND", "X_POS", "Y_POS"}:
+            self.configChanged(name, getattr(self.config, name))
+    # ----------------------------------------------------------------------------------------------------------------------- configChanged() -------
+    def configChanged(self, name, value):
+        """  Apply a single setting changed in config.toml, called by configReloaded.
+        """
+        match name:
+            case "TIME_FONT":
+                if QFont.fromString(self.timeFont, value):
+                    self.txtTime.setFont(self.timeFont)
+                    self.updateTextTime()
+            case "TIME_FORMAT":
+                index = self.menu.combo.findText(value)
+                if index >= 0:
+                    self.menu.combo.setCurrentIndex(index)
+                    self.timeFormat = value
+                if self.timeMode == "Text":
+                    self.updateTextTime()
+            case "TIME_MODE":
+                if value == "Digital":
+                    self.setDigitalTime()
+                else:
+                    self.setTextTime()
+            case "TIME_PREFIX" | "TIME_POSTFIX" | "TIME_SPACE":
+                if self.timeMode == "Text":
+                    self.updateTextTime()
+            case "MENU_BAR":
+                self.menu_bar = value
+                self.myMenu.setVisible(value)
+                self.menu.actToggleMenuBar.setChecked(value)
+            case "TOOL_BAR":
+                self.tool_bar = value
+                self.menu.toolbar.setVisible(value)
+                self.menu.actToggleToolBar.setChecked(value)
+            case "SOUNDS":
+                if value:
+                    self.sounds.scheduleChimes()
+                else:
+                    self.sounds.cancelChimes()
+    # ----------------------------------------------------------------------------------------------------------------------- countDownEnded() ------
+    def countDownEnded(self, countDown):
+        """  Called when a count down ends, carry out its action - the viewer may not be open.
+
+             The shutdown / reboot assumes the default timeout of 30 seconds.
+             One that ended while pyKlock was closed never shuts down the PC, just gives a notification.
+        """
+        volume = 50
+
+        if time.time_ns() - countDown.wall > MISSED_LATE and countDown.action not in ("Notification + Sound", "Notification"):
+            self.countDownMissed(countDown)
+            return
+
+        match countDown.action:
+            case "Notification + Sound":
+                alarmId = self.sounds.playAlarm(volume)
+                self.countDownAlarms.add(alarmId)
+                toast = self.countDownToast(countDown)
+                if toast:
+                    toast.closed.connect(lambda: self.sounds.cancel(alarmId))     #  Dismissing the toast stops the alarm.
+            case "Notification":
+                self.countDownToast(countDown)
+            case "Shutdown PC":
+                os.system("shutdown /s")
+            case "Reboot PC":
+                os.system("shutdown /r")
+            case "Log Out PC":
+                os.system("shutdown /l")
+    # ----------------------------------------------------------------------------------------------------------------------- countDownMissed() -----
+    def countDownMissed(self, countDown):
+        """  Called for a count down or alarm that ended while pyKlock was closed, says when it ended.
+        """
+        ended = QDateTime.fromMSecsSinceEpoch(countDown.wall // 1_000_000).toString("dd/MM/yyyy HH:mm")
+        self.countDownToast(countDown, f"{countDown.text}\nMissed, ended at {ended} while pyKlock was closed.")
+    # ----------------------------------------------------------------------------------------------------------------------- countDownToast() ------
+    def countDownToast(self, countDown, text=None):
+        """  Display a message above the system tray - a toast, returns the toast.
+        """
+        toast = nt.Notifications(self, self.logger, f"{countDown.kind} - {countDown.name}")
+        toast.add(text or countDown.text)
+
+        return toast.flush()
+    # ---------------------------------------------------------------------------------------------------------------------- countDownAlarmFinished()
+    def countDownAlarmFinished(self, id, completed):
+        """  Called by the sound engine when a sound has ended, forgets the alarm if it was a count down's.
+        """
+        self.countDownAlarms.discard(id)
+    # ----------------------------------------------------------------------------------------------------------------------- stopCountDownAlarms() -
+    def stopCountDownAlarms(self):
+        """  Stop any count down alarms still playing, i.e. from Stop Alarm in the count down viewer.
+        """
+        for alarmId in list(self.countDownAlarms):
+            self.sounds.cancel(alarmId)
     # ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
     def closeEvent(self, event):
         """  Ask for confirmation before closing, if required.
@@ -519,13 +704,25 @@ class KlockWindow(QMainWindow):
                                             #  The window needs to have implemented the closeEvent()
     # ----------------------------------------------------------------------------------------------------------------------- endBit() --------------
     def endBit(self):
-        """  Save config file, stop the timer and print Goodbye.
+        """  Save config file, stop the timer, sound engine, NTP poller, holiday, ephemeris and weather services and print Goodbye.
+             The log queue is written out last.
         """
         self.Timer.stop()           #  Stop the time when the frame closes.
         self.Timer = None           #  Hopefully, stop any memory leaks - maybe only need close()
+        self.sounds.close()         #  Stop the sound engine thread.
+        self.ntpPoller.close()      #  Stop the NTP poller thread.
+        self.holidays.close()       #  Save the holiday cache.
+        self.ephemeris.close()      #  Stop the ephemeris processes and save its cache.
+        self.weather.close()        #  Stop the weather thread.
+        self.configWatcher.close()  #  Stop watching config.toml, or saveConfig will trigger it.
+        self.countDowns.close()     #  Stop the count downs.
         self.saveConfig()
+
+        depth, highWater, dropped = Logger.queue_stats(self.logger)
+        self.logger.info(f"  Log queue :: {depth} waiting, most {highWater} of {Logger.QUEUE_SIZE}, {dropped} dropped")
         self.logger.info(f"  Ending {self.config.NAME} Version {self.config.VERSION} ")
         self.logger.info("=" * 100)
+        Logger.stop_logging(self.logger)    #  Write out the log queue.
     # ----------------------------------------------------------------------------------------------------------------------- saveConfig() ----------
     def saveConfig(self):
         """  Save stuff to the config file, in case any has changed.
@@ -542,7 +739,7 @@ class KlockWindow(QMainWindow):
         self.config.TRANSPARENT = self.transparent
         self.config.FOREGROUND  = self.foregroundColour
         self.config.BACKGROUND  = self.backgroundColour
-        self.config.writeConfig()
+        self.config.writeConfig(delay=0)    #  Now, not after WRITE_DELAY - pyKlock is closing.
     # ----------------------------------------------------------------------------------------------------------------------- contextMenuEvent() ----
     def contextMenuEvent(self, event):
         """  ** NEEDED for the context menu to work **
@@ -0,0 +1,207 @@
+###############################################################################################################
+#    tomlUtils.py   Copyright (C) <2026>  <Kevin Scott>                                                       #
+#                                                                                                             #
+#    Reads the configure file with tomllib, through a binary cache, and writes it keeping its comments.       #
+#                                                                                                             #
+#    import src.utils.tomlUtils as tu                                                                         #
+#                                                                                                             #
+#    config = tu.load(fileName, cacheName)   Read a toml file, from the cache if the file has not changed.    #
+#    text   = tu.dumps(config, notes)        A toml file of config, with a comment above each section.        #
+#    text   = tu.update(text, config)        The toml text with changed values written in, comments kept.     #
+#    tu.saveCache(fileName, cacheName, config)   Remember config as the parsed file, after writing it.        #
+#                                                                                                             #
+#    For changes see history.txt                                                                              #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+
+import os
+import re
+import json
+import pickle
+import tomllib
+
+SECTION = re.compile(r"^\s*\[([^\[\]]+)\]\s*(#.*)?$")               #  [SECTION] - not [[array of tables]].
+KEY     = re.compile(r"^(\s*)([A-Za-z0-9_-]+)(\s*=\s*)(.*)$")      #  key = value
+
+
+# ----------------------------------------------------------------------------------------------------------------------- load() ----------------
+def load(fileName, cacheName):
+    """  Returns a toml file as a dictionary, read with tomllib.
+         The parsed file is kept in a pickle cache, used while the file's modified time and size are the same.
+    """
+    stat = os.stat(fileName)
+    key  = [stat.st_mtime_ns, stat.st_size]
+
+    try:
+        with open(cacheName, "rb") as cacheFile:
+            cache = pickle.load(cacheFile)
+        if cache.get("key") == key:
+            return cache["config"]
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        pass                                    #  No cache, or not a good one - read the file.
+
+    with open(fileName, "rb") as tomlFile:
+        config = tomllib.load(tomlFile)
+
+    writeCache(cacheName, key, config)
+
+    return config
+# ----------------------------------------------------------------------------------------------------------------------- saveCache() -----------
+def saveCache(fileName, cacheName, config):
+    """  Remember config as the parsed file, so it is not read again on the next start.
+    """
+    try:
+        stat = os.stat(fileName)
+    except OSError:
+        return
+
+    writeCache(cacheName, [stat.st_mtime_ns, stat.st_size], config)
+# ----------------------------------------------------------------------------------------------------------------------- writeCache() ----------
+def writeCache(cacheName, key, config):
+    """  Write the pickle cache, it does not matter if it can not be written.
+    """
+    try:
+        os.makedirs(os.path.dirname(str(cacheName)) or ".", exist_ok=True)
+        with open(cacheName, "wb") as cacheFile:
+            pickle.dump({"key": key, "config": config}, cacheFile, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+# ----------------------------------------------------------------------------------------------------------------------- dumpValue() -----------
+def dumpValue(value):
+    """  Returns a value as toml - a string, boolean, number or list of them.
+         A JSON string is also a toml basic string.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(dumpValue(item) for item in value)}]"
+
+    return json.dumps(str(value), ensure_ascii=False)
+# ----------------------------------------------------------------------------------------------------------------------- dumpSection() ---------
+def dumpSection(name, table, notes):
+    """  Returns the lines of a section, with its note as a comment above - sub tables follow as [name.key].
+    """
+    lines = []
+    if name in notes:
+        lines.extend(f"#   {note}\n" for note in notes[name].splitlines())
+    lines.append(f"[{name}]\n")
+    lines.extend(f"{key} = {dumpValue(value)}\n" for key, value in table.items() if not isinstance(value, dict))
+    lines.append("\n")
+
+    for key, value in table.items():
+        if isinstance(value, dict):
+            lines.extend(dumpSection(f"{name}.{key}", value, notes))
+
+    return lines
+# ----------------------------------------------------------------------------------------------------------------------- dumps() ---------------
+def dumps(config, notes=None):
+    """  Returns config as toml text, notes is a dictionary - [section, comment] written above each section.
+    """
+    lines = []
+    for name, table in config.items():
+        lines.extend(dumpSection(name, table, notes or {}))
+
+    return "".join(lines)
+# ----------------------------------------------------------------------------------------------------------------------- splitValue() ----------
+def splitValue(text):
+    """  Returns the value of a key = value line and any comment after it, i.e. ['"#00ff00"', '  # green'].
+         Returns None if the value is not complete, i.e. the first line of a list over a few lines.
+    """
+    for index in [i for i, char in enumerate(text) if char == "#"] + [len(text)]:
+        try:
+            tomllib.loads(f"value = {text[:index]}")
+        except tomllib.TOMLDecodeError:
+            continue
+        value = text[:index].rstrip()
+        return value, text[len(value):].rstrip("\n")
+
+    return None
+# ----------------------------------------------------------------------------------------------------------------------- update() --------------
+def update(text, config):
+    """  Returns the toml text with the values in config written in - only the lines of changed values are
+         written, so comments, blank lines and the order are kept.  Keys and sections not in the text are
+         added at the end of their section, or of the text.
+    """
+    lines   = text.splitlines(keepends=True)
+    output  = []
+    written = set()                             #  [section, key] written, and section names seen.
+    table   = None                              #  The dictionary of the current section.
+    name    = None
+    index   = 0
+
+    def addMissing():
+        """  Add the keys of the current section not in the text, before the blank lines and comments at
+             its end - they belong to the next section.
+        """
+        if table is None:
+            return
+        missing = [f"{key} = {dumpValue(value)}\n" for key, value in table.items()
+                   if not isinstance(value, dict) and (name, key) not in written]
+        trailing = []
+        while output and (not output[-1].strip() or output[-1].lstrip().startswith("#")):
+            trailing.insert(0, output.pop())
+        output.extend(missing + trailing)
+
+    while index < len(lines):
+        line  = lines[index]
+        index += 1
+
+        section = SECTION.match(line)
+        if section:
+            addMissing()
+            name  = section.group(1).strip()
+            table = config
+            for part in name.split("."):
+                table = table.get(part.strip(), {}) if isinstance(table, dict) else {}
+            written.add(name)
+            output.append(line)
+            continue
+
+        pair = KEY.match(line)
+        if pair is None or table is None:
+            output.append(line)
+            continue
+
+        indent, key, equals, rest = pair.groups()
+        value = splitValue(rest)
+        block = [line]
+        while value is None and index < len(lines):     #  A list over a few lines.
+            rest += lines[index]
+            block.append(lines[index])
+            index += 1
+            value = splitValue(rest)
+
+        written.add((name, key))
+
+        if key not in table or value is None or tomllib.loads(f"value = {value[0]}")["value"] == table[key]:
+            output.extend(block)                #  Unchanged, or not ours - keep the lines as they are.
+        else:
+            output.append(f"{indent}{key}{equals}{dumpValue(table[key])}{value[1]}\n")
+
+    addMissing()
+
+    #  Whole sections not in the text.
+    if output and not output[-1].endswith("\n"):
+        output.append("\n")
+    for section, values in config.items():
+        if section not in written and isinstance(values, dict):
+            if output and output[-1].strip():
+                output.append("\n")
+            output.extend(dumpSection(section, values, {}))
+
+    return "".join(output)
@@ -1,7 +1,7 @@
 ###############################################################################################################
 #    countDownViewer.py    Copyright (C) <2026>  <Kevin Scott>                                                #
 #                                                                                                             #
-#    A class that displays A count down timer.                                                                #
+#    A class that displays the count down timers and alarms, any number can run at once.                      #
 #                                                                                                             #
 ###############################################################################################################
 #                                                                                                             #
@@ -19,19 +19,24 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
-import os 
+from PyQt6.QtWidgets import (QHBoxLayout, QVBoxLayout, QPushButton, QApplication, QFrame, QMainWindow,
+                             QGroupBox, QLCDNumber, QLabel, QComboBox, QLineEdit, QSpinBox, QTableWidget,
+                             QTableWidgetItem, QHeaderView, QAbstractItemView, QTimeEdit)
+from PyQt6.QtCore    import QTime, QDateTime
 
-from pyqttoast import Toast, ToastPreset
+import src.classes.countDown as cd
 
-from PyQt6.QtWidgets import (QHBoxLayout, QVBoxLayout, QPushButton, QApplication, QFrame, QMainWindow, 
-                             QGroupBox, QLCDNumber, QLabel, QComboBox, QLineEdit, QSpinBox)
-from PyQt6.QtCore    import QTime, Qt
+ACTIONS = ["Notification + Sound", "Notification", "Shutdown PC", "Reboot PC", "Log Out PC"]
 
-import src.classes.sounds as snds
-import src.classes.countDown as cd
 
 class CountDown(QMainWindow):
-    """  A class that displays as digital count down timer.
+    """  A class that displays the count down timers, any number can run at once - i.e. tea, a meeting and parking.
+
+         The count downs are run by the count down service in src/classes/countDown.py, they carry on
+         when this window is closed - and when pyKlock is closed.  pyKlock carries out the action when
+         one ends, If Missed says what to do if it ended while pyKlock was closed.
+
+         An alarm is set for the next time of day given, today or tomorrow.
     """
     def __init__(self, parent, myConfig, myLogger):
         super().__init__()
@@ -40,11 +45,8 @@ class CountDown(QMainWindow):
         self.logger = myLogger
         self.parent = parent
 
-        self.countDown = cd.countdown(self)
-        self.countDown.countDownTick.connect(self.updateTime)                 #  Signal is fired when the count down is running, update display.
-        self.countDown.countDownEnd.connect(self.endEvent)                    #  Signal is fired when the count down has ended.
-
-        self.sounds = snds.Sounds(self.config, self.logger, False)
+        self.countDowns = cd.getCountDownService(self.logger)
+        self.countDowns.countDownTick.connect(self.updateTime)                #  Signal is fired when a displayed second changes, update display.
 
         height     = 400
         width      = 900
@@ -58,7 +60,9 @@ class CountDown(QMainWindow):
         self.setWindowTitle("Count Down Timer")
 
         self.buildGUI()
-        
+        self.countDowns.display = True                                        #  Wake each second while on display.
+        self.updateTime()
+
     def buildGUI(self):
         """  Build the GUI elements.
         """
@@ -69,69 +73,95 @@ class CountDown(QMainWindow):
         timerLayout   = QVBoxLayout()
         buttonLayout  = QHBoxLayout()
         controlLayout = QHBoxLayout()
-        
+
         self.swGroup  = QGroupBox("Count Down Timer")
 
-        #  Create an lcd Number display.
+        #  Create an lcd Number display, shows the count down that ends soonest.
         self.lcdTime = QLCDNumber()
         self.lcdTime.setDigitCount(8)                                 # Display 8 digits
         self.lcdTime.display("00:00:00")                              # Show some initial value
         self.lcdTime.setSegmentStyle(QLCDNumber.SegmentStyle.Filled)  # Use filled segment style
 
+        #  All the running count downs, soonest first.
+        self.tblCountDowns = QTableWidget(0, 4)
+        self.tblCountDowns.setHorizontalHeaderLabels(["Name", "Time Left", "Ends", "Action"])
+        self.tblCountDowns.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tblCountDowns.verticalHeader().setVisible(False)
+        self.tblCountDowns.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.tblCountDowns.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.tblCountDowns.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+
         self.btn15min = QPushButton(text="15", parent=self)
         self.btn15min.setObjectName("15")
         self.btn15min.clicked.connect(self.startTimer)
-        self.btn15min.setEnabled(True)
         self.btn30min = QPushButton(text="30", parent=self)
         self.btn30min.setObjectName("30")
         self.btn30min.clicked.connect(self.startTimer)
-        self.btn30min.setEnabled(True)
         self.btn45min = QPushButton(text="45", parent=self)
         self.btn45min.setObjectName("45")
         self.btn45min.clicked.connect(self.startTimer)
-        self.btn45min.setEnabled(True)
         self.btn60min = QPushButton(text="60", parent=self)
         self.btn60min.setObjectName("60")
         self.btn60min.clicked.connect(self.startTimer)
-        self.btn60min.setEnabled(True)
         self.btnStop = QPushButton(text="Stop", parent=self)
         self.btnStop.clicked.connect(self.stop)
         self.btnStop.setEnabled(False)
         self.btnStart = QPushButton(text="Start", parent=self)
-        self.btnStart.setEnabled(True)
         self.btnStart.clicked.connect(self.start)
+        self.btnAlarm = QPushButton(text="Set Alarm", parent=self)
+        self.btnAlarm.clicked.connect(self.setAlarm)
+        self.btnStopAlarm = QPushButton(text="Stop Alarm", parent=self)
+        self.btnStopAlarm.clicked.connect(self.stopAlarm)
+        self.btnStopAlarm.setEnabled(False)
         self.btnClose = QPushButton(text="Close", parent=self)
         self.btnClose.clicked.connect(self.close)
-        self.btnClose.setEnabled(True)
 
+        self.lblName    = QLabel("Name")
+        self.lneName    = QLineEdit("", self)
         self.lblAction  = QLabel("Action")
         self.cbAction   = QComboBox()
         self.lblText    = QLabel("Text")
         self.lneText    = QLineEdit("Count Down Timer Finished.", self)
         self.lblMinutes = QLabel("Minute Interval")
         self.sbMinutes  = QSpinBox(self)
-        
-        self.cbAction.insertItems(1, ["Notification + Sound", "Notification", "Shutdown PC", "Reboot PC", "Log Out PC"])
+        self.lblAlarm   = QLabel("Alarm at")
+        self.teAlarm    = QTimeEdit(QTime.currentTime().addSecs(3600), self)
+        self.lblMissed  = QLabel("If Missed")
+        self.cbMissed   = QComboBox()
+
+        self.lneName.setPlaceholderText("i.e. Tea")
+        self.cbAction.insertItems(1, ACTIONS)
         self.sbMinutes.setMinimum(1)
         self.sbMinutes.setMaximum(3000)
         self.sbMinutes.setValue(10)
-        
+        self.teAlarm.setDisplayFormat("HH:mm")
+        self.cbMissed.insertItems(1, cd.MISSED)
+
+        controlLayout.addWidget(self.lblName)
+        controlLayout.addWidget(self.lneName)
         controlLayout.addWidget(self.lblAction)
         controlLayout.addWidget(self.cbAction)
         controlLayout.addWidget(self.lblText)
         controlLayout.addWidget(self.lneText)
         controlLayout.addWidget(self.lblMinutes)
         controlLayout.addWidget(self.sbMinutes)
-        
+        controlLayout.addWidget(self.lblAlarm)
+        controlLayout.addWidget(self.teAlarm)
+        controlLayout.addWidget(self.lblMissed)
+        controlLayout.addWidget(self.cbMissed)
+
         buttonLayout.addWidget(self.btn15min)
         buttonLayout.addWidget(self.btn30min)
         buttonLayout.addWidget(self.btn45min)
         buttonLayout.addWidget(self.btn60min)
         buttonLayout.addWidget(self.btnStart)
+        buttonLayout.addWidget(self.btnAlarm)
         buttonLayout.addWidget(self.btnStop)
+        buttonLayout.addWidget(self.btnStopAlarm)
         buttonLayout.addWidget(self.btnClose)
 
-        timerLayout.addWidget(self.lcdTime)
+        timerLayout.addWidget(self.lcdTime, 2)
+        timerLayout.addWidget(self.tblCountDowns, 1)
         timerLayout.addLayout(controlLayout)
         timerLayout.addLayout(buttonLayout)
 
@@ -142,33 +172,54 @@ class CountDown(QMainWindow):
 
     # ----------------------------------------------------------------------------------------------------------------------- updateTime() ----------
     def updateTime(self):
-        """  Update the LCD display with the current count down value.
+        """  Update the LCD display and the table with the running count downs.
 
-             Called using signal/slot from the countDown class every tick [1 second].
+             Called using signal/slot from the count down service, when a displayed second changes.
         """
-        self.lcdTime.display(self.countDown.elapsedTime)
-        time = QTime.currentTime()
-        self.swGroup.setTitle(time.toString(Qt.DateFormat.ISODate))
-    # ----------------------------------------------------------------------------------------------------------------------- startTimer() ----------
+        countDowns = self.countDowns.countDowns
+        selected   = self.selectedName()
+
+        if countDowns:
+            self.lcdTime.display(self.countDowns.elapsedTime(countDowns[0].name))
+            self.swGroup.setTitle(f"Count Down Timer - {countDowns[0].name}")
+        else:
+            self.lcdTime.display("00:00:00")
+            self.swGroup.setTitle("Count Down Timer")
+
+        self.tblCountDowns.setRowCount(len(countDowns))
+        for row, countDown in enumerate(countDowns):
+            ends = QDateTime.fromMSecsSinceEpoch(countDown.wall // 1_000_000).toString("HH:mm:ss")
+            for column, text in enumerate([countDown.name, self.countDowns.elapsedTime(countDown.name), ends, countDown.action]):
+                item = self.tblCountDowns.item(row, column)
+                if item is None:
+                    self.tblCountDowns.setItem(row, column, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+            if countDown.name == selected:
+                self.tblCountDowns.selectRow(row)
+
+        self.btnStop.setEnabled(bool(countDowns))
+        self.btnStopAlarm.setEnabled(bool(self.parent.countDownAlarms))
+    # ----------------------------------------------------------------------------------------------------------------------- selectedName() --------
+    def selectedName(self):
+        """  Returns the name of the count down selected in the table, None if none.
+        """
+        rows = self.tblCountDowns.selectionModel().selectedRows()
+        if not rows:
+            return None
+
+        return self.tblCountDowns.item(rows[0].row(), 0).text()
+    # ----------------------------------------------------------------------------------------------------------------------- start() ---------------
     def start(self, event):
-        """  Start the count down timer with the data from the control line.
+        """  Start a count down with the data from the control line.
         """
-        self.countDown.start(self.sbMinutes.value())
-        self.lcdTime.display(self.countDown.elapsedTime)
-        self.btn15min.setEnabled(False)
-        self.btn30min.setEnabled(False)
-        self.btn45min.setEnabled(False)
-        self.btn60min.setEnabled(False)
-        self.btnStart.setEnabled(False)
-        self.btnStop.setEnabled(True)
+        self.startCountDown(self.sbMinutes.value())
     # ----------------------------------------------------------------------------------------------------------------------- startTimer() ----------
     def startTimer(self, event):
-        """  When a time interval is selected from the speed keys, start the count down timer with that value.
-
-             Switch off the unwanted buttons.
+        """  When a time interval is selected from the speed keys, start a count down with that value.
         """
-        action    = self.sender()
-        name      = action.objectName()
+        action = self.sender()
+        name   = action.objectName()
 
         match name:
             case "15":
@@ -180,71 +231,53 @@ class CountDown(QMainWindow):
             case "60":
                 target = 60
 
-        self.countDown.start(target)
-        self.lcdTime.display(self.countDown.elapsedTime)
-        self.btn15min.setEnabled(False)
-        self.btn30min.setEnabled(False)
-        self.btn45min.setEnabled(False)
-        self.btn60min.setEnabled(False)
-        self.btnStart.setEnabled(False)
-        self.btnStop.setEnabled(True)
-    # ----------------------------------------------------------------------------------------------------------------------- stopTimer() -----------
-    def stop(self, event):
-        """  Called when the stop button is called.
+        self.startCountDown(target)
+    # ----------------------------------------------------------------------------------------------------------------------- startCountDown() ------
+    def startCountDown(self, minutes):
+        """  Start a count down of minutes, named from the control line - a name already running is restarted.
+             With no name given, it is named after the interval.
         """
-        self.resetButtons()
-    # ----------------------------------------------------------------------------------------------------------------------- stopTimer() -----------
-    def endEvent(self):
-        """  Called when the count down ends - when toe time interval is fully elapsed.
+        name = self.lneName.text().strip() or f"{minutes} minutes"
 
-             The shutdown / reboot assumes the default timeout of 30 seconds.
+        self.countDowns.start(name, minutes * 60, self.cbAction.currentText(), self.lneText.text().strip(),
+                              self.cbMissed.currentText())
+        self.lneName.clear()
+    # ----------------------------------------------------------------------------------------------------------------------- setAlarm() ------------
+    def setAlarm(self, event):
+        """  Set an alarm for the time of day from the control line, tomorrow if that time has passed today.
+             With no name given, it is named after the time.
+        """
+        alarmTime = self.teAlarm.time()
+        when      = QDateTime(QDateTime.currentDateTime().date(), alarmTime)
+        if when <= QDateTime.currentDateTime():
+            when = when.addDays(1)
+        name = self.lneName.text().strip() or f"Alarm {alarmTime.toString('HH:mm')}"
 
-             Called using signal/slot from the countDown class when finished.
+        self.countDowns.alarm(name, when.toPyDateTime(), self.cbAction.currentText(), self.lneText.text().strip(),
+                              self.cbMissed.currentText())
+        self.lneName.clear()
+    # ----------------------------------------------------------------------------------------------------------------------- stop() ----------------
+    def stop(self, event):
+        """  Called when the stop button is called, stops the selected count down - or the soonest.
         """
-        self.resetButtons()
-
-        action = self.cbAction.currentText()
-        volume = 50
-
-        match action:
-            case "Notification + Sound":
-                self.displayToast()
-                self.sounds.playAlarm(volume)
-            case "Notification":
-                self.displayToast()
-            case "Shutdown PC":
-                os.system("shutdown /s")
-            case "Reboot PC":
-                os.system("shutdown /r")
-            case "Log Out PC":
-                os.system("shutdown /l")
-
-    # ----------------------------------------------------------------------------------------------------------------------- displayToast() --------
-    def displayToast(self):
-        """  Display a message above the system tray - a toast
+        name = self.selectedName()
+
+        if name is None and self.countDowns.countDowns:
+            name = self.countDowns.countDowns[0].name
+
+        if name is not None:
+            self.countDowns.stop(name)
+    # ----------------------------------------------------------------------------------------------------------------------- stopAlarm() -----------
+    def stopAlarm(self, event):
+        """  Stop the alarm of a count down that has ended, pyKlock plays it - so it plays on if this window is closed.
         """
-        toast = Toast(self.parent)
-        toast.setDuration(0)        #  Do not timeout.
-        toast.applyPreset(ToastPreset.INFORMATION_DARK)
-        toast.setTitle("Count Down Timer")
-        toast.setText(self.lneText.text().strip())
-        toast.show()
+        self.parent.stopCountDownAlarms()
+        self.btnStopAlarm.setEnabled(False)
     # ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
     def closeEvent(self, event):
-        """  Called when the window is closed.
+        """  Called when the window is closed, the count downs carry on.
         """
-        self.countDown.clear()
+        self.countDowns.display = False                 #  Only wake at a deadline.
+        self.countDowns.countDownTick.disconnect(self.updateTime)
         self.parent.show()
         event.accept()
-
-    def resetButtons(self):
-        """  Resets the buttons to their initial state.
-        """
-        self.countDown.clear()
-        self.lcdTime.display("00:00:00")
-
-        self.btn15min.setEnabled(True)
-        self.btn30min.setEnabled(True)
-        self.btn45min.setEnabled(True)
-        self.btn60min.setEnabled(True)
-        self.btnStop.setEnabled(False)
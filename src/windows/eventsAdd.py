@@ -28,8 +28,6 @@ from PyQt6.QtWidgets import (QMainWindow, QGridLayout, QVBoxLayout, QHBoxLayout,
                              QTimeEdit)
 from PyQt6.QtCore    import Qt, pyqtSignal, QDate, QTime
 
-from src.classes.QToggle import QToggle
-
 import src.classes.styles as styles
 
 class AddEvents(QMainWindow):
@@ -39,15 +37,16 @@ class AddEvents(QMainWindow):
     addNewEvent   = pyqtSignal(list)  # <-- This is the sub window's signal
     closeNewEvent = pyqtSignal()      # <-- This is the sub window's signal
 
-    def __init__(self, myLogger, categories, headers, event=None):
+    def __init__(self, myLogger, categories, recurring, headers, event=None):
         super().__init__()
 
         self.logger     = myLogger
         self.styles     = styles.Styles()
         self.categories = categories
+        self.recurring  = recurring
         self.headers    = headers
         self.today      = QDate.currentDate()
-        self.newEvent   = ["", self.today.toString("d MMMM yyyy"), "00:00", "", "", "", "", "False", "False", "false", "False"]
+        self.newEvent   = ["", self.today.toString("d MMMM yyyy"), "00:00", "", "", "", "", "False", "False", "False", "False", ""]
         self.event      = event
         self.height     = 400
         self.width      = 800
@@ -110,12 +109,13 @@ class AddEvents(QMainWindow):
         entryLayout.addWidget(teTimeDue, 1, 3, Qt.AlignmentFlag.AlignCenter)
 
         lblRecurring = QLabel("Recurring")
-        tgRecurring  = QToggle(self)
-        tgRecurring.setChecked(False)
-        tgRecurring.stateChanged.connect(self.addElement)
-        tgRecurring.setObjectName("Recurring")
+        cbRecurring  = QComboBox()
+        cbRecurring.setObjectName("Recurring")
+        cbRecurring.setEditable(True)                           #  So a RRULE can be typed in i.e. FREQ=MONTHLY;BYDAY=1MO
+        cbRecurring.insertItems(0, self.recurring)
+        cbRecurring.currentTextChanged.connect(self.addElement)
         entryLayout.addWidget(lblRecurring, 2, 0, Qt.AlignmentFlag.AlignCenter)
-        entryLayout.addWidget(tgRecurring,  2, 1, Qt.AlignmentFlag.AlignCenter)
+        entryLayout.addWidget(cbRecurring,  2, 1, Qt.AlignmentFlag.AlignCenter)
 
         lblNotes = QLabel("Notes")
         lteNotes = QPlainTextEdit("", self)
@@ -159,9 +159,9 @@ class AddEvents(QMainWindow):
         element = self.findChild(QComboBox, "Category")
         index   = element.findText(self.event[3])
         element.setCurrentIndex(index)
-        element = self.findChild(QToggle, "Recurring")
-        checked = True if self.event[4] == "True" else False
-        element.setChecked(checked)
+        element   = self.findChild(QComboBox, "Recurring")
+        recurring = "Yearly" if self.event[4] in ("True", "False") else self.event[4]     #  Older events used a toggle.
+        element.setCurrentText(recurring)
         element = self.findChild(QPlainTextEdit, "Notes")
         element.setPlainText(self.event[5])
     # ----------------------------------------------------------------------------------------------------------------------- addElement() ----------
@@ -187,8 +187,7 @@ class AddEvents(QMainWindow):
             case "Category":
                 self.newEvent[3] = action.currentText()
             case "Recurring":
-                checked = "True" if action.isChecked() else "False"
-                self.newEvent[4] = checked
+                self.newEvent[4] = action.currentText().strip()
             case "Notes":
                 self.newEvent[5] = action.toPlainText()
     # ----------------------------------------------------------------------------------------------------------------------- addEventValidate() ----
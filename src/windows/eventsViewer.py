@@ -37,6 +37,7 @@ class EventsViewer(QMainWindow):
         self.eventsStore      = eventsStore
         self.events           = self.eventsStore.getEvents()
         self.eventsCategories = self.eventsStore.getCategories
+        self.eventsRecurring  = self.eventsStore.getRecurring
         self.tableHeaders     = self.eventsStore.getHeaders
         self.noHeaders        = len(self.tableHeaders)
         self.eventsAdd        = None
@@ -130,7 +131,7 @@ class EventsViewer(QMainWindow):
         """   Open the Add Events windows.
         """
         if self.eventsAdd is None:
-            self.eventsAdd = ae.AddEvents(self.logger, self.eventsCategories, self.tableHeaders)     #  Needs to be self. - to keep window alive.
+            self.eventsAdd = ae.AddEvents(self.logger, self.eventsCategories, self.eventsRecurring, self.tableHeaders)     #  Needs to be self. - to keep window alive.
             self.eventsAdd.show()
             self.eventsAdd.addNewEvent.connect(self.addNewEvent)                                      #  Signal is fired when a friend is to be added.
             self.eventsAdd.closeNewEvent.connect(self.closeNewEvent)                                  #  Signal is fired when the addFriend window is closed.
@@ -153,9 +154,13 @@ class EventsViewer(QMainWindow):
             return
 
         key    = self.tableView.item(row, 0).text()
+        if self.eventsStore.isReadOnly(key):
+            QMessageBox.information(self, "Error.", "Public holidays can not be edited.")
+            return
+
         event = self.eventsStore.getEvent(key)
 
-        self.eventsAdd = ae.AddEvents(self.logger, self.eventsCategories, self.tableHeaders, event)         #  Needs to be self. - to keep window alive.
+        self.eventsAdd = ae.AddEvents(self.logger, self.eventsCategories, self.eventsRecurring, self.tableHeaders, event)         #  Needs to be self. - to keep window alive.
         self.eventsAdd.show()
         self.eventsAdd.addNewEvent.connect(self.addNewEvent)                                          #  Signal is fired when a friend is to be added.
         self.eventsAdd.closeNewEvent.connect(self.closeNewEvent) 
@@ -172,6 +177,10 @@ class EventsViewer(QMainWindow):
             return
 
         event        = self.tableView.item(row, 0).text()
+        if self.eventsStore.isReadOnly(event):
+            QMessageBox.information(self, "Error.", "Public holidays can not be deleted.")
+            return
+
         confirmation = QMessageBox.question(self, "Confirmation", f"Delete an Event {event}")
 
         if confirmation == QMessageBox.StandardButton.Yes:
@@ -19,15 +19,21 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
-from PyQt6.QtWidgets import QApplication, QPushButton, QVBoxLayout, QWidget
-from PyQt6.QtPdfWidgets import QPdfView
-from PyQt6.QtPdf import QPdfDocument
 
-from src.projectPaths import HELP_PATH
+from PyQt6.QtWidgets import (QApplication, QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QScrollArea, QLabel,
+                             QSpinBox, QLineEdit, QListWidget, QListWidgetItem, QSplitter)
+from PyQt6.QtGui     import QPixmap
+from PyQt6.QtCore    import Qt, QTimer
+
+import src.classes.helpDocument as hd
 
 
 class HelpViewer(QWidget):
     """  A class that displays a help file [in PDF format] in a separate window.
+
+         The help file is loaded once by src/classes/helpDocument.py and kept, so opening help again is
+         straight away.  One page is shown at a time, rendered when first needed - the next page is
+         rendered ahead.  Find searches the text of the help file, pick a result to go to its page.
     """
     def __init__(self, parent):
         super().__init__()
@@ -43,35 +49,142 @@ class HelpViewer(QWidget):
         self.setWindowTitle("pyKlock Help")
 
         self.parent = parent
+        self.page   = 0
+
+        self.helpDocument = hd.getHelpDocument(parent.logger)
+        self.helpDocument.ready.connect(self.helpLoaded)
+        self.helpDocument.pageRendered.connect(self.pageRendered)
 
         self.buildGUI()
-        self.loadHelpFile()
+        QTimer.singleShot(0, self.loadHelpFile)     #  Once the window is shown, so it is sized.
 
     def buildGUI(self):
         """  Build the GUI elements.
         """
-        self.view    = QPdfView(self)
-        self.pdfView = QPdfDocument(self.view)
+        self.btnPrevious = QPushButton(text="Previous", parent=self)
+        self.btnPrevious.clicked.connect(lambda: self.showPage(self.page - 1))
+        self.sbPage = QSpinBox(self)
+        self.sbPage.setMinimum(1)
+        self.sbPage.valueChanged.connect(lambda value: self.showPage(value - 1))
+        self.lblPages = QLabel("of 0")
+        self.btnNext = QPushButton(text="Next", parent=self)
+        self.btnNext.clicked.connect(lambda: self.showPage(self.page + 1))
+
+        self.leFind = QLineEdit()
+        self.leFind.setPlaceholderText("Text to find")
+        self.leFind.returnPressed.connect(self.findText)
+        self.btnFind = QPushButton(text="Find", parent=self)
+        self.btnFind.clicked.connect(self.findText)
+
+        pageLayout = QHBoxLayout()
+        pageLayout.addWidget(self.btnPrevious)
+        pageLayout.addWidget(self.sbPage)
+        pageLayout.addWidget(self.lblPages)
+        pageLayout.addWidget(self.btnNext)
+        pageLayout.addStretch()
+        pageLayout.addWidget(self.leFind)
+        pageLayout.addWidget(self.btnFind)
+
+        self.lblPage = QLabel("Loading ...")
+        self.lblPage.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self.scrollArea = QScrollArea(self)
+        self.scrollArea.setWidget(self.lblPage)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)     #  So the width does not change.
+
+        self.lstFound = QListWidget(self)
+        self.lstFound.itemActivated.connect(self.goToFound)
+        self.lstFound.itemClicked.connect(self.goToFound)
+        self.lstFound.hide()
+
+        splitter = QSplitter(Qt.Orientation.Vertical, self)
+        splitter.addWidget(self.scrollArea)
+        splitter.addWidget(self.lstFound)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
 
         btnClose = QPushButton(text="Close", parent=self)
         btnClose.clicked.connect(self.close)
 
         layout = QVBoxLayout()
-        layout.addWidget(self.view)
+        layout.addLayout(pageLayout)
+        layout.addWidget(splitter)
         layout.addWidget(btnClose)
 
         self.setLayout(layout)
 
     def loadHelpFile(self):
-        """  Load the help file.
+        """  Load the help file in the background, the first time help is opened - then it is already loaded.
+        """
+        if self.helpDocument.isReady:
+            self.helpLoaded()
+        else:
+            self.helpDocument.load()
+
+    def helpLoaded(self):
+        """  The help file has loaded, show the first page.
+        """
+        self.sbPage.setMaximum(max(1, self.helpDocument.pageCount))
+        self.lblPages.setText(f"of {self.helpDocument.pageCount}")
+        self.showPage(self.page)
+
+    def pageWidth(self):
+        """  The width pages are rendered at, the width of the scroll area inside its scroll bar.
         """
-        path = f"{HELP_PATH}/pyKlock.pdf"
-        self.pdfView = QPdfDocument(None)
-        self.pdfView.load(path)
+        return self.scrollArea.viewport().width()
 
-        self.view.setPageMode(QPdfView.PageMode.MultiPage)
-        self.view.setDocument(self.pdfView)
+    def showPage(self, page):
+        """  Show a page, if rendered - else it is shown by pageRendered when it is.  The next page is rendered ahead.
+        """
+        if not self.helpDocument.isReady:
+            return
+
+        self.page = max(0, min(page, self.helpDocument.pageCount - 1))
+        self.sbPage.blockSignals(True)
+        self.sbPage.setValue(self.page + 1)
+        self.sbPage.blockSignals(False)
+        self.btnPrevious.setEnabled(self.page > 0)
+        self.btnNext.setEnabled(self.page < self.helpDocument.pageCount - 1)
+
+        image = self.helpDocument.pageImage(self.page, self.pageWidth())
+        if image is None:
+            self.lblPage.setText("Loading ...")
+            return
+
+        self.lblPage.setPixmap(QPixmap.fromImage(image))
+        self.scrollArea.verticalScrollBar().setValue(0)
+        self.helpDocument.pageImage(self.page + 1, self.pageWidth())
+
+    def pageRendered(self, page):
+        """  A page has been rendered, show it if it is the one wanted.
+        """
+        if page == self.page and self.lblPage.pixmap().isNull():
+            self.showPage(page)
+
+    def findText(self):
+        """  Search the help file, list each match with the text around it.
+        """
+        self.lstFound.clear()
+
+        for page, snippet in self.helpDocument.search(self.leFind.text()):
+            item = QListWidgetItem(f"Page {page + 1} :: {snippet}")
+            item.setData(Qt.ItemDataRole.UserRole, page)
+            self.lstFound.addItem(item)
+
+        if not self.lstFound.count():
+            self.lstFound.addItem("Not found.")
+        self.lstFound.show()
+
+    def goToFound(self, item):
+        """  Go to the page of a search result.
+        """
+        page = item.data(Qt.ItemDataRole.UserRole)
+        if page is not None:
+            self.showPage(page)
 
     def closeEvent(self, event):
+        self.helpDocument.ready.disconnect(self.helpLoaded)
+        self.helpDocument.pageRendered.disconnect(self.pageRendered)
         self.parent.helpWindow = None       #  Set to None in parent, so can open helpViewer again.
         event.accept()
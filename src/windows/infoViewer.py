@@ -23,6 +23,7 @@
 # -*- coding: utf-8 -*-
 
 import src.info.chineseYearInfo as cny
+import src.info.astronomyInfo as ai
 import src.info.publicHolidays as ph
 import src.info.equinoxInfo as ei
 import src.info.weatherInfo as wi
@@ -63,6 +64,11 @@ class infoViewer(QMainWindow):
             case "Season Equinox":
                 self.setWindow(500, 500)
                 ei.buildGUI(self)
+                ei.update(self)
+            case "Sun and Moon":
+                self.setWindow(500, 600)
+                ai.buildGUI(self)
+                ai.update(self)
             case "Current Weather":
                 self.setWindow(500, 500)
                 wi.initWeather(self, self.config, self.logger)          #  Initialise the weather data class
@@ -94,6 +100,7 @@ class infoViewer(QMainWindow):
             self.timerStarted = False
             ntp.close(self)
             wk.close(self)
+        wi.close(self)
         event.accept()
 
 
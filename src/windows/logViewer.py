@@ -0,0 +1,299 @@
+###############################################################################################################
+#    logViewer.py    Copyright (C) <2026>  <Kevin Scott>                                                      #
+#                                                                                                             #
+#    A class that displays the log file in a separate window, following new lines like tail -f.               #
+#                                                                                                             #
+###############################################################################################################
+#                                                                                                             #
+#    This program is free software: you can redistribute it and/or modify it under the terms of the           #
+#    GNU General Public License as published by the Free Software Foundation, either Version 3 of the         #
+#    License, or (at your option) any later Version.                                                          #
+#                                                                                                             #
+#    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without        #
+#    even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the               #
+#    GNU General Public License for more details.                                                             #
+#                                                                                                             #
+#    You should have received a copy of the GNU General Public License along with this program.               #
+#    If not, see <http://www.gnu.org/licenses/>.                                                              #
+#                                                                                                             #
+###############################################################################################################
+# -*- coding: utf-8 -*-
+
+import os
+
+from PyQt6.QtWidgets import (QPushButton, QVBoxLayout, QHBoxLayout, QWidget, QApplication, QAbstractScrollArea,
+                             QComboBox, QCheckBox, QLabel, QLineEdit, QDateTimeEdit)
+from PyQt6.QtGui     import QPainter, QFontDatabase
+from PyQt6.QtCore    import QTimer, QDateTime, QTime
+
+import src.classes.logFile as lf
+import src.classes.logIndex as li
+import src.logger as Logger
+
+from src.projectPaths import LOGGER_PATH
+
+FOLLOW_INTERVAL = 500       #  Milliseconds between looking for new lines.
+
+#  The levels to filter by, each shows that level and above.
+LEVELS = [["All", 0], ["Debug", 10], ["Info", 20], ["Warning", 30], ["Error", 40], ["Critical", 50]]
+
+
+class LogView(QAbstractScrollArea):
+    """  Draws just the lines of a LogFile that can be seen, the scroll bar moves through the file.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.logFile = None
+        self.follow  = True
+        self.widest  = 0                                #  The widest line drawn, for the horizontal scroll bar.
+
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    def setLogFile(self, logFile):
+        """  Show a different log file, from the end.
+        """
+        self.logFile = logFile
+        self.widest  = 0
+        self.updateScrollBars()
+        self.viewport().update()
+
+    def visibleRows(self):
+        """  The number of whole lines that fit in the view.
+        """
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+
+    def updateScrollBars(self):
+        """  Set the scroll bar ranges to the line count, stay at the end if following.
+        """
+        lines  = self.logFile.lineCount if self.logFile else 0
+        rows   = self.visibleRows()
+        vBar   = self.verticalScrollBar()
+        atEnd  = vBar.value() >= vBar.maximum()
+
+        vBar.setRange(0, max(0, lines - rows))
+        vBar.setPageStep(rows)
+        if self.follow and atEnd:
+            vBar.setValue(vBar.maximum())
+
+        hBar = self.horizontalScrollBar()
+        hBar.setRange(0, max(0, self.widest - self.viewport().width()))
+        hBar.setPageStep(self.viewport().width())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.updateScrollBars()
+
+    def paintEvent(self, event):
+        """  Draw the lines that can be seen, only they are read from the file.
+        """
+        if self.logFile is None:
+            return
+
+        painter = QPainter(self.viewport())
+        metrics = self.fontMetrics()
+        spacing = metrics.lineSpacing()
+        xPos    = -self.horizontalScrollBar().value()
+
+        for row, line in enumerate(self.logFile.lines(self.verticalScrollBar().value(), self.visibleRows() + 1)):
+            painter.drawText(xPos + 4, row * spacing + metrics.ascent(), line)
+            self.widest = max(self.widest, metrics.horizontalAdvance(line) + 8)
+
+        painter.end()
+
+        hBar = self.horizontalScrollBar()
+        if hBar.maximum() < self.widest - self.viewport().width():
+            hBar.setRange(0, self.widest - self.viewport().width())
+
+
+class LogViewer(QWidget):
+    """  A class that displays the log file in a separate window, following new lines like tail -f.
+
+         The log is read through a memory map by src/classes/logFile.py, only the lines that can be seen
+         are read.  The rotated backups of the last week can be chosen from the drop down.
+
+         Filter searches the log and all its backups by level, time and text, using the index
+         built in the background by src/classes/logIndex.py.  Clear goes back to the chosen log.
+
+         If the JSON lines log is kept [LOGGING json], it and its backups can be chosen too - a
+         filter then searches the JSON logs, they hold the same lines as the text logs.
+    """
+    def __init__(self, parent, logger):
+        super().__init__()
+
+        height     = 800
+        width      = 800
+        screenSize = QApplication.primaryScreen().availableGeometry()
+        xPos       = int((screenSize.width() / 2)  - (width / 2))
+        yPos       = int((screenSize.height() / 2) - (height / 2))
+
+        self.setGeometry(xPos, yPos, width, height)
+        self.setWindowTitle("pyKlock Log File")
+
+        self.parent   = parent
+        self.logger   = logger
+        self.logFile  = None
+        self.jsonName = Logger.json_log_name(LOGGER_PATH) if parent.config.LOG_JSON else None
+
+        self.followTimer = QTimer(self)
+        self.followTimer.timeout.connect(self.followLog)
+
+        self.logIndexes = {}                                #  [log file name, LogIndex], the text log and the JSON log.
+        for fileName in filter(None, [str(LOGGER_PATH), self.jsonName]):
+            logIndex = self.logIndexes[fileName] = li.LogIndex(fileName, logger)
+            logIndex.found.connect(self.showFound)
+            logIndex.start()
+
+        self.buildGUI()
+        self.loadLog()
+
+    def buildGUI(self):
+        """  Build the GUI elements.
+        """
+        self.logView = LogView(self)
+
+        self.cbFile = QComboBox()
+        self.cbFile.addItem("Current", str(LOGGER_PATH))
+        for backup in lf.backups(LOGGER_PATH):
+            self.cbFile.addItem(os.path.basename(backup).rsplit(".", 1)[-1], backup)
+        if self.jsonName:
+            self.cbFile.addItem("JSON", self.jsonName)
+            for backup in lf.backups(self.jsonName):
+                self.cbFile.addItem(f"JSON {os.path.basename(backup).rsplit('.', 1)[-1]}", backup)
+        self.cbFile.currentIndexChanged.connect(self.loadLog)
+
+        self.chkFollow = QCheckBox("Follow")
+        self.chkFollow.setChecked(True)
+        self.chkFollow.toggled.connect(self.setFollow)
+
+        self.txtLines = QLabel("")
+
+        fileLayout = QHBoxLayout()
+        fileLayout.addWidget(QLabel("Log"))
+        fileLayout.addWidget(self.cbFile)
+        fileLayout.addWidget(self.chkFollow)
+        fileLayout.addStretch()
+        fileLayout.addWidget(self.txtLines)
+
+        self.cbLevel = QComboBox()
+        for name, level in LEVELS:
+            self.cbLevel.addItem(name, level)
+
+        today       = QDateTime.currentDateTime()
+        self.dtFrom = QDateTimeEdit(QDateTime(today.date().addDays(-7), QTime(0, 0)))
+        self.dtTo   = QDateTimeEdit(QDateTime(today.date(), QTime(23, 59, 59)))
+        for dtEdit in (self.dtFrom, self.dtTo):
+            dtEdit.setCalendarPopup(True)
+            dtEdit.setDisplayFormat("dd/MM/yyyy HH:mm")
+
+        self.leText = QLineEdit()
+        self.leText.setPlaceholderText("Text to find")
+        self.leText.returnPressed.connect(self.filterLog)
+
+        self.btnFilter = QPushButton(text="Filter", parent=self)
+        self.btnFilter.clicked.connect(self.filterLog)
+        self.btnClear = QPushButton(text="Clear", parent=self)
+        self.btnClear.clicked.connect(self.loadLog)
+        self.btnClear.setEnabled(False)
+
+        filterLayout = QHBoxLayout()
+        filterLayout.addWidget(self.cbLevel)
+        filterLayout.addWidget(self.dtFrom)
+        filterLayout.addWidget(QLabel("to"))
+        filterLayout.addWidget(self.dtTo)
+        filterLayout.addWidget(self.leText)
+        filterLayout.addWidget(self.btnFilter)
+        filterLayout.addWidget(self.btnClear)
+
+        btnClose = QPushButton(text="Close", parent=self)
+        btnClose.clicked.connect(self.close)
+
+        layout = QVBoxLayout()
+        layout.addLayout(fileLayout)
+        layout.addLayout(filterLayout)
+        layout.addWidget(self.logView)
+        layout.addWidget(btnClose)
+
+        self.setLayout(layout)
+
+    def loadLog(self):
+        """  Load the chosen log, the current log is followed - a backup does not change.
+        """
+        self.logFile = lf.LogFile(self.cbFile.currentData())
+        self.cbFile.setEnabled(True)
+        self.btnClear.setEnabled(False)
+        self.chkFollow.setEnabled(self.isCurrent())
+        self.logView.follow = self.chkFollow.isChecked()
+        self.logView.setLogFile(self.logFile)
+
+        self.followTimer.start(0)                   #  Index the log as quickly as possible, then slow down.
+
+    def setFollow(self, checked):
+        """  Follow new lines, jump to the end.
+        """
+        self.logView.follow = checked
+        if checked:
+            self.logView.verticalScrollBar().setValue(self.logView.verticalScrollBar().maximum())
+
+    def followLog(self):
+        """  Index any new lines in the log, redraw if they can be seen.
+             Once indexed, a backup is left alone and the current log is looked at every FOLLOW_INTERVAL.
+        """
+        if self.logFile.refresh():
+            self.logView.updateScrollBars()
+            self.logView.viewport().update()
+
+        self.txtLines.setText(f"{self.logFile.lineCount:,} lines" + ("" if self.logFile.indexed else " ..."))
+
+        if self.logFile.indexed:
+            if self.isCurrent():
+                self.followTimer.start(FOLLOW_INTERVAL)
+            else:
+                self.followTimer.stop()
+
+    def isCurrent(self):
+        """  Returns True if the log chosen is being written, the text or JSON log - not a backup.
+        """
+        return self.cbFile.currentData() in self.logIndexes
+
+    def chosenIndex(self):
+        """  Returns the LogIndex of the logs chosen, the JSON log if a JSON log or backup is chosen.
+        """
+        if self.jsonName and self.cbFile.currentData().startswith(self.jsonName):
+            return self.logIndexes[self.jsonName]
+
+        return self.logIndexes[str(LOGGER_PATH)]
+
+    def filterLog(self):
+        """  Search the chosen log and its backups in the background, showFound is called with the lines found.
+        """
+        self.followTimer.stop()
+        self.btnFilter.setEnabled(False)
+        self.txtLines.setText("Searching ...")
+
+        self.chosenIndex().search(self.cbLevel.currentData(), li.timeKey(self.dtFrom.dateTime()),
+                             li.timeKey(self.dtTo.dateTime()), self.leText.text())
+
+    def showFound(self, filteredLog):
+        """  Show the lines found by a search, they are not followed.
+        """
+        self.logFile = filteredLog
+        self.cbFile.setEnabled(False)
+        self.chkFollow.setEnabled(False)
+        self.btnFilter.setEnabled(True)
+        self.btnClear.setEnabled(True)
+
+        self.logView.follow = False
+        self.logView.setLogFile(filteredLog)
+        self.logView.verticalScrollBar().setValue(0)
+        self.txtLines.setText(f"{filteredLog.lineCount:,} lines found in {len(filteredLog.parts)} logs")
+
+    def closeEvent(self, event):
+        self.followTimer.stop()
+        for logIndex in self.logIndexes.values():
+            logIndex.found.disconnect(self.showFound)   #  A search still going must not call back a closed window.
+            logIndex.close()
+        self.parent.logWindow = None        #  Set to None in parent, so can open LogViewer again.
+        event.accept()
@@ -50,6 +50,8 @@ class Settings(QDialog):
         self.logger = myLogger
         self.styles = styles.Styles()             #  Styles for QToggle.
         self.sounds = snds.Sounds(self.config, self.logger)
+        self.testId = None                          #  The id of the test sound, while playing.
+        self.sounds.finished.connect(self.testFinished)
 
         height     = 400
         width      = 460
@@ -193,7 +195,13 @@ class Settings(QDialog):
         layout.addRow("Foreground Colour ", self.btnForeColour)
         layout.addRow("Background Colour ", self.btnBackColour)
         layout.addRow("Transparent Background ", leTransparent)
+        self.tgSunCountdown = QToggle(self)
+        self.tgSunCountdown.setChecked(self.config.SUN_COUNTDOWN)
+        self.tgSunCountdown.stateChanged.connect(self.displaySettingsUpdate)
+        self.tgSunCountdown.setObjectName("SUN_COUNTDOWN")
+
         layout.addRow("Information Line ", self.tgInfoLine)
+        layout.addRow("Sunrise / Sunset Count Down ", self.tgSunCountdown)
 
         self.twTab.addTab(page, "Display")
 
@@ -219,6 +227,8 @@ class Settings(QDialog):
                 checked = not checked
                 self.tgInfoLine.setChecked(checked)
                 self.newSettings[name] = checked
+            case "SUN_COUNTDOWN":                                       #  toggle
+                self.newSettings[name] = True if checked == 2 else False
     # ----------------------------------------------------------------------------------------------------------------------- Time() ----------------
     def Time(self):
         page = QWidget(self.twTab)
@@ -253,6 +263,13 @@ class Settings(QDialog):
         layout.addRow("Time Font ",        self.btnFont)
         layout.addRow("Time Alignment ",  self.cbTimeAlign)
 
+        self.tgDisciplined = QToggle(self)
+        self.tgDisciplined.setChecked(self.config.TIME_DISCIPLINED)
+        self.tgDisciplined.stateChanged.connect(self.timeSettingsUpdate)
+        self.tgDisciplined.setObjectName("TIME_DISCIPLINED")
+
+        layout.addRow("NTP Corrected Time ", self.tgDisciplined)
+
         titles   = ["Prefix Character ", "Postfix Character ", "Space Character "]
         settings = ["TIME_PREFIX", "TIME_POSTFIX", "TIME_SPACE"]
 
@@ -280,7 +297,7 @@ class Settings(QDialog):
 
         combo.setCurrentIndex(index)
 
-    def timeSettingsUpdate(self):
+    def timeSettingsUpdate(self, checked=None):
         """  When a line edit or combo boxes are changed and looses focus, add amended value to new Settings dictionary.
         """
         action = self.sender()
@@ -291,6 +308,8 @@ class Settings(QDialog):
                 self.newSettings[name] = action.currentText()
             case "TIME_PREFIX" | "TIME_POSTFIX" | "TIME_SPACE":         #  line edits
                 self.newSettings[name] = action.text()
+            case "TIME_DISCIPLINED":                                    #  toggle
+                self.newSettings[name] = True if checked == 2 else False
             case "TIME_FONT":
                 font, ok = QFontDialog.getFont(self.timeFont, self, "Choose Font for Time Text.")
 
@@ -398,7 +417,7 @@ class Settings(QDialog):
         self.sldVolume.valueChanged.connect(self.displaySoundUpdate)
         self.sldVolume.setObjectName("SOUNDS_VOLUME")
 
-        self.btnVolume = QPushButton()
+        self.btnVolume = QPushButton("Play")
         self.btnVolume.setObjectName("TEST_VOLUME")
         self.btnVolume.clicked.connect(self.displaySoundUpdate)
 
@@ -425,8 +444,26 @@ class Settings(QDialog):
 
     def testVolume(self):
         """  Plays the Pips at the slider volume to test loudness.
+             The pips play in the background, pressing the button again while playing stops them.
+        """
+        if self.sounds is None:
+            return
+
+        if self.testId:
+            self.sounds.cancel(self.testId)
+            return
+
+        self.testId = self.sounds.playPips(self.sldVolume.value())
+        self.btnVolume.setText("Stop")
+
+    def testFinished(self, id, completed):
+        """  Called by the sound engine when a sound has ended, resets the test button if it was ours.
         """
-        self.sounds.playPips(self.sldVolume.value())
+        if id != self.testId:
+            return
+
+        self.testId = None
+        self.btnVolume.setText("Play")
     # ----------------------------------------------------------------------------------------------------------------------- buttonClicked() -------
     def buttonClicked(self, button):
         """   Handles the pressed buttons, either Ok or Cancel.
@@ -460,9 +497,26 @@ class Settings(QDialog):
 
         self.newSettings = {}                           #  Clear new settings dict
         self.config.writeConfig()                       #  Save new settings.
+    # ----------------------------------------------------------------------------------------------------------------------- stopTest() ------------
+    def stopTest(self):
+        """  Stop the test sound if still playing, and stop listening for it - only done once.
+        """
+        if self.sounds is None:
+            return
+
+        self.sounds.cancel(self.testId)
+        self.sounds.finished.disconnect(self.testFinished)
+        self.sounds = None
+    # ----------------------------------------------------------------------------------------------------------------------- done() ----------------
+    def done(self, result):
+        """  Called however the dialog ends, including Esc - which does not call closeEvent.
+        """
+        self.stopTest()
+        super().done(result)
     # ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
     def closeEvent(self, event):
         self.logger.info("Settings Close Event")
+        self.stopTest()
         event.accept()
 
 
@@ -19,21 +19,29 @@
 ###############################################################################################################
 # -*- coding: utf-8 -*-
 
+
 import src.classes.stopWatch as sw
 
-from PyQt6.QtWidgets import (QHBoxLayout, QVBoxLayout, QPushButton, QApplication, QFrame, QMainWindow, 
-                             QGroupBox, QLCDNumber)
+from PyQt6.QtWidgets import (QHBoxLayout, QVBoxLayout, QPushButton, QApplication, QFrame, QMainWindow,
+                             QGroupBox, QLCDNumber, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog,
+                             QMessageBox)
 from PyQt6.QtCore    import QTimer, QTime, Qt
 
+REFRESH_RATE = 60                       #  Used if the screen does not say how often it refreshes.
+
 
 class StopWatch(QMainWindow):
     """  A class that displays as digital stop watch.
+
+         The display is only redrawn while the stop watch is running, as often as the screen refreshes -
+         there is no timer at all while stopped or paused.  The laps can be saved as a CSV file.
     """
     def __init__(self, parent):
         super().__init__()
 
         self.stopWatch = sw.timer()
         self.parent    = parent
+        self.shown     = ""                     #  The time on the display, only redrawn if it changes.
 
         height     = 400
         width      = 900
@@ -47,7 +55,7 @@ class StopWatch(QMainWindow):
         self.setWindowTitle("Stop Watch")
 
         self.buildGUI()
-        
+
     def buildGUI(self):
         """  Build the GUI elements.
         """
@@ -62,12 +70,15 @@ class StopWatch(QMainWindow):
         #  Create an lcd Number display.
         self.lcdTime = QLCDNumber()
         self.lcdTime.setDigitCount(11)                                # Display 8 digits
-        self.lcdTime.display("00:00:00.00")                           # Show some initial value
         self.lcdTime.setSegmentStyle(QLCDNumber.SegmentStyle.Filled)  # Use filled segment style
+        self.showTime()                                               # Show some initial value
 
         self.btnStart = QPushButton(text="Start", parent=self)
         self.btnStart.clicked.connect(self.startTimer)
         self.btnStart.setEnabled(True)
+        self.btnLap = QPushButton(text="Lap", parent=self)
+        self.btnLap.clicked.connect(self.lapTimer)
+        self.btnLap.setEnabled(False)
         self.btnPause = QPushButton(text="Pause", parent=self)
         self.btnPause.clicked.connect(self.pauseTimer)
         self.btnPause.setEnabled(False)
@@ -80,17 +91,30 @@ class StopWatch(QMainWindow):
         self.btnClear = QPushButton(text="Clear", parent=self)
         self.btnClear.clicked.connect(self.clearTimer)
         self.btnClear.setEnabled(False)
+        self.btnExport = QPushButton(text="Export", parent=self)
+        self.btnExport.clicked.connect(self.exportLaps)
+        self.btnExport.setEnabled(False)
         self.btnClose = QPushButton(text="Close", parent=self)
         self.btnClose.clicked.connect(self.close)
 
         ButtonLayout.addWidget(self.btnStart)
+        ButtonLayout.addWidget(self.btnLap)
         ButtonLayout.addWidget(self.btnPause)
         ButtonLayout.addWidget(self.btnResume)
         ButtonLayout.addWidget(self.btnStop)
         ButtonLayout.addWidget(self.btnClear)
+        ButtonLayout.addWidget(self.btnExport)
         ButtonLayout.addWidget(self.btnClose)
 
-        timerLayout.addWidget(self.lcdTime)
+        #  The laps, newest at the top.
+        self.tblLaps = QTableWidget(0, 3)
+        self.tblLaps.setHorizontalHeaderLabels(["Lap", "Lap Time", "Split"])
+        self.tblLaps.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.tblLaps.verticalHeader().setVisible(False)
+        self.tblLaps.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        timerLayout.addWidget(self.lcdTime, 2)
+        timerLayout.addWidget(self.tblLaps, 1)
         timerLayout.addLayout(ButtonLayout)
 
         self.swGroup.setLayout(timerLayout)
@@ -98,37 +122,66 @@ class StopWatch(QMainWindow):
         centralLayout.addWidget(self.swGroup)
         centralWidget.setLayout(centralLayout)
 
-        #  Set up short timer to update the clock every second
-        self.Timer = QTimer(self)
-        self.Timer.timeout.connect(self.updateTime)
-        self.Timer.start(10)
+        #  Set up a timer to redraw the display each time the screen refreshes, only runs while the stop watch runs.
+        refreshRate = QApplication.primaryScreen().refreshRate() or REFRESH_RATE
+        self.Timer  = QTimer(self)
+        self.Timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.Timer.setInterval(max(1, int(1000 / refreshRate)))
+        self.Timer.timeout.connect(self.showTime)
 
-    # ----------------------------------------------------------------------------------------------------------------------- updateTime() ----------
-    def updateTime(self):
-        self.lcdTime.display(self.stopWatch.elapsedTime)
-        time = QTime.currentTime()
-        self.swGroup.setTitle(time.toString(Qt.DateFormat.ISODate))
+    # ----------------------------------------------------------------------------------------------------------------------- showTime() ------------
+    def showTime(self):
+        """  Show the time on the display, only if it has changed.
+        """
+        elapsed = self.stopWatch.elapsedTime
+        if elapsed != self.shown:
+            self.shown = elapsed
+            self.lcdTime.display(elapsed)
     # ----------------------------------------------------------------------------------------------------------------------- startTimer() ----------
     def startTimer(self, event):
         self.stopWatch.start()
+        self.tblLaps.setRowCount(0)
+        self.swGroup.setTitle(f"Stop Watch - started at {QTime.currentTime().toString(Qt.DateFormat.ISODate)}")
+        self.Timer.start()
         self.btnStart.setEnabled(False)
+        self.btnLap.setEnabled(True)
         self.btnPause.setEnabled(True)
         self.btnStop.setEnabled(True)
+        self.btnClear.setEnabled(False)
+        self.btnExport.setEnabled(False)
+    # ----------------------------------------------------------------------------------------------------------------------- lapTimer() ------------
+    def lapTimer(self, event):
+        lap = self.stopWatch.lap()
+        self.tblLaps.insertRow(0)
+        for column, text in enumerate([str(lap.number), sw.formatNs(lap.lapNs), sw.formatNs(lap.splitNs)]):
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.tblLaps.setItem(0, column, item)
+        self.btnExport.setEnabled(True)
     # ----------------------------------------------------------------------------------------------------------------------- pauseTimer() ----------
     def pauseTimer(self, event):
         self.stopWatch.pause()
+        self.Timer.stop()
+        self.showTime()
+        self.btnLap.setEnabled(False)
         self.btnPause.setEnabled(False)
         self.btnResume.setEnabled(True)
         self.btnClear.setEnabled(True)
     # ----------------------------------------------------------------------------------------------------------------------- resumeTimer() ---------
     def resumeTimer(self, event):
         self.stopWatch.resume()
+        self.Timer.start()
+        self.btnLap.setEnabled(True)
         self.btnPause.setEnabled(True)
         self.btnResume.setEnabled(False)
+        self.btnClear.setEnabled(False)
     # ----------------------------------------------------------------------------------------------------------------------- stopTimer() -----------
     def stopTimer(self, event):
         self.stopWatch.stop()
+        self.Timer.stop()
+        self.showTime()
         self.btnStart.setEnabled(True)
+        self.btnLap.setEnabled(False)
         self.btnPause.setEnabled(False)
         self.btnResume.setEnabled(False)
         self.btnClear.setEnabled(True)
@@ -136,15 +189,31 @@ class StopWatch(QMainWindow):
     # ----------------------------------------------------------------------------------------------------------------------- clearTimer() ----------
     def clearTimer(self, event):
         self.stopWatch.clear()
+        self.Timer.stop()
+        self.showTime()
+        self.tblLaps.setRowCount(0)
+        self.swGroup.setTitle("Stop Watch")
+        self.btnLap.setEnabled(False)
         self.btnPause.setEnabled(False)
-        self.btnStop.setEnabled(False)
+        self.btnResume.setEnabled(False)
         self.btnStart.setEnabled(True)
         self.btnStop.setEnabled(False)
+        self.btnClear.setEnabled(False)
+        self.btnExport.setEnabled(False)
+    # ----------------------------------------------------------------------------------------------------------------------- exportLaps() ----------
+    def exportLaps(self, event):
+        """  Save the laps as a CSV file.
+        """
+        fileName, _filter = QFileDialog.getSaveFileName(self, "Export Laps", "laps.csv", "CSV Files (*.csv)")
+        if not fileName:
+            return
+
+        try:
+            self.stopWatch.exportCSV(fileName)
+        except OSError as error:
+            QMessageBox.warning(self, "Export Laps", f"Cannot write {fileName} :: {error}")
     # ----------------------------------------------------------------------------------------------------------------------- closeEvent() ----------
     def closeEvent(self, event):
         self.Timer.stop()
         self.parent.show()
         event.accept()
-
- 
-
@@ -21,7 +21,7 @@
 
 from PyQt6.QtWidgets import QPushButton, QVBoxLayout, QWidget, QPlainTextEdit, QApplication
 
-from src.projectPaths import MAIN_PATH, LOGGER_PATH
+from src.projectPaths import MAIN_PATH
 
 
 class TextViewer(QWidget):
@@ -61,15 +61,12 @@ class TextViewer(QWidget):
 
     def loadText(self):
         """  Load the text file.
-             The text file can be either Licence or Log File.
+             The text file is the Licence, the log file has its own viewer - see logViewer.py.
         """
         match self.action:
             case "Licence":
                 self.setWindowTitle("pyKlock Licence")
                 self.textFile = f"{MAIN_PATH}/LICENCE.txt"
-            case "Log File":
-                self.setWindowTitle("pyKlock Log File")
-                self.textFile = f"{LOGGER_PATH}"
             case "_":
                 self.logger.error(" ERROR - Unknown text file type.")
 